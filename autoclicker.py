@@ -5,8 +5,11 @@ MVC Architecture: GUI ← GUIManager ← Model ← Logic
 
 """
 
+import os
+
 from autoclicker.gui.gui_manager import GUIManager
 from autoclicker.model import ApplicationModel
+from autoclicker.utils.constants import METRICS_PORT_ENV
 
 def main():
     """
@@ -18,14 +21,18 @@ def main():
     model = ApplicationModel()
     print("[OK] ApplicationModel initialized")
 
+    # === Optional metrics endpoint (unattended machines) ===
+    port = os.environ.get(METRICS_PORT_ENV, "").strip()
+    if port and port != "0":
+        if port.isdigit() and int(port) < 65536:
+            model.start_metrics_server(int(port))
+        else:
+            print(f"[ERROR] {METRICS_PORT_ENV} must be a port number, got '{port}'")
+
     # === Initialize GUI Manager ===
     gui = GUIManager(model)
     print("[OK] GUIManager initialized")
 
-    # === Start stats updater ===
-    model.start_stats_updater()
-    print("[OK] Stats updater started")
-
     # === Start Application ===
     print("[OK] Starting Application...")
     gui.run()
@@ -1,3 +1,16 @@
-from .gui.gui_manager import GUIManager
+# autoclicker/__init__.py
+"""ClickMAX package (GUIManager is imported on first use, so headless tools need no display)"""
+
+import importlib
+
+_LAZY_EXPORTS = {"GUIManager": ".gui.gui_manager"}
 
 __all__ = ["GUIManager"]
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -54,6 +54,21 @@ MACRO_NO_EVENTS = "MACRO_NO_EVENTS"
 MACRO_INVALID_NAME = "MACRO_INVALID_NAME"
 MACRO_NOT_FOUND = "MACRO_NOT_FOUND"
 MACRO_LIBS_UNAVAILABLE = "MACRO_LIBS_UNAVAILABLE"
+MACRO_SIMPLIFIED = "MACRO_SIMPLIFIED"
+MACRO_SIMPLIFY_ERROR = "MACRO_SIMPLIFY_ERROR"
+MACRO_LOOP_COMPLETED = "MACRO_LOOP_COMPLETED"
+MACRO_ALREADY_PLAYING = "MACRO_ALREADY_PLAYING"
+MACRO_PLAYBACK_STOPPED = "MACRO_PLAYBACK_STOPPED"
+MACRO_SCHEDULED = "MACRO_SCHEDULED"
+MACRO_SCHEDULE_CANCELLED = "MACRO_SCHEDULE_CANCELLED"
+MACRO_SCHEDULE_ERROR = "MACRO_SCHEDULE_ERROR"
+MACRO_PROGRESS = "MACRO_PROGRESS"
+MACRO_PAUSED = "MACRO_PAUSED"
+MACRO_RESUMED = "MACRO_RESUMED"
+MACRO_EDITED = "MACRO_EDITED"
+MACRO_EDIT_ERROR = "MACRO_EDIT_ERROR"
+MACRO_SIMULATED = "MACRO_SIMULATED"
+MACRO_SIMULATE_ERROR = "MACRO_SIMULATE_ERROR"
 
 
 # ============================================
@@ -94,6 +109,11 @@ HOTKEY_NO_CALLBACK = "HOTKEY_NO_CALLBACK"
 STATS_EXPORTED = "STATS_EXPORTED"
 STATS_EXPORT_ERROR = "STATS_EXPORT_ERROR"
 STATS_RESET = "STATS_RESET"
+HEATMAP_EXPORTED = "HEATMAP_EXPORTED"
+HEATMAP_EXPORT_ERROR = "HEATMAP_EXPORT_ERROR"
+CLICK_LOG_STARTED = "CLICK_LOG_STARTED"
+CLICK_LOG_STOPPED = "CLICK_LOG_STOPPED"
+CLICK_LOG_ERROR = "CLICK_LOG_ERROR"
 
 
 # ============================================
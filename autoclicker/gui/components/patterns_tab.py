@@ -5,9 +5,9 @@ Patterns & Macros Tab - UI for click patterns and macro recording
 """
 
 import ttkbootstrap as ttkb
-from ttkbootstrap.widgets import (Frame, Label, Button, Radiobutton, Scale, Checkbutton)
+from ttkbootstrap.widgets import (Frame, Label, Button, Radiobutton, Scale, Checkbutton, Spinbox, Progressbar, Combobox, Entry)
 from ttkbootstrap.scrolled import ScrolledFrame
-from tkinter import StringVar, IntVar, BooleanVar
+from tkinter import StringVar, IntVar, BooleanVar, DoubleVar, Canvas
 from typing import Callable
 
 from .base_tab import BaseTab
@@ -24,36 +24,80 @@ class PatternsTab(BaseTab):
         on_record_macro: Callable[[], None],
         on_stop_macro: Callable[[], None],
         on_play_macro: Callable[[], None],
+        on_pause_macro: Callable[[], None],
+        on_edit_macro: Callable[[], None],
+        on_dry_run_macro: Callable[[], None],
+        on_show_timeline: Callable[[], None],
+        on_schedule_macro: Callable[[], None],
+        on_cancel_schedule: Callable[[], None],
     ):
         """Initialize PatternsTab with pattern selection and macro controls"""
         self.on_record_macro = on_record_macro
         self.on_stop_macro = on_stop_macro
         self.on_play_macro = on_play_macro
+        self.on_pause_macro = on_pause_macro
+        self.on_edit_macro = on_edit_macro
+        self.on_dry_run_macro = on_dry_run_macro
+        self.on_show_timeline = on_show_timeline
+        self.on_schedule_macro = on_schedule_macro
+        self.on_cancel_schedule = on_cancel_schedule
 
         # === UI Variables ===
         self.pattern_var = StringVar(value="none")
         self.pattern_size_var = IntVar(value=100)
         self.click_while_pattern_var = BooleanVar(value=False)
         self.interrupt_on_move_var = BooleanVar(value=False)
+        self.macro_speed_var = DoubleVar(value=1.0)
+        self.macro_loops_var = IntVar(value=1)
+        self.macro_gap_var = DoubleVar(value=0.0)
+        self.macro_max_idle_var = DoubleVar(value=0.0)
+        self.macro_idle_scale_var = DoubleVar(value=0.0)
+        self.macro_stream_var = BooleanVar(value=False)
+        self.macro_source_var = StringVar(value="")
+        self.schedule_at_var = StringVar(value="")
+        self.schedule_every_var = DoubleVar(value=0.0)
+        self.schedule_list_var = StringVar(value="")
+        self.macro_progress_var = DoubleVar(value=0.0)
+        self.edit_operation_var = StringVar(value="trim")
+        self.edit_source_var = StringVar(value="")
+        self.edit_second_var = StringVar(value="")
+        self.edit_from_var = StringVar(value="0")
+        self.edit_to_var = StringVar(value="0")
+        self.edit_value_var = StringVar(value="1")
+        self.edit_name_var = StringVar(value="")
+        self.timeline_macro_var = StringVar(value="")
+        self.timeline_range_var = StringVar(value="")
 
         # === Dynamic UI State Variables (only for elements that change during runtime) ===
         self.pattern_size_label_var = StringVar(value=f"100 {manager.t('pattern_size_px')}")
         self.macro_status_var = StringVar(value=manager.t('no_macro_recorded'))
+        self.macro_speed_label_var = StringVar(value="1.00×")
 
         self.size_label = None
         self.macro_status = None
         self.record_button = None
         self.stop_button = None
         self.play_button = None
+        self.pause_button = None
+        self.dry_run_button = None
 
         # Store pattern radio buttons and description labels for translation updates
         self.pattern_radios = []  # List of (radio_button, pattern_key, desc_label)
         self.behavior_radios = []  # List of (radio_button, mode_key, desc_label)
+        self.edit_radios = []  # List of (radio_button, operation)
+
+        # Timeline viewer state: MacroTimeline, visible [start, end] seconds, drag anchor
+        self._timeline = None
+        self._timeline_view = [0.0, 1.0]
+        self._timeline_drag = None
+        self._timeline_redraw_pending = False
 
         super().__init__(parent, manager)
 
         # === MVC-REFACTOR: Auto-update pattern size label when size changes ===
         self.pattern_size_var.trace_add("write", self._on_pattern_size_changed)
+        self.macro_speed_var.trace_add("write", self._on_macro_speed_changed)
+        self.edit_operation_var.trace_add("write", self._on_edit_operation_changed)
 
     def _build_content(self) -> None:
         """Build the patterns tab UI with pattern options and macro controls"""
@@ -224,6 +268,163 @@ class PatternsTab(BaseTab):
         )
         self.play_button.pack(side="left", padx=5)
 
+        self.pause_button = Button(
+            macro_buttons,
+            text=f"⏯️ {self._t('macro_pause')}",
+            command=self.on_pause_macro,
+            bootstyle="info",
+            width=16,
+        )
+        self.pause_button.pack(side="left", padx=5)
+
+        self.dry_run_button = Button(
+            macro_buttons,
+            text=f"🧪 {self._t('macro_dry_run')}",
+            command=self.on_dry_run_macro,
+            bootstyle="secondary",
+            width=16,
+        )
+        self.dry_run_button.pack(side="left", padx=5)
+
+        speed_frame = Frame(macro_card)
+        speed_frame.pack(pady=5)
+
+        self.macro_speed_label = Label(speed_frame, text=f"⏩ {self._t('macro_speed')}:")
+        self.macro_speed_label.pack(side="left", padx=5)
+
+        speed_slider = Scale(
+            speed_frame,
+            from_=0.25,
+            to=10.0,
+            variable=self.macro_speed_var,
+            bootstyle="primary",
+            orient="horizontal",
+            length=300,
+        )
+        speed_slider.pack(side="left", padx=5)
+
+        Label(speed_frame, textvariable=self.macro_speed_label_var, width=6).pack(side="left", padx=10)
+
+        loop_frame = Frame(macro_card)
+        loop_frame.pack(pady=5)
+
+        self.macro_loops_label = Label(loop_frame, text=f"🔁 {self._t('macro_loops')}:")
+        self.macro_loops_label.pack(side="left", padx=5)
+        Spinbox(
+            loop_frame,
+            from_=0,
+            to=10000,
+            textvariable=self.macro_loops_var,
+            bootstyle="primary",
+            width=8,
+        ).pack(side="left", padx=5)
+        self.macro_loops_hint_label = Label(loop_frame, text=self._t('macro_loops_hint'))
+        self.macro_loops_hint_label.pack(side="left", padx=(0, 15))
+
+        self.macro_gap_label = Label(loop_frame, text=f"⏳ {self._t('macro_loop_gap')}:")
+        self.macro_gap_label.pack(side="left", padx=5)
+        Spinbox(
+            loop_frame,
+            from_=0,
+            to=3600,
+            increment=0.5,
+            textvariable=self.macro_gap_var,
+            bootstyle="primary",
+            width=8,
+        ).pack(side="left", padx=5)
+
+        idle_frame = Frame(macro_card)
+        idle_frame.pack(pady=5)
+
+        self.macro_max_idle_label = Label(idle_frame, text=f"💤 {self._t('macro_max_idle')}:")
+        self.macro_max_idle_label.pack(side="left", padx=5)
+        Spinbox(
+            idle_frame,
+            from_=0,
+            to=3600,
+            increment=0.5,
+            textvariable=self.macro_max_idle_var,
+            bootstyle="primary",
+            width=8,
+        ).pack(side="left", padx=5)
+        self.macro_idle_scale_label = Label(idle_frame, text=f"✂️ {self._t('macro_idle_scale')}:")
+        self.macro_idle_scale_label.pack(side="left", padx=5)
+        Spinbox(
+            idle_frame,
+            from_=0,
+            to=1,
+            increment=0.1,
+            textvariable=self.macro_idle_scale_var,
+            bootstyle="primary",
+            width=6,
+        ).pack(side="left", padx=5)
+        self.macro_max_idle_hint_label = Label(idle_frame, text=self._t('macro_max_idle_hint'))
+        self.macro_max_idle_hint_label.pack(side="left")
+
+        stream_frame = Frame(macro_card)
+        stream_frame.pack(pady=5)
+
+        self.macro_stream_check = Checkbutton(
+            stream_frame,
+            text=f"📀 {self._t('macro_stream')}",
+            variable=self.macro_stream_var,
+            bootstyle="primary-round-toggle"
+        )
+        self.macro_stream_check.pack(side="left", padx=5)
+        self.macro_source_combo = Combobox(stream_frame, textvariable=self.macro_source_var, state="readonly", width=18, bootstyle="primary")
+        self.macro_source_combo.pack(side="left", padx=5)
+        self.macro_stream_hint_label = Label(stream_frame, text=self._t('macro_stream_hint'))
+        self.macro_stream_hint_label.pack(side="left")
+
+        schedule_frame = Frame(macro_card)
+        schedule_frame.pack(pady=5)
+
+        self.schedule_at_label = Label(schedule_frame, text=f"⏰ {self._t('macro_schedule_at')}:")
+        self.schedule_at_label.pack(side="left", padx=5)
+        Entry(schedule_frame, textvariable=self.schedule_at_var, width=6).pack(side="left", padx=5)
+        self.schedule_every_label = Label(schedule_frame, text=f"🔂 {self._t('macro_schedule_every')}:")
+        self.schedule_every_label.pack(side="left", padx=5)
+        Spinbox(
+            schedule_frame,
+            from_=0,
+            to=1440,
+            increment=1,
+            textvariable=self.schedule_every_var,
+            bootstyle="primary",
+            width=6,
+        ).pack(side="left", padx=5)
+        self.schedule_button = Button(
+            schedule_frame,
+            text=f"📅 {self._t('macro_schedule')}",
+            command=self.on_schedule_macro,
+            bootstyle="info",
+        )
+        self.schedule_button.pack(side="left", padx=5)
+
+        schedules_frame = Frame(macro_card)
+        schedules_frame.pack(pady=5)
+
+        self.schedule_combo = Combobox(schedules_frame, textvariable=self.schedule_list_var, state="readonly", width=40, bootstyle="info")
+        self.schedule_combo.pack(side="left", padx=5)
+        self.cancel_schedule_button = Button(
+            schedules_frame,
+            text=f"🗑 {self._t('macro_schedule_cancel')}",
+            command=self.on_cancel_schedule,
+            bootstyle="danger-outline",
+        )
+        self.cancel_schedule_button.pack(side="left", padx=5)
+        self._schedule_ids = []
+        self.refresh_schedule_list()
+
+        self.macro_progress_bar = Progressbar(
+            macro_card,
+            variable=self.macro_progress_var,
+            maximum=100,
+            bootstyle="primary-striped",
+            length=400,
+        )
+        self.macro_progress_bar.pack(pady=(10, 0))
+
         self.macro_status = Label(
             macro_card,
             textvariable=self.macro_status_var,
@@ -232,6 +433,108 @@ class PatternsTab(BaseTab):
         )
         self.macro_status.pack(pady=5)
 
+        # === Macro Editor ===
+        self.editor_card = Card.create(scroll_frame, f"  {self._t('macro_editor')}  ", "secondary", geometry="pack", fill="x", pady=(10, 0))
+        editor_card = self.editor_card
+
+        source_frame = Frame(editor_card)
+        source_frame.pack(pady=5)
+
+        self.edit_source_label = Label(source_frame, text=f"🎞️ {self._t('macro_edit_source')}:")
+        self.edit_source_label.pack(side="left", padx=5)
+        self.edit_source_combo = Combobox(source_frame, textvariable=self.edit_source_var, state="readonly", width=18, bootstyle="secondary")
+        self.edit_source_combo.pack(side="left", padx=5)
+
+        self.edit_second_label = Label(source_frame, text=f"➕ {self._t('macro_edit_second')}:")
+        self.edit_second_label.pack(side="left", padx=(15, 5))
+        self.edit_second_combo = Combobox(source_frame, textvariable=self.edit_second_var, state="readonly", width=18, bootstyle="secondary")
+        self.edit_second_combo.pack(side="left", padx=5)
+
+        operation_frame = Frame(editor_card)
+        operation_frame.pack(pady=5)
+
+        for operation in ("trim", "cut", "concat", "splice", "scale", "shift"):
+            rb = Radiobutton(
+                operation_frame,
+                text=self._t(f"macro_edit_{operation}"),
+                variable=self.edit_operation_var,
+                value=operation,
+                bootstyle="secondary-outline-toolbutton",
+            )
+            rb.pack(side="left", padx=3)
+            self.edit_radios.append((rb, operation))
+
+        values_frame = Frame(editor_card)
+        values_frame.pack(pady=5)
+
+        self.edit_from_label = Label(values_frame, text=f"{self._t('macro_edit_from')}:")
+        self.edit_from_label.pack(side="left", padx=5)
+        Entry(values_frame, textvariable=self.edit_from_var, width=8, bootstyle="secondary").pack(side="left", padx=5)
+        self.edit_to_label = Label(values_frame, text=f"{self._t('macro_edit_to')}:")
+        self.edit_to_label.pack(side="left", padx=5)
+        Entry(values_frame, textvariable=self.edit_to_var, width=8, bootstyle="secondary").pack(side="left", padx=5)
+        self.edit_value_label = Label(values_frame, text=f"{self._t('macro_edit_value')}:")
+        self.edit_value_label.pack(side="left", padx=5)
+        Entry(values_frame, textvariable=self.edit_value_var, width=8, bootstyle="secondary").pack(side="left", padx=5)
+
+        self.edit_hint_label = Label(editor_card, text="", font=("Segoe UI", 9), foreground="gray")
+        self.edit_hint_label.pack(pady=2)
+
+        name_frame = Frame(editor_card)
+        name_frame.pack(pady=5)
+
+        self.edit_name_label = Label(name_frame, text=f"💾 {self._t('macro_edit_new_name')}:")
+        self.edit_name_label.pack(side="left", padx=5)
+        Entry(name_frame, textvariable=self.edit_name_var, width=20, bootstyle="secondary").pack(side="left", padx=5)
+        self.edit_apply_button = Button(
+            name_frame,
+            text=f"✂️ {self._t('macro_edit_apply')}",
+            command=self.on_edit_macro,
+            bootstyle="secondary",
+            width=14,
+        )
+        self.edit_apply_button.pack(side="left", padx=5)
+
+        # === Macro Timeline ===
+        self.timeline_card = Card.create(scroll_frame, f"  {self._t('macro_timeline')}  ", "info", geometry="pack", fill="x", pady=(10, 0))
+        timeline_card = self.timeline_card
+
+        timeline_controls = Frame(timeline_card)
+        timeline_controls.pack(pady=5)
+
+        self.timeline_combo = Combobox(timeline_controls, textvariable=self.timeline_macro_var, state="readonly", width=18, bootstyle="info")
+        self.timeline_combo.pack(side="left", padx=5)
+        self.timeline_show_button = Button(
+            timeline_controls,
+            text=f"🔍 {self._t('macro_timeline_show')}",
+            command=self.on_show_timeline,
+            bootstyle="info",
+            width=14,
+        )
+        self.timeline_show_button.pack(side="left", padx=5)
+        Button(timeline_controls, text="−", command=lambda: self._zoom_timeline(2.0), bootstyle="info-outline", width=3).pack(side="left", padx=2)
+        Button(timeline_controls, text="+", command=lambda: self._zoom_timeline(0.5), bootstyle="info-outline", width=3).pack(side="left", padx=2)
+        Button(timeline_controls, text="⟲", command=self._reset_timeline_view, bootstyle="info-outline", width=3).pack(side="left", padx=2)
+
+        self.path_canvas = Canvas(timeline_card, height=240, highlightthickness=0)
+        self.path_canvas.pack(fill="x", padx=10, pady=5)
+        self.activity_canvas = Canvas(timeline_card, height=90, highlightthickness=0, cursor="sb_h_double_arrow")
+        self.activity_canvas.pack(fill="x", padx=10, pady=(0, 5))
+        Label(timeline_card, textvariable=self.timeline_range_var, font=("Segoe UI", 9), foreground="gray").pack(pady=(0, 5))
+        self.timeline_hint_label = Label(timeline_card, text=self._t("macro_timeline_hint"), font=("Segoe UI", 9), foreground="gray")
+        self.timeline_hint_label.pack(pady=(0, 5))
+
+        for canvas in (self.path_canvas, self.activity_canvas):
+            canvas.bind("<Configure>", lambda e: self._schedule_timeline_redraw())
+        self.activity_canvas.bind("<MouseWheel>", self._on_timeline_wheel)
+        self.activity_canvas.bind("<Button-4>", self._on_timeline_wheel)
+        self.activity_canvas.bind("<Button-5>", self._on_timeline_wheel)
+        self.activity_canvas.bind("<ButtonPress-1>", self._on_timeline_press)
+        self.activity_canvas.bind("<B1-Motion>", self._on_timeline_drag)
+
+        self._on_edit_operation_changed()
+        self.refresh_macro_list()
+
     def _on_pattern_size_changed(self, *args):
         """Callback when pattern_size_var changes - updates size label"""
         try:
@@ -239,10 +542,171 @@ class PatternsTab(BaseTab):
         except Exception:
             pass
 
+    def _on_macro_speed_changed(self, *args):
+        """Callback when macro_speed_var changes - updates speed label"""
+        try:
+            self.macro_speed_label_var.set(f"{self.macro_speed_var.get():.2f}×")
+        except Exception:
+            pass
+
     def update_macro_status(self, text: str) -> None:
         """Update the macro status label with current recording/playback state"""
         self.macro_status_var.set(text)
 
+    def _on_edit_operation_changed(self, *args):
+        """Callback when edit_operation_var changes - explains which fields are used"""
+        try:
+            self.edit_hint_label.config(text=self._t(f"macro_edit_{self.edit_operation_var.get()}_hint"))
+        except Exception:
+            pass
+
+    def refresh_macro_list(self) -> None:
+        """Update editor macro selectors from the saved macro library"""
+        names = self.manager.model.get_saved_macros()
+        self.edit_source_combo.config(values=names)
+        self.edit_second_combo.config(values=names)
+        self.timeline_combo.config(values=names)
+        self.macro_source_combo.config(values=names)
+        for var in (self.edit_source_var, self.edit_second_var, self.timeline_macro_var, self.macro_source_var):
+            if var.get() not in names:
+                var.set(names[0] if names else "")
+
+    def refresh_schedule_list(self) -> None:
+        """Update the pending schedule selector from the macro scheduler"""
+        schedules = self.manager.model.get_macro_schedules()
+        entries = []
+        for job in schedules:
+            entry = f"#{job['id']} {job['label']} · {job['next_run'].replace('T', ' ')}"
+            if job["interval"]:
+                entry += f" · {self._t('macro_schedule_every')} {job['interval'] / 60:g}"
+            entries.append(entry)
+        self._schedule_ids = [job["id"] for job in schedules]
+        self.schedule_combo.config(values=entries)
+        self.schedule_list_var.set(entries[0] if entries else self._t('macro_no_schedules'))
+
+    def selected_schedule_id(self):
+        """Id of the schedule selected in the list (None if there are none)"""
+        index = self.schedule_combo.current()
+        if not self._schedule_ids:
+            return None
+        return self._schedule_ids[index if index >= 0 else 0]
+
+    # === Timeline viewer ===
+
+    def show_timeline(self, timeline) -> None:
+        """Display a MacroTimeline, zoomed out to the whole macro"""
+        self._timeline = timeline
+        self._reset_timeline_view()
+
+    def _reset_timeline_view(self) -> None:
+        """Show the whole macro"""
+        if self._timeline is not None:
+            self._timeline_view = [0.0, max(self._timeline.duration, self._timeline.base_bucket)]
+            self._schedule_timeline_redraw()
+
+    def _zoom_timeline(self, factor: float, anchor: float = 0.5) -> None:
+        """Scale the visible span by factor around anchor (0..1 across the canvas)"""
+        timeline = self._timeline
+        if timeline is None:
+            return
+        start, end = self._timeline_view
+        duration = max(timeline.duration, timeline.base_bucket)
+        span = min(max((end - start) * factor, timeline.base_bucket * 10), duration)
+        pivot = start + (end - start) * anchor
+        start = min(max(0.0, pivot - span * anchor), duration - span)
+        self._timeline_view = [start, start + span]
+        self._schedule_timeline_redraw()
+
+    def _on_timeline_wheel(self, event):
+        """Zoom around the mouse pointer"""
+        zoom_in = event.num == 4 or event.delta > 0
+        width = max(self.activity_canvas.winfo_width(), 1)
+        self._zoom_timeline(0.8 if zoom_in else 1.25, min(max(event.x / width, 0.0), 1.0))
+        return "break"  # Keep the surrounding ScrolledFrame from scrolling
+
+    def _on_timeline_press(self, event):
+        """Remember where a pan drag started"""
+        self._timeline_drag = (event.x, list(self._timeline_view))
+
+    def _on_timeline_drag(self, event):
+        """Pan the visible window with the mouse"""
+        if self._timeline is None or self._timeline_drag is None:
+            return
+        x0, (start, end) = self._timeline_drag
+        span = end - start
+        duration = max(self._timeline.duration, span)
+        shift = (x0 - event.x) / max(self.activity_canvas.winfo_width(), 1) * span
+        start = min(max(0.0, start + shift), duration - span)
+        self._timeline_view = [start, start + span]
+        self._schedule_timeline_redraw()
+
+    def _schedule_timeline_redraw(self) -> None:
+        """Coalesce redraw requests (drag and wheel events) into one per idle cycle"""
+        if not self._timeline_redraw_pending:
+            self._timeline_redraw_pending = True
+            self.after_idle(self._draw_timeline)
+
+    def _draw_timeline(self) -> None:
+        """Draw path and activity lanes for the visible window.
+
+        Item counts are bounded by the canvas width: the activity lane is one
+        polyline plus at most one tick per pixel column, the path is one
+        polyline with at most two points per pixel column.
+        """
+        self._timeline_redraw_pending = False
+        timeline = self._timeline
+        if timeline is None:
+            return
+        colors = self.manager.style.colors
+        start, end = self._timeline_view
+        span = max(end - start, 1e-9)
+
+        # Activity lanes: move density (top), clicks and keys (ticks)
+        canvas = self.activity_canvas
+        canvas.delete("all")
+        canvas.config(background=colors.inputbg)
+        width, height = max(canvas.winfo_width(), 1), max(canvas.winfo_height(), 1)
+        bucket, first, counts = timeline.activity(start, end, width)
+        scale = width / span
+        move_bottom = height * 0.6
+        moves = counts["moves"]
+        peak = max(moves, default=0) or 1
+        coords = []
+        for i, count in enumerate(moves):
+            coords += (((first + i) * bucket - start) * scale, move_bottom - count / peak * (move_bottom - 4))
+        if len(coords) >= 4:
+            canvas.create_line(coords, fill=colors.info)
+        for kind, color, top, bottom in (("clicks", colors.danger, 0.65, 0.8), ("keys", colors.warning, 0.85, 1.0)):
+            for i, count in enumerate(counts[kind]):
+                if count:
+                    x = ((first + i) * bucket - start) * scale
+                    canvas.create_line(x, height * top, x, height * bottom, fill=color)
+
+        # Mouse path, fitted into the canvas keeping the aspect ratio
+        canvas = self.path_canvas
+        canvas.delete("all")
+        canvas.config(background=colors.inputbg)
+        width, height = max(canvas.winfo_width(), 1), max(canvas.winfo_height(), 1)
+        min_x, min_y, max_x, max_y = timeline.bounds
+        fit = min((width - 10) / max(max_x - min_x, 1), (height - 10) / max(max_y - min_y, 1))
+        off_x = (width - (max_x - min_x) * fit) / 2 - min_x * fit
+        off_y = (height - (max_y - min_y) * fit) / 2 - min_y * fit
+
+        coords = timeline.path(start, end, 2 * width)
+        coords[0::2] = [x * fit + off_x for x in coords[0::2]]
+        coords[1::2] = [y * fit + off_y for y in coords[1::2]]
+        if len(coords) >= 4:
+            canvas.create_line(coords, fill=colors.primary)
+        for x, y in timeline.clicks_in(start, end, width):
+            x, y = x * fit + off_x, y * fit + off_y
+            canvas.create_oval(x - 2, y - 2, x + 2, y + 2, outline=colors.danger, fill=colors.danger)
+
+        self.timeline_range_var.set(f"{start:.2f} s – {end:.2f} s / {timeline.duration:.1f} s · {timeline.event_count} {self._t('macro_sim_actions')}")
+
+    def update_macro_progress(self, percent: float) -> None:
+        """Update the macro playback progress bar (0-100)"""
+        self.macro_progress_var.set(percent)
+
     def update_hotkey_labels(self, record_key: str = "F3", stop_key: str = "F4", play_key: str = "F5") -> None:
         """Update macro button labels with hotkey bindings"""
         try:
@@ -270,6 +734,24 @@ class PatternsTab(BaseTab):
         if hasattr(self, 'macro_card'):
             self.macro_card.config(text=f"  {self._t('macro_recording')}  ")
 
+        if hasattr(self, 'timeline_card'):
+            self.timeline_card.config(text=f"  {self._t('macro_timeline')}  ")
+            self.timeline_show_button.config(text=f"🔍 {self._t('macro_timeline_show')}")
+            self.timeline_hint_label.config(text=self._t("macro_timeline_hint"))
+
+        if hasattr(self, 'editor_card'):
+            self.editor_card.config(text=f"  {self._t('macro_editor')}  ")
+            self.edit_source_label.config(text=f"🎞️ {self._t('macro_edit_source')}:")
+            self.edit_second_label.config(text=f"➕ {self._t('macro_edit_second')}:")
+            self.edit_from_label.config(text=f"{self._t('macro_edit_from')}:")
+            self.edit_to_label.config(text=f"{self._t('macro_edit_to')}:")
+            self.edit_value_label.config(text=f"{self._t('macro_edit_value')}:")
+            self.edit_name_label.config(text=f"💾 {self._t('macro_edit_new_name')}:")
+            self.edit_apply_button.config(text=f"✂️ {self._t('macro_edit_apply')}")
+            for rb, operation in self.edit_radios:
+                rb.config(text=self._t(f"macro_edit_{operation}"))
+            self._on_edit_operation_changed()
+
         # Update pattern radio buttons and descriptions
         if hasattr(self, 'pattern_radios'):
             for rb, pattern_key, desc_label in self.pattern_radios:
@@ -294,10 +776,32 @@ class PatternsTab(BaseTab):
         if hasattr(self, 'pattern_size_label_var'):
             self.pattern_size_label_var.set(f"{self.pattern_size_var.get()} {self._t('pattern_size_px')}")
 
+        if hasattr(self, 'macro_speed_label'):
+            self.macro_speed_label.config(text=f"⏩ {self._t('macro_speed')}:")
+        if hasattr(self, 'macro_loops_label'):
+            self.macro_loops_label.config(text=f"🔁 {self._t('macro_loops')}:")
+            self.macro_loops_hint_label.config(text=self._t('macro_loops_hint'))
+            self.macro_gap_label.config(text=f"⏳ {self._t('macro_loop_gap')}:")
+            self.macro_max_idle_label.config(text=f"💤 {self._t('macro_max_idle')}:")
+            self.macro_max_idle_hint_label.config(text=self._t('macro_max_idle_hint'))
+            self.macro_idle_scale_label.config(text=f"✂️ {self._t('macro_idle_scale')}:")
+            self.macro_stream_check.config(text=f"📀 {self._t('macro_stream')}")
+            self.macro_stream_hint_label.config(text=self._t('macro_stream_hint'))
+            self.schedule_at_label.config(text=f"⏰ {self._t('macro_schedule_at')}:")
+            self.schedule_every_label.config(text=f"🔂 {self._t('macro_schedule_every')}:")
+            self.schedule_button.config(text=f"📅 {self._t('macro_schedule')}")
+            self.cancel_schedule_button.config(text=f"🗑 {self._t('macro_schedule_cancel')}")
+            self.refresh_schedule_list()
+
         # Update pause on move checkbutton
         if hasattr(self, 'pause_on_move_check'):
             self.pause_on_move_check.config(text=f"⏸ {self._t('pause_on_move')}")
 
+        if self.pause_button:
+            self.pause_button.config(text=f"⏯️ {self._t('macro_pause')}")
+        if self.dry_run_button:
+            self.dry_run_button.config(text=f"🧪 {self._t('macro_dry_run')}")
+
         # Update macro buttons with hotkeys
         self.update_hotkey_labels()
 
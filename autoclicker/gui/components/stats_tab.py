@@ -5,13 +5,17 @@ Statistics Tab - UI for session stats and monitoring
 """
 
 import ttkbootstrap as ttkb
-from ttkbootstrap.widgets import (Frame, Label, Button, Progressbar)
+from ttkbootstrap.widgets import (Frame, Label, Button, Progressbar, Combobox, Radiobutton, Spinbox, Treeview)
 from ttkbootstrap.scrolled import ScrolledFrame
-from tkinter import IntVar, StringVar
+from tkinter import IntVar, StringVar, Canvas
 from typing import Callable
+from datetime import datetime
+from PIL import ImageTk
 
 from .base_tab import BaseTab
 from .card import Card
+from ...logic.interval_histogram import percentile_name
+from ...utils.constants import SPARKLINE_WINDOWS, STATS_REFRESH_MS, MIN_STATS_REFRESH_MS, MAX_STATS_REFRESH_MS
 
 
 class StatsTab(BaseTab):
@@ -23,15 +27,42 @@ class StatsTab(BaseTab):
         manager,
         on_export_stats: Callable[[], None],
         on_reset_stats: Callable[[], None],
+        on_show_heatmap: Callable[[], None],
+        on_export_heatmap: Callable[[str], None],
+        on_refresh_series: Callable[[], None],
+        on_toggle_click_log: Callable[[], None],
     ):
         """Initialize StatsTab with statistics display and export/reset controls"""
         self.on_export_stats = on_export_stats
         self.on_reset_stats = on_reset_stats
+        self.on_show_heatmap = on_show_heatmap
+        self.on_export_heatmap = on_export_heatmap
+        self.on_refresh_series = on_refresh_series
+        self.on_toggle_click_log = on_toggle_click_log
 
         # === Dynamic UI State Variables (only for elements that change during runtime) ===
         self.progress_var = IntVar(value=0)
         self.progress_label_var = StringVar(value="")  # Controls progress label text
         self.progress_style_var = StringVar(value="success-striped")  # Controls progress bar style
+        self.series_window_var = IntVar(value=SPARKLINE_WINDOWS[0][1])  # Sparkline window in seconds
+        self.stats_refresh_var = IntVar(value=STATS_REFRESH_MS)  # Refresh interval while clicking (ms)
+        self.series_info_var = StringVar(value="")
+        self.interval_info_var = StringVar(value="")
+        self.heatmap_source_var = StringVar(value="")
+        self.heatmap_info_var = StringVar(value="")
+        self.click_log_info_var = StringVar(value="")
+
+        self.history_view_var = StringVar(value="sessions")  # sessions | profile | day
+        self.history_page_var = StringVar(value="")
+        self._history_cursors = [None]  # Keyset cursor of each visited page (first page: None)
+        self._history_next = None
+        self._history_loaded = False  # History and lifetime totals are read when the tab is first shown
+        self.lifetime_var = StringVar(value="")
+
+        # Heatmap shown and its PhotoImage (Tk drops images without a Python reference)
+        self.heatmap = None
+        self._heatmap_image = None
+        self._click_log_status = None  # Last status shown (None: clicks are not logged)
 
         self.progress_bar = None
         self.progress_label = None
@@ -57,6 +88,7 @@ class StatsTab(BaseTab):
             (self._t("session_time"), self.manager.state["session_time"], "⏱️"),
             (self._t("total_clicks"), self.manager.state["total_clicks"], "🧮"),
             (self._t("click_rate"), self.manager.state["click_rate"], "📈"),
+            (self._t("current_rate"), self.manager.state["instant_rate"], "⚡"),
         ]
 
         self.stat_labels = []
@@ -75,6 +107,39 @@ class StatsTab(BaseTab):
 
             Label(text_frame, textvariable=var, font=("Segoe UI", 14, "bold")).pack(anchor="w")
 
+        # === Click rate sparkline (per-second series) ===
+        series_frame = Frame(live_card)
+        series_frame.pack(fill="x", padx=20, pady=(0, 10))
+
+        window_frame = Frame(series_frame)
+        window_frame.pack(anchor="w")
+        for text, seconds in SPARKLINE_WINDOWS:
+            Radiobutton(
+                window_frame,
+                text=text,
+                variable=self.series_window_var,
+                value=seconds,
+                command=self.on_refresh_series,
+                bootstyle="info-outline-toolbutton",
+            ).pack(side="left", padx=(0, 5))
+
+        self.stats_refresh_label = Label(window_frame, text=f"{self._t('stats_refresh')} (ms):", font=("Segoe UI", 9))
+        self.stats_refresh_label.pack(side="left", padx=(15, 5))
+        Spinbox(
+            window_frame,
+            from_=MIN_STATS_REFRESH_MS,
+            to=MAX_STATS_REFRESH_MS,
+            increment=100,
+            textvariable=self.stats_refresh_var,
+            bootstyle="info",
+            width=6,
+        ).pack(side="left")
+
+        self.sparkline_canvas = Canvas(series_frame, height=50, highlightthickness=0)
+        self.sparkline_canvas.pack(fill="x", pady=5)
+        Label(series_frame, textvariable=self.manager.state["rate_windows"], font=("Segoe UI", 9), foreground="gray").pack(anchor="w")
+        Label(series_frame, textvariable=self.series_info_var, font=("Segoe UI", 9), foreground="gray").pack(anchor="w")
+        Label(series_frame, textvariable=self.interval_info_var, font=("Segoe UI", 9), foreground="gray").pack(anchor="w")
 
         # === Progress Visualization ===
         self.progress_card = Card.create(scroll_frame, f"  {self._t('session_progress')}  ", "success", geometry="pack", fill="x", pady=0)
@@ -99,6 +164,35 @@ class StatsTab(BaseTab):
         self.history_card = Card.create(scroll_frame, f"  {self._t('session_history')}  ", "warning", geometry="pack", fill="x", pady=10)
         history_card = self.history_card
 
+        Label(history_card, textvariable=self.lifetime_var, font=("Segoe UI", 10, "bold"), wraplength=700, justify="left").pack(anchor="w", pady=(5, 0))
+
+        history_controls = Frame(history_card)
+        history_controls.pack(fill="x", pady=5)
+        self.history_radios = []
+        for key, view in (("history_sessions", "sessions"), ("history_per_profile", "profile"), ("history_per_day", "day")):
+            rb = Radiobutton(
+                history_controls,
+                text=self._t(key),
+                variable=self.history_view_var,
+                value=view,
+                command=self.refresh_history,
+                bootstyle="warning-outline-toolbutton",
+            )
+            rb.pack(side="left", padx=(0, 5))
+            self.history_radios.append((rb, key))
+        self.history_next_button = Button(history_controls, text="▶", command=self._next_history_page, bootstyle="warning-outline", width=3)
+        self.history_next_button.pack(side="right", padx=2)
+        Label(history_controls, textvariable=self.history_page_var, font=("Segoe UI", 9)).pack(side="right", padx=5)
+        self.history_prev_button = Button(history_controls, text="◀", command=self._previous_history_page, bootstyle="warning-outline", width=3)
+        self.history_prev_button.pack(side="right", padx=2)
+
+        self.history_tree = Treeview(history_card, columns=tuple(range(6)), show="headings", height=8, bootstyle="warning")
+        self.history_tree.pack(fill="x", pady=5)
+        for column in range(6):
+            self.history_tree.column(column, width=110, anchor="e" if column else "w")
+        self.bind("<Map>", self._on_first_show, add="+")
+        self.manager.state["current_profile"].trace_add("write", lambda *_: self.refresh_lifetime())
+
         self.export_button = Button(
             history_card,
             text=f"📊 {self._t('export_statistics')}",
@@ -107,6 +201,15 @@ class StatsTab(BaseTab):
         )
         self.export_button.pack(pady=5)
 
+        self.click_log_button = Button(
+            history_card,
+            text=f"📝 {self._t('click_log_start')}",
+            command=self.on_toggle_click_log,
+            bootstyle="warning-outline",
+        )
+        self.click_log_button.pack(pady=5)
+        Label(history_card, textvariable=self.click_log_info_var, font=("Segoe UI", 9), foreground="gray").pack()
+
         self.reset_button = Button(
             history_card,
             text=f"🔄 {self._t('reset_statistics')}",
@@ -115,6 +218,218 @@ class StatsTab(BaseTab):
         )
         self.reset_button.pack(pady=5)
 
+        # === Click Heatmap ===
+        self.heatmap_card = Card.create(scroll_frame, f"  {self._t('click_heatmap')}  ", "primary", geometry="pack", fill="x", pady=0)
+        heatmap_card = self.heatmap_card
+
+        heatmap_controls = Frame(heatmap_card)
+        heatmap_controls.pack(pady=5)
+
+        self.heatmap_combo = Combobox(
+            heatmap_controls,
+            textvariable=self.heatmap_source_var,
+            state="readonly",
+            width=20,
+            bootstyle="primary",
+            postcommand=self._refresh_heatmap_sources,
+        )
+        self.heatmap_combo.pack(side="left", padx=5)
+        self._refresh_heatmap_sources()
+        self.heatmap_combo.current(0)
+
+        self.heatmap_show_button = Button(
+            heatmap_controls,
+            text=f"🔥 {self._t('heatmap_show')}",
+            command=self.on_show_heatmap,
+            bootstyle="primary",
+        )
+        self.heatmap_show_button.pack(side="left", padx=5)
+        Button(heatmap_controls, text="PNG", command=lambda: self.on_export_heatmap("png"), bootstyle="primary-outline").pack(side="left", padx=2)
+        Button(heatmap_controls, text="CSV", command=lambda: self.on_export_heatmap("csv"), bootstyle="primary-outline").pack(side="left", padx=2)
+
+        self.heatmap_canvas = Canvas(heatmap_card, height=270, highlightthickness=0)
+        self.heatmap_canvas.pack(fill="x", padx=10, pady=5)
+        self.heatmap_canvas.bind("<Configure>", lambda e: self._draw_heatmap())
+        Label(heatmap_card, textvariable=self.heatmap_info_var, font=("Segoe UI", 9), foreground="gray").pack(pady=(0, 5))
+
+    def sparkline_points(self) -> int:
+        """Number of sparkline samples that fit the canvas (one per 2 pixels)"""
+        return max(self.sparkline_canvas.winfo_width() // 2, 2)
+
+    def update_sparkline(self, rates: list, latencies: list, summary: dict) -> None:
+        """Draw click rate (and max click latency) over the selected window"""
+        canvas = self.sparkline_canvas
+        canvas.delete("all")
+        colors = self.manager.style.colors
+        canvas.config(background=colors.inputbg)
+        width, height = max(canvas.winfo_width(), 1), max(canvas.winfo_height(), 1)
+
+        step = width / max(len(rates) - 1, 1)
+        for values, color in ((latencies, colors.warning), (rates, colors.info)):
+            peak = max(values, default=0) or 1
+            coords = []
+            for i, value in enumerate(values):
+                coords += (i * step, height - 2 - value / peak * (height - 4))
+            if len(coords) >= 4:
+                canvas.create_line(coords, fill=color, width=1 if values is latencies else 2)
+
+        self.series_info_var.set(
+            f"Ø {summary['rate']:.1f} clicks/s · {self._t('series_peak')} {summary['peak_rate']:.0f} clicks/s · "
+            f"{self._t('series_max_latency')} {summary['max_latency'] * 1000:.1f} ms"
+        )
+
+    # === Session history ===
+
+    def _on_first_show(self, event=None) -> None:
+        """Load history and lifetime totals once the tab is shown (startup does not touch the database)"""
+        if not self._history_loaded:
+            self.refresh_history()
+
+    def refresh_history(self) -> None:
+        """Reload the history view from its first page and the lifetime totals"""
+        self._history_loaded = True
+        self._history_cursors = [None]
+        self._show_history()
+        self.refresh_lifetime()
+
+    def refresh_lifetime(self) -> None:
+        """Show the lifetime totals of the current profile (one row lookup)"""
+        if not self._history_loaded:
+            return
+        profile = self.manager.state["current_profile"].get()
+        totals = self.manager.model.get_lifetime_stats(profile)
+        if not totals:
+            self.lifetime_var.set(f"{self._t('lifetime')} · {profile}: –")
+            return
+        text = (
+            f"{self._t('lifetime')} · {profile}: {totals['sessions']} {self._t('history_sessions')} · "
+            f"{totals['clicks']} {self._t('heatmap_clicks')} · {self._format_duration(totals['seconds'])} · "
+            f"Ø {totals['clicks'] / max(totals['seconds'], 1e-9):.1f} clicks/s"
+        )
+        intervals = totals["intervals"]
+        if intervals["count"]:
+            text += " · " + " / ".join(
+                f"{percentile_name(p)} {value * 1000:.2f}" for p, value in intervals["percentiles"].items()
+            ) + " ms"
+        self.lifetime_var.set(text)
+
+    def _next_history_page(self) -> None:
+        if self._history_next is not None:
+            self._history_cursors.append(self._history_next)
+            self._show_history()
+
+    def _previous_history_page(self) -> None:
+        if len(self._history_cursors) > 1:
+            self._history_cursors.pop()
+            self._show_history()
+
+    def _show_history(self) -> None:
+        """Fill the table with the current page of sessions or the selected aggregate"""
+        tree = self.history_tree
+        view = self.history_view_var.get()
+        model = self.manager.model
+        tree.delete(*tree.get_children())
+
+        if view == "sessions":
+            headings = ("history_started", "profile", "session_time", "total_clicks", "click_rate", "p99 (ms)")
+            rows, self._history_next = model.get_history_page(after=self._history_cursors[-1])
+            for row in rows:
+                tree.insert("", "end", values=(
+                    datetime.fromtimestamp(row["started"]).strftime("%Y-%m-%d %H:%M"),
+                    row["profile"],
+                    self._format_duration(row["ended"] - row["started"]),
+                    row["clicks"],
+                    f"{row['rate']:.1f}",
+                    f"{row['p99'] * 1000:.2f}",
+                ))
+            self.history_page_var.set(f"{len(self._history_cursors)}")
+        else:
+            headings = ("profile" if view == "profile" else "history_day", "history_sessions", "total_clicks", "session_time", "click_rate", "max p99 (ms)")
+            self._history_next = None
+            for row in model.get_history_aggregates(view):
+                tree.insert("", "end", values=(
+                    row["label"],
+                    row["sessions"],
+                    row["clicks"],
+                    self._format_duration(row["seconds"]),
+                    f"{row['rate']:.1f}",
+                    f"{row['p99'] * 1000:.2f}",
+                ))
+            self.history_page_var.set("")
+
+        for column, heading in enumerate(headings):
+            tree.heading(column, text=heading if " " in heading else self._t(heading))
+        paging = "normal" if view == "sessions" else "disabled"
+        self.history_prev_button.config(state=paging if len(self._history_cursors) > 1 else "disabled")
+        self.history_next_button.config(state=paging if self._history_next is not None else "disabled")
+
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    def update_click_log(self, status) -> None:
+        """Show whether clicks are logged, to which file and how many were written"""
+        self._click_log_status = status
+        if status is None:
+            self.click_log_button.config(text=f"📝 {self._t('click_log_start')}")
+            self.click_log_info_var.set("")
+            return
+        self.click_log_button.config(text=f"⏹ {self._t('click_log_stop')}")
+        text = f"{status['filename']} · {status['written'] + status['pending']} {self._t('heatmap_clicks')}"
+        if status["dropped"]:
+            text += f" · {status['dropped']} {self._t('click_log_dropped')}"
+        self.click_log_info_var.set(text)
+
+    def update_intervals(self, summary: dict) -> None:
+        """Show inter-click interval percentiles, max and jitter"""
+        if not summary["count"]:
+            self.interval_info_var.set("")
+            return
+        parts = [f"{percentile_name(p)} {value * 1000:.2f}" for p, value in summary["percentiles"].items()]
+        parts.append(f"max {summary['max'] * 1000:.2f}")
+        parts.append(f"{self._t('interval_jitter')} {summary['jitter'] * 1000:.2f}")
+        self.interval_info_var.set(f"{self._t('click_intervals')} (ms): " + " · ".join(parts))
+
+    def _refresh_heatmap_sources(self) -> None:
+        """Heatmap sources: the live clicker session, then every saved macro"""
+        self.heatmap_combo.config(values=[self._t("heatmap_session")] + self.manager.model.get_saved_macros())
+
+    def showing_session(self) -> bool:
+        """True if the live clicker session is selected as heatmap source"""
+        return self.heatmap_combo.current() <= 0
+
+    def selected_macro(self) -> str:
+        """Name of the macro selected as heatmap source"""
+        return self.heatmap_source_var.get()
+
+    def show_heatmap(self, heatmap) -> None:
+        """Display a ClickHeatmap"""
+        self.heatmap = heatmap
+        self._draw_heatmap()
+
+    def _draw_heatmap(self) -> None:
+        """Render the heatmap into the canvas, keeping the screen aspect ratio"""
+        heatmap = self.heatmap
+        canvas = self.heatmap_canvas
+        canvas.delete("all")
+        if heatmap is None:
+            return
+
+        width, height = max(canvas.winfo_width(), 1), max(canvas.winfo_height(), 1)
+        scale = min(width / heatmap.screen["width"], height / heatmap.screen["height"])
+        image_width, image_height = int(heatmap.screen["width"] * scale), int(heatmap.screen["height"] * scale)
+        self._heatmap_image = ImageTk.PhotoImage(heatmap.render(image_width, image_height))
+        canvas.create_image(width // 2, height // 2, image=self._heatmap_image)
+
+        text = f"{heatmap.total} {self._t('heatmap_clicks')}"
+        hottest = heatmap.hottest()
+        if hottest:
+            x, y, count = hottest
+            text += f" · {self._t('heatmap_hottest')} ({x}, {y}): {count}"
+        self.heatmap_info_var.set(text)
+
     def _on_progress_style_changed(self, *_):
         """Callback when progress_style_var changes - updates progress bar style"""
         if self.progress_bar:
@@ -146,12 +461,21 @@ class StatsTab(BaseTab):
 
         if hasattr(self, 'history_card'):
             self.history_card.config(text=f"  {self._t('session_history')}  ")
+            for rb, key in self.history_radios:
+                rb.config(text=self._t(key))
+            if self._history_loaded:
+                self._show_history()
+                self.refresh_lifetime()
+
+        if hasattr(self, 'stats_refresh_label'):
+            self.stats_refresh_label.config(text=f"{self._t('stats_refresh')} (ms):")
 
-        # Update stat labels (session_time, total_clicks, click_rate)
-        if hasattr(self, 'stat_labels') and len(self.stat_labels) == 3:
+        # Update stat labels (session_time, total_clicks, click_rate, current_rate)
+        if hasattr(self, 'stat_labels') and len(self.stat_labels) == 4:
             self.stat_labels[0].config(text=self._t('session_time'))
             self.stat_labels[1].config(text=self._t('total_clicks'))
             self.stat_labels[2].config(text=self._t('click_rate'))
+            self.stat_labels[3].config(text=self._t('current_rate'))
 
         # Update progress label if showing "ready_to_start"
         if hasattr(self, 'progress_label_var'):
@@ -159,10 +483,22 @@ class StatsTab(BaseTab):
             if 'ready' in current.lower() or 'bereit' in current.lower() or 'prêt' in current.lower() or 'listo' in current.lower():
                 self.progress_label_var.set(self._t('ready_to_start'))
 
+        if hasattr(self, 'heatmap_card'):
+            self.heatmap_card.config(text=f"  {self._t('click_heatmap')}  ")
+            self.heatmap_show_button.config(text=f"🔥 {self._t('heatmap_show')}")
+            session = self.showing_session()
+            self._refresh_heatmap_sources()
+            if session:
+                self.heatmap_combo.current(0)
+            self._draw_heatmap()
+
         # Update export button
         if hasattr(self, 'export_button'):
             self.export_button.config(text=f"📊 {self._t('export_statistics')}")
 
+        if hasattr(self, 'click_log_button'):
+            self.update_click_log(self._click_log_status)
+
         # Update reset button
         if hasattr(self, 'reset_button'):
             self.reset_button.config(text=f"🔄 {self._t('reset_statistics')}")
\ No newline at end of file
@@ -3,6 +3,8 @@
 
 from typing import Optional
 import sys
+import threading
+import time
 from pathlib import Path
 import ttkbootstrap as ttkb
 from ttkbootstrap import Window, Style
@@ -14,7 +16,8 @@ from .handlers.profile_handler import ProfileHandler
 from ..model import ApplicationModel
 from ..utils.toast_notification import ToastManager
 from ..utils.window_sizing import calculate_optimal_window_size, get_centered_geometry
-from ..utils.validators import validate_delay, validate_duration, validate_repeat, validate_coordinates
+from ..utils.validators import validate_delay, validate_duration, validate_repeat, validate_coordinates, validate_macro_speed, validate_macro_loops, validate_macro_gap, validate_macro_idle, validate_macro_idle_scale, validate_schedule_time, validate_schedule_interval, validate_number
+from ..utils.constants import HEATMAP_REFRESH_MS, STATS_REFRESH_MS, MIN_STATS_REFRESH_MS, MAX_STATS_REFRESH_MS
 from .. import events
 
 
@@ -69,6 +72,10 @@ class GUIManager:
         # === UI Components Registry ===
         self._ui_components = []
 
+        # === Stats Refresh (after id while scheduled, monotonic time of last heatmap update) ===
+        self._stats_refresh_id = None
+        self._heatmap_refreshed = 0.0
+
         # === Initialize Themes ===
         try:
             self.model.theme_manager.set_available_themes(self.style.theme_names())
@@ -136,6 +143,8 @@ class GUIManager:
             "total_clicks": self.model.total_clicks,
             "session_time": self.model.session_time,
             "click_rate": self.model.click_rate,
+            "instant_rate": self.model.instant_rate,
+            "rate_windows": self.model.rate_windows,
         }
 
     # ============================================
@@ -175,6 +184,12 @@ class GUIManager:
             on_record_macro=self._on_record_macro,
             on_stop_macro=self._on_stop_macro,
             on_play_macro=self._on_play_macro,
+            on_pause_macro=self._on_pause_macro,
+            on_edit_macro=self._on_edit_macro,
+            on_dry_run_macro=self._on_dry_run_macro,
+            on_show_timeline=self._on_show_timeline,
+            on_schedule_macro=self._on_schedule_macro,
+            on_cancel_schedule=self._on_cancel_schedule,
         )
         self.notebook.add(self.patterns_tab, text="🎨 Patterns")
         self.model.on_macro_status_update = self.patterns_tab.update_macro_status
@@ -185,9 +200,14 @@ class GUIManager:
             manager=self,
             on_export_stats=self._on_export_stats,
             on_reset_stats=self._on_reset_stats,
+            on_show_heatmap=self._on_show_heatmap,
+            on_export_heatmap=self._on_export_heatmap,
+            on_refresh_series=self._refresh_click_series,
+            on_toggle_click_log=self._on_toggle_click_log,
         )
         self.notebook.add(self.stats_tab, text="📊 Statistics")
         self.model.on_progress_changed = self.stats_tab.update_progress
+        self.model.on_history_changed = lambda: self.root.after(0, self.stats_tab.refresh_history)
 
         # === Settings Tab ===
         available_themes = (
@@ -411,33 +431,122 @@ class GUIManager:
         """Handle export statistics button click"""
         from ..logic.stats import ExportResult
 
-        self.model.stop_stats_updater()
-
         filename = filedialog.asksaveasfilename(
             title="Export Statistics",
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv")]
+            filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("JSON files", "*.json")]
         )
         if not filename:
-            self.model.start_stats_updater()
             return
 
-        try:
-            result, message = self.model.export_statistics(filename)
+        result, message = self.model.export_statistics(filename)
 
-            if result == ExportResult.SUCCESS:
-                self.update_status(events.STATS_EXPORTED, filename=message)
-            else:
-                print(f"Export failed: {result.value} - {message}")
-                self.update_status(events.STATS_EXPORT_ERROR)
-
-        finally:
-            self.model.start_stats_updater()
+        if result == ExportResult.SUCCESS:
+            self.update_status(events.STATS_EXPORTED, filename=message)
+        else:
+            print(f"Export failed: {result.value} - {message}")
+            self.update_status(events.STATS_EXPORT_ERROR)
 
     def _on_reset_stats(self):
         """Handle reset statistics button click"""
         self.model.reset_statistics()
         self.update_status(events.STATS_RESET)
+        self._refresh_session_heatmap()
+        self._refresh_click_series()
+        self.stats_tab.update_intervals(self.model.get_interval_summary())
+
+    def start_stats_refresh(self):
+        """Refresh statistics now and keep pulling clicker snapshots on the main thread while it runs"""
+        if self._stats_refresh_id is not None:
+            self.root.after_cancel(self._stats_refresh_id)
+        self._stats_refresh_id = self.root.after(0, self._stats_refresh_tick)
+
+    def stats_refresh_interval(self) -> int:
+        """Configured refresh interval in ms, clamped (default while the field is being edited)"""
+        try:
+            interval = int(self.stats_tab.stats_refresh_var.get())
+        except Exception:
+            return STATS_REFRESH_MS
+        return max(MIN_STATS_REFRESH_MS, min(MAX_STATS_REFRESH_MS, interval))
+
+    def _stats_refresh_tick(self):
+        """One step of the stats pipeline: counters, sparkline and (less often) heatmap.
+
+        Reschedules itself only while the clicker runs; the tick that sees it
+        stopped draws the final values, so an idle app has no stats wakeups.
+        """
+        self._stats_refresh_id = None
+        running = False
+        try:
+            running = self.model.refresh_stats()
+            self._refresh_click_series()
+            self.stats_tab.update_intervals(self.model.get_interval_summary())
+            self.stats_tab.update_click_log(self.model.get_click_log_status())
+            if not running or time.monotonic() - self._heatmap_refreshed >= HEATMAP_REFRESH_MS / 1000:
+                self._refresh_session_heatmap()
+        except Exception as e:
+            print(f"[ERROR] Failed to refresh statistics: {e}")
+        if running:
+            self._stats_refresh_id = self.root.after(self.stats_refresh_interval(), self._stats_refresh_tick)
+
+    def _refresh_click_series(self):
+        """Redraw the click rate sparkline for the selected window"""
+        seconds = self.stats_tab.series_window_var.get()
+        rates, latencies = self.model.get_click_series(seconds, points=self.stats_tab.sparkline_points())
+        self.stats_tab.update_sparkline(rates, latencies, self.model.get_click_series_summary(seconds))
+
+    def _refresh_session_heatmap(self):
+        """Bin new clicks into the session heatmap and redraw it if shown"""
+        self._heatmap_refreshed = time.monotonic()
+        changed = self.model.update_session_heatmap()
+        if self.stats_tab.showing_session() and (changed or self.stats_tab.heatmap is not self.model.session_heatmap):
+            self.stats_tab.show_heatmap(self.model.session_heatmap)
+
+    def _on_show_heatmap(self):
+        """Show the heatmap of the live session or build the selected macro's one off the UI thread"""
+        if self.stats_tab.showing_session():
+            self.model.update_session_heatmap()
+            self.stats_tab.show_heatmap(self.model.session_heatmap)
+            return
+
+        name = self.stats_tab.selected_macro()
+
+        def build():
+            heatmap = self.model.build_macro_heatmap(name)
+            if heatmap is not None:
+                self.root.after(0, lambda: self.stats_tab.show_heatmap(heatmap))
+
+        threading.Thread(target=build, daemon=True).start()
+
+    def _on_toggle_click_log(self):
+        """Handle click log button: stop the running log or pick a file and start one"""
+        if self.model.get_click_log_status() is not None:
+            self.model.stop_click_log()
+        else:
+            filename = filedialog.asksaveasfilename(
+                title="Click Log",
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv"), ("JSON Lines", "*.jsonl"), ("Binary log", "*.bin")],
+            )
+            if filename:
+                self.model.start_click_log(filename)
+        self.stats_tab.update_click_log(self.model.get_click_log_status())
+
+    def _on_export_heatmap(self, file_format: str):
+        """Handle heatmap PNG/CSV export button click"""
+        heatmap = self.stats_tab.heatmap
+        if heatmap is None:
+            self.toast.show(self.t("heatmap_empty"), "warning")
+            return
+
+        filetypes = [("PNG images", "*.png")] if file_format == "png" else [("CSV files", "*.csv")]
+        filename = filedialog.asksaveasfilename(
+            title="Export Heatmap",
+            defaultextension=f".{file_format}",
+            filetypes=filetypes,
+        )
+        if filename:
+            self.model.export_heatmap(heatmap, filename)
 
     # ============================================
     # === PROFILE CALLBACKS ===
@@ -472,16 +581,208 @@ class GUIManager:
         self.root.after(0, self._stop_macro_safe)
 
     def _stop_macro_safe(self):
-        """Internal thread-safe macro recording stop"""
-        self.model.stop_macro_recording()
+        """Internal thread-safe macro recording stop (stops playback if playing)"""
+        if self.model.is_macro_playing():
+            self.model.stop_macro_playback()
+        else:
+            self.model.stop_macro_recording()
+
+    def _on_pause_macro(self):
+        """Handle pause/resume macro playback button click (thread-safe)"""
+        self.root.after(0, self._pause_macro_safe)
+
+    def _pause_macro_safe(self):
+        """Internal thread-safe toggle between paused and playing"""
+        if self.model.is_macro_paused():
+            self.model.resume_macro_playback()
+        else:
+            self.model.pause_macro_playback()
 
     def _on_play_macro(self):
         """Handle play macro button click (thread-safe)"""
         self.root.after(0, self._play_macro_safe)
 
+    def _read_macro_playback_settings(self) -> Optional[dict]:
+        """Validated speed, loops, gap, max_idle and idle_scale from the Patterns tab (None + toast if invalid)"""
+        is_valid, error, speed = validate_macro_speed(self.patterns_tab.macro_speed_var.get())
+        if not is_valid:
+            self.toast.show(error, "warning")
+            return None
+
+        # Raw string values avoid TclError on invalid input (see _on_toggle_clicker)
+        try:
+            loops_str = str(self.patterns_tab.macro_loops_var.get())
+        except Exception:
+            loops_str = self.root.tk.getvar(self.patterns_tab.macro_loops_var._name)
+
+        try:
+            gap_str = str(self.patterns_tab.macro_gap_var.get())
+        except Exception:
+            gap_str = self.root.tk.getvar(self.patterns_tab.macro_gap_var._name)
+
+        is_valid, error, loops = validate_macro_loops(loops_str)
+        if not is_valid:
+            self.toast.show(error, "warning")
+            return None
+        is_valid, error, gap = validate_macro_gap(gap_str)
+        if not is_valid:
+            self.toast.show(error, "warning")
+            return None
+
+        try:
+            max_idle_str = str(self.patterns_tab.macro_max_idle_var.get())
+        except Exception:
+            max_idle_str = self.root.tk.getvar(self.patterns_tab.macro_max_idle_var._name)
+
+        is_valid, error, max_idle = validate_macro_idle(max_idle_str)
+        if not is_valid:
+            self.toast.show(error, "warning")
+            return None
+
+        try:
+            idle_scale_str = str(self.patterns_tab.macro_idle_scale_var.get())
+        except Exception:
+            idle_scale_str = self.root.tk.getvar(self.patterns_tab.macro_idle_scale_var._name)
+
+        is_valid, error, idle_scale = validate_macro_idle_scale(idle_scale_str)
+        if not is_valid:
+            self.toast.show(error, "warning")
+            return None
+        return {"speed": speed, "loops": loops, "gap": gap, "max_idle": max_idle, "idle_scale": idle_scale}
+
     def _play_macro_safe(self):
         """Internal thread-safe macro playback"""
-        self.model.play_macro_recording()
+        settings = self._read_macro_playback_settings()
+        if settings is None:
+            return
+        if not self.patterns_tab.macro_stream_var.get():
+            self.model.play_macro_recording(**settings)
+            return
+
+        # Streaming plays one pass of a saved file without loading it; loops/gap don't apply
+        name = self.patterns_tab.macro_source_var.get()
+        if not name:
+            self.toast.show(self.t('macro_stream_no_source'), "warning")
+            return
+        self.model.stream_macro_recording(
+            name, speed=settings["speed"], max_idle=settings["max_idle"], idle_scale=settings["idle_scale"]
+        )
+
+    def _on_schedule_macro(self):
+        """Handle macro schedule button click (thread-safe)"""
+        self.root.after(0, self._schedule_macro_safe)
+
+    def _schedule_macro_safe(self):
+        """Schedule the selected saved macro at HH:MM and/or every N minutes"""
+        tab = self.patterns_tab
+        name = tab.macro_source_var.get()
+        if not name:
+            self.toast.show(self.t('macro_schedule_no_source'), "warning")
+            return
+
+        settings = self._read_macro_playback_settings()
+        if settings is None:
+            return
+
+        is_valid, error, at = validate_schedule_time(tab.schedule_at_var.get())
+        if not is_valid:
+            self.toast.show(error, "warning")
+            return
+
+        try:
+            every_str = str(tab.schedule_every_var.get())
+        except Exception:
+            every_str = self.root.tk.getvar(tab.schedule_every_var._name)
+
+        is_valid, error, every = validate_schedule_interval(every_str)
+        if not is_valid:
+            self.toast.show(error, "warning")
+            return
+        if at is None and not every:
+            self.toast.show(self.t('macro_schedule_needs_time'), "warning")
+            return
+
+        self.model.schedule_macro(name, at=at, every_minutes=every or None, **settings)
+
+    def _on_cancel_schedule(self):
+        """Handle cancel schedule button click (thread-safe)"""
+        self.root.after(0, self._cancel_schedule_safe)
+
+    def _cancel_schedule_safe(self):
+        """Cancel the schedule selected in the Patterns tab"""
+        schedule_id = self.patterns_tab.selected_schedule_id()
+        if schedule_id is not None:
+            self.model.cancel_macro_schedule(schedule_id)
+
+    def _on_dry_run_macro(self):
+        """Handle macro dry-run button click (thread-safe)"""
+        self.root.after(0, self._dry_run_macro_safe)
+
+    def _dry_run_macro_safe(self):
+        """Simulate the loaded macro with the current playback settings (off the UI thread)"""
+        settings = self._read_macro_playback_settings()
+        if settings is None:
+            return
+        threading.Thread(
+            target=self.model.simulate_macro,
+            kwargs={"speed": settings["speed"], "max_idle": settings["max_idle"], "idle_scale": settings["idle_scale"]},
+            daemon=True,
+        ).start()
+
+    def _on_show_timeline(self):
+        """Handle macro timeline show button click (thread-safe)"""
+        self.root.after(0, self._show_timeline_safe)
+
+    def _show_timeline_safe(self):
+        """Build the timeline of the selected macro off the UI thread, then display it"""
+        name = self.patterns_tab.timeline_macro_var.get() or None
+
+        def build():
+            timeline = self.model.build_macro_timeline(name)
+            if timeline is not None:
+                self.root.after(0, lambda: self.patterns_tab.show_timeline(timeline))
+
+        threading.Thread(target=build, daemon=True).start()
+
+    def _on_edit_macro(self):
+        """Handle macro editor apply button click (thread-safe)"""
+        self.root.after(0, self._edit_macro_safe)
+
+    def _edit_macro_safe(self):
+        """Validate editor fields and run the edit off the UI thread"""
+        tab = self.patterns_tab
+        operation = tab.edit_operation_var.get()
+        source, second = tab.edit_source_var.get(), tab.edit_second_var.get()
+
+        values = {}
+        for key, var, min_val in (("from", tab.edit_from_var, 0), ("to", tab.edit_to_var, 0), ("value", tab.edit_value_var, None)):
+            is_valid, error, values[key] = validate_number(var.get(), min_val=min_val, name=key.capitalize())
+            if not is_valid:
+                self.toast.show(error, "warning")
+                return
+
+        # Editor operations -> macro_edit operation, sources and parameters
+        if operation in ("trim", "cut"):
+            edit, sources, params = operation, [source], {"start": values["from"], "end": values["to"]}
+        elif operation == "concat":
+            edit, sources, params = "concat", [source, second], {"gap": max(0.0, values["value"])}
+        elif operation == "splice":
+            edit, sources, params = "splice", [source, second], {"at": values["from"]}
+        elif operation == "scale":
+            if values["value"] <= 0:
+                self.toast.show("Value must be greater than 0", "warning")
+                return
+            edit, sources, params = "retime", [source], {"scale": values["value"]}
+        else:
+            edit, sources, params = "retime", [source], {"shift_at": values["from"], "shift": values["value"]}
+
+        new_name = tab.edit_name_var.get().strip()
+        threading.Thread(
+            target=self.model.edit_macro,
+            args=(edit, sources, new_name),
+            kwargs=params,
+            daemon=True,
+        ).start()
 
     # ============================================
     # === STATUS & UI UPDATE METHODS ===
@@ -561,10 +862,9 @@ class GUIManager:
 
     def _on_window_close(self):
         """Handle window close and cleanup"""
-        try:
-            self.model.stop_stats_updater()
-        except Exception as e:
-            print(f"Error stopping stats updater: {e}")
+        if self._stats_refresh_id is not None:
+            self.root.after_cancel(self._stats_refresh_id)
+            self._stats_refresh_id = None
 
         try:
             self.model.cleanup_hotkeys()
@@ -576,6 +876,31 @@ class GUIManager:
         except Exception as e:
             print(f"Error stopping clicker: {e}")
 
+        try:
+            self.model.shutdown_macro_scheduler()
+        except Exception as e:
+            print(f"Error stopping macro scheduler: {e}")
+
+        try:
+            self.model.stop_metrics_server()
+        except Exception as e:
+            print(f"Error stopping metrics endpoint: {e}")
+
+        try:
+            self.model.stop_click_log()
+        except Exception as e:
+            print(f"Error closing click log: {e}")
+
+        try:
+            self.model.flush_profiles()
+        except Exception as e:
+            print(f"Error saving profiles: {e}")
+
+        try:
+            self.model.shutdown_history()
+        except Exception as e:
+            print(f"Error writing session history: {e}")
+
         self.root.quit()
 
     def run(self):
@@ -7,6 +7,7 @@ Handles saving, loading, and deleting profiles with proper MVC separation.
 
 from typing import TYPE_CHECKING
 from ... import events
+from ...utils.constants import STATS_REFRESH_MS
 
 if TYPE_CHECKING:
     from ..gui_manager import GUIManager
@@ -34,6 +35,10 @@ class ProfileHandler:
             "pattern_size": self.gm.patterns_tab.pattern_size_var.get(),
             "click_while_pattern": self.gm.patterns_tab.click_while_pattern_var.get(),
             "interrupt_on_move": self.gm.patterns_tab.interrupt_on_move_var.get(),
+            "macro_speed": self.gm.patterns_tab.macro_speed_var.get(),
+
+            # StatsTab settings
+            "stats_refresh_ms": self.gm.stats_refresh_interval(),
 
             # Application settings
             "language": self.gm.model.language.get(),
@@ -72,6 +77,10 @@ class ProfileHandler:
         self.gm.patterns_tab.pattern_size_var.set(profile.get("pattern_size", 100))
         self.gm.patterns_tab.click_while_pattern_var.set(profile.get("click_while_pattern", False))
         self.gm.patterns_tab.interrupt_on_move_var.set(profile.get("interrupt_on_move", False))
+        self.gm.patterns_tab.macro_speed_var.set(profile.get("macro_speed", 1.0))
+
+        # Apply Stats Tab Settings
+        self.gm.stats_tab.stats_refresh_var.set(profile.get("stats_refresh_ms", STATS_REFRESH_MS))
 
         # Apply Language
         lang = profile.get("language")
@@ -26,6 +26,11 @@ class StatusHandler:
 
     def handle(self, event_code: str, **kwargs):
         """Handle status update for given event code with optional context kwargs"""
+        if event_code == events.MACRO_PROGRESS:
+            # Up to 10 Hz during playback: skip console, toast and the full message table
+            self.gm.root.after(0, lambda: self._update_macro_progress(kwargs))
+            return
+
         message = self._get_message(event_code, kwargs)
 
         # Console output
@@ -77,7 +82,13 @@ class StatusHandler:
             events.MACRO_LOADED: f"[OK] {msg('macro_loaded', name=kwargs.get('name', ''), count=kwargs.get('count', ''))}",
             events.MACRO_LOAD_ERROR: f"[ERROR] {t('macro_load_error')}",
             events.MACRO_PLAYING: f"[{t('playing').upper()}] {t('macro_playing')}",
-            events.MACRO_PLAY_COMPLETED: f"[OK] {t('macro_play_completed')}",
+            events.MACRO_PLAY_COMPLETED: f"[OK] {t('macro_play_completed')}" + (
+                f" ({t('macro_lateness')}: Ø {kwargs['mean_ms']:.1f} ms, p99 {kwargs['p99_ms']:.1f} ms)"
+                if 'mean_ms' in kwargs else ""
+            ) + (
+                f" ({t('macro_time_saved')}: {kwargs['time_saved']:.1f} s)"
+                if kwargs.get('time_saved') else ""
+            ),
             events.MACRO_PLAY_ERROR: f"[ERROR] {t('macro_play_error')}",
             events.MACRO_DELETED: f"[OK] {msg('macro_deleted', name=kwargs.get('name', ''))}",
             events.MACRO_DELETE_ERROR: f"[ERROR] {t('macro_delete_error')}",
@@ -85,6 +96,24 @@ class StatusHandler:
             events.MACRO_INVALID_NAME: f"[ERROR] {t('macro_invalid_name')}",
             events.MACRO_NOT_FOUND: f"[ERROR] {msg('macro_not_found', name=kwargs.get('name', ''))}",
             events.MACRO_LIBS_UNAVAILABLE: f"[ERROR] {t('macro_libs_unavailable')}",
+            events.MACRO_SIMPLIFIED: f"[OK] {msg('macro_simplified', name=kwargs.get('name', ''))} ({kwargs.get('before', 0)} → {kwargs.get('after', 0)})",
+            events.MACRO_SIMPLIFY_ERROR: f"[ERROR] {t('macro_simplify_error')}",
+            events.MACRO_LOOP_COMPLETED: f"[{t('playing').upper()}] {t('macro_loop_completed')} {kwargs.get('loop', 0)}/{kwargs.get('loops') or '∞'}",
+            events.MACRO_ALREADY_PLAYING: f"[WARN] {t('macro_already_playing')}",
+            events.MACRO_PLAYBACK_STOPPED: f"[OK] {t('macro_playback_stopped')}",
+            events.MACRO_SCHEDULED: f"[OK] {msg('macro_scheduled', name=kwargs.get('name', ''))}",
+            events.MACRO_SCHEDULE_CANCELLED: f"[OK] {t('macro_schedule_cancelled')}",
+            events.MACRO_SCHEDULE_ERROR: f"[ERROR] {t('macro_schedule_error')}",
+            events.MACRO_PAUSED: f"[{t('paused').upper()}] {t('macro_paused')}",
+            events.MACRO_RESUMED: f"[{t('playing').upper()}] {t('macro_resumed')}",
+            events.MACRO_EDITED: f"[OK] {msg('macro_edited', name=kwargs.get('name', ''))} ({kwargs.get('count', 0)})",
+            events.MACRO_EDIT_ERROR: f"[ERROR] {t('macro_edit_error')}",
+            events.MACRO_SIMULATED: (
+                f"[OK] {t('macro_simulated')}: {kwargs.get('duration', 0.0):.1f} s · {kwargs.get('actions', 0)} {t('macro_sim_actions')}"
+                f" · {kwargs.get('clicks', 0)} {t('macro_sim_clicks')} · {t('macro_sim_peak')} {kwargs.get('peak_rate', 0)}/s"
+                f" · {t('macro_sim_longest_gap')} {kwargs.get('longest_gap', 0.0):.1f} s"
+            ),
+            events.MACRO_SIMULATE_ERROR: f"[ERROR] {t('macro_simulate_error')}",
 
             # Profile Events
             events.PROFILE_SAVED: f"[OK] {msg('profile_saved', profile_name=kwargs.get('profile_name', ''))}",
@@ -109,6 +138,11 @@ class StatusHandler:
             events.STATS_EXPORTED: f"[OK] {msg('stats_exported', filename=kwargs.get('filename', ''))}",
             events.STATS_EXPORT_ERROR: f"[ERROR] {t('stats_export_error')}",
             events.STATS_RESET: f"[OK] {t('stats_reset')}",
+            events.HEATMAP_EXPORTED: f"[OK] {msg('heatmap_exported', filename=kwargs.get('filename', ''))}",
+            events.HEATMAP_EXPORT_ERROR: f"[ERROR] {t('heatmap_export_error')}",
+            events.CLICK_LOG_STARTED: f"[OK] {msg('click_log_started', filename=kwargs.get('filename', ''))}",
+            events.CLICK_LOG_STOPPED: f"[OK] {msg('click_log_stopped', filename=kwargs.get('filename', ''), count='(%s %s)' % (kwargs.get('count', 0), t('heatmap_clicks')))}",
+            events.CLICK_LOG_ERROR: f"[ERROR] {t('click_log_error')}",
 
             # General Events
             events.READY: f"[{t('ready').upper()}]",
@@ -156,12 +190,15 @@ class StatusHandler:
         # Clicker state updates
         if event_code in (events.CLICKER_STARTED, events.CLICKER_RESUMED, events.CLICKER_WAITING):
             self._update_clicker_running(event_code)
+            self.gm.start_stats_refresh()
         elif event_code == events.CLICKER_PAUSED:
             self._update_clicker_paused()
         elif event_code == events.CLICKER_STOPPED:
             self._update_clicker_stopped()
+            self.gm.start_stats_refresh()
         elif event_code == events.CLICKER_COMPLETED:
             self._update_clicker_completed()
+            self.gm.start_stats_refresh()
 
         # Macro status updates
         elif event_code == events.MACRO_RECORDING_STARTED:
@@ -170,8 +207,36 @@ class StatusHandler:
             count = kwargs.get('count', 0)
             self.gm.patterns_tab.update_macro_status(f"[OK] {t('macro_recording_stopped')} {count}")
         elif event_code in (events.MACRO_NOT_RECORDING, events.MACRO_ALREADY_RECORDING,
-                           events.MACRO_PLAYING, events.MACRO_NO_EVENTS, events.MACRO_PLAY_COMPLETED):
+                           events.MACRO_PLAYING, events.MACRO_NO_EVENTS, events.MACRO_PLAY_COMPLETED,
+                           events.MACRO_LOOP_COMPLETED, events.MACRO_ALREADY_PLAYING, events.MACRO_PLAYBACK_STOPPED,
+                           events.MACRO_PAUSED, events.MACRO_RESUMED, events.MACRO_SIMULATED):
             self.gm.patterns_tab.update_macro_status(message)
+            if event_code == events.MACRO_PLAY_COMPLETED:
+                self.gm.patterns_tab.update_macro_progress(100)
+            elif event_code in (events.MACRO_PLAYING, events.MACRO_PLAYBACK_STOPPED):
+                self.gm.patterns_tab.update_macro_progress(0)
+            if event_code == events.MACRO_PLAYING:
+                # A scheduled start may have just fired: one-shots leave the list, repeats move on
+                self.gm.patterns_tab.refresh_schedule_list()
+        elif event_code in (events.MACRO_SCHEDULED, events.MACRO_SCHEDULE_CANCELLED):
+            self.gm.patterns_tab.refresh_schedule_list()
+        elif event_code in (events.MACRO_SAVED, events.MACRO_DELETED, events.MACRO_SIMPLIFIED, events.MACRO_EDITED):
+            self.gm.patterns_tab.refresh_macro_list()
+            if event_code == events.MACRO_EDITED:
+                self.gm.patterns_tab.update_macro_status(message)
+
+    def _update_macro_progress(self, kwargs: dict):
+        """Update macro progress bar and status label from a MACRO_PROGRESS event"""
+        t = self._t
+        index, total = kwargs.get('index', 0), kwargs.get('total')
+        text = f"[{t('playing').upper()}] {index}/{total or '?'} · {kwargs.get('elapsed', 0.0):.1f} s"
+        if kwargs.get('eta') is not None:
+            text += f" · ETA {kwargs['eta']:.1f} s"
+        if kwargs.get('loops', 1) != 1:
+            text += f" · {t('macro_loops')} {kwargs.get('loop', 1)}/{kwargs.get('loops') or '∞'}"
+        self.gm.patterns_tab.update_macro_status(text)
+        if total:
+            self.gm.patterns_tab.update_macro_progress(min(100.0, index / total * 100))
 
     def _update_clicker_running(self, event_code: str):
         """Update UI for running/resumed/waiting state"""
@@ -1,14 +1,22 @@
 # autoclicker/logic/__init__.py
 """
 Logic Package - Business logic not related to GUI
+
+The exported classes are imported on first use: they pull in pyautogui and
+pynput, which need a display, while headless tools (macro_tool.py) only use
+the macro file modules of this package.
 """
 
-from .clicker import Clicker
-from .capture_coordinates import CaptureCoordinates
-from .stats import Stats
-from .profiles import Profiles
-from .setup_hotkeys import SetupHotkeys
-from .macro_recording import MacroRecording
+import importlib
+
+_LAZY_EXPORTS = {
+    "Clicker": ".clicker",
+    "CaptureCoordinates": ".capture_coordinates",
+    "Stats": ".stats",
+    "Profiles": ".profiles",
+    "SetupHotkeys": ".setup_hotkeys",
+    "MacroRecording": ".macro_recording",
+}
 
 __all__ = [
     "Clicker",
@@ -17,4 +25,12 @@ __all__ = [
     "Profiles",
     "SetupHotkeys",
     "MacroRecording",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
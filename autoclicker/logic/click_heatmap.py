@@ -0,0 +1,150 @@
+# autoclicker/logic/click_heatmap.py
+"""Click Heatmap - 2D histogram of click positions for macros and clicker sessions"""
+
+import csv
+import math
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+from PIL import Image
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Grid cells (columns, rows) - 30 px cells on a 1920x1080 screen
+HEATMAP_BINS = (64, 36)
+
+# Click positions buffered before they are binned in one vectorised pass
+HEATMAP_BATCH = 65536
+
+# Exported PNGs are scaled up to at most this width (keeps the screen aspect ratio)
+EXPORT_WIDTH = 1280
+
+
+def _heat_palette() -> list:
+    """256-entry palette: dark blue -> cyan -> yellow -> red"""
+    stops = ((0, (20, 24, 48)), (85, (0, 170, 220)), (170, (250, 220, 40)), (255, (220, 30, 30)))
+    palette = []
+    for (i0, c0), (i1, c1) in zip(stops, stops[1:]):
+        for i in range(i0, i1 + (i1 == 255)):
+            f = (i - i0) / (i1 - i0)
+            palette.extend(round(a + (b - a) * f) for a, b in zip(c0, c1))
+    return palette
+
+
+HEAT_PALETTE = _heat_palette()
+
+
+class ClickHeatmap:
+    """Click counts on a fixed grid over the screen, updated incrementally.
+
+    add() bins only the new positions and adds them to the existing counts,
+    so a live session costs O(new clicks) per refresh instead of re-binning
+    the whole history. Counts are a NumPy array when available, otherwise a
+    flat array('Q') with the same row-major layout.
+    """
+
+    def __init__(self, screen: Dict[str, int], bins: Tuple[int, int] = HEATMAP_BINS):
+        self.screen = {"width": int(screen["width"]), "height": int(screen["height"])}
+        self.columns, self.rows = bins
+        self.total = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all counts"""
+        size = self.columns * self.rows
+        self._counts = np.zeros(size, dtype=np.int64) if NUMPY_AVAILABLE else array("Q", bytes(8 * size))
+        self.total = 0
+
+    def add(self, xs: Sequence[float], ys: Sequence[float]) -> None:
+        """Bin click positions (screen pixels); positions off screen are clamped to the edge"""
+        if not len(xs):
+            return
+        columns, rows = self.columns, self.rows
+        sx, sy = columns / self.screen["width"], rows / self.screen["height"]
+
+        if NUMPY_AVAILABLE:
+            cx = np.clip((np.asarray(xs, dtype=np.float64) * sx).astype(np.int64), 0, columns - 1)
+            cy = np.clip((np.asarray(ys, dtype=np.float64) * sy).astype(np.int64), 0, rows - 1)
+            self._counts += np.bincount(cy * columns + cx, minlength=columns * rows)
+        else:
+            counts = self._counts
+            last_x, last_y = columns - 1, rows - 1
+            for x, y in zip(xs, ys):
+                cx = min(max(int(x * sx), 0), last_x)
+                cy = min(max(int(y * sy), 0), last_y)
+                counts[cy * columns + cx] += 1
+        self.total += len(xs)
+
+    def add_events(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Bin the clicks (button presses) of macro events at the last mouse position"""
+        xs, ys = array("d"), array("d")
+        x = y = 0.0
+        for event in events:
+            event_type = event.get("type")
+            if event_type == "mouse_move":
+                x, y = event["x"], event["y"]
+            elif event_type == "mouse_click" and event.get("action", "down") == "down":
+                xs.append(x)
+                ys.append(y)
+                if len(xs) >= HEATMAP_BATCH:
+                    self.add(xs, ys)
+                    xs, ys = array("d"), array("d")
+        self.add(xs, ys)
+
+    def grid(self) -> list:
+        """Counts as a list of rows (top to bottom)"""
+        counts = self._counts.tolist() if NUMPY_AVAILABLE else list(self._counts)
+        return [counts[r * self.columns:(r + 1) * self.columns] for r in range(self.rows)]
+
+    def peak(self) -> int:
+        """Highest count of any cell"""
+        return int(max(self._counts)) if self.total else 0
+
+    def hottest(self) -> Optional[Tuple[int, int, int]]:
+        """(x, y, count) of the busiest cell, x/y being its centre in screen pixels"""
+        if not self.total:
+            return None
+        index = int(np.argmax(self._counts)) if NUMPY_AVAILABLE else max(range(len(self._counts)), key=self._counts.__getitem__)
+        row, column = divmod(index, self.columns)
+        return (
+            int((column + 0.5) * self.screen["width"] / self.columns),
+            int((row + 0.5) * self.screen["height"] / self.rows),
+            int(self._counts[index]),
+        )
+
+    def _levels(self) -> bytes:
+        """Cell intensities 0-255 on a log scale (single hot spots do not wash out the rest)"""
+        peak = self.peak()
+        if not peak:
+            return bytes(self.columns * self.rows)
+        scale = 255 / math.log1p(peak)
+        if NUMPY_AVAILABLE:
+            return (np.log1p(self._counts) * scale).astype(np.uint8).tobytes()
+        return bytes(int(math.log1p(count) * scale) for count in self._counts)
+
+    def render(self, width: int, height: int) -> Image.Image:
+        """Heatmap as an RGB image of the given size"""
+        image = Image.frombytes("P", (self.columns, self.rows), self._levels())
+        image.putpalette(HEAT_PALETTE)
+        return image.convert("RGB").resize((max(width, 1), max(height, 1)), Image.BILINEAR)
+
+    def export_png(self, filename: Union[str, Path]) -> None:
+        """Save the heatmap as a PNG with the aspect ratio of the screen"""
+        width = min(EXPORT_WIDTH, self.screen["width"])
+        self.render(width, round(width * self.screen["height"] / self.screen["width"])).save(filename, "PNG")
+
+    def export_csv(self, filename: Union[str, Path]) -> None:
+        """Save the counts as CSV: one row per grid row, labelled with pixel ranges"""
+        cell_w = self.screen["width"] / self.columns
+        cell_h = self.screen["height"] / self.rows
+        with open(filename, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["y \\ x"] + [f"{round(c * cell_w)}-{round((c + 1) * cell_w) - 1}" for c in range(self.columns)])
+            for r, row in enumerate(self.grid()):
+                writer.writerow([f"{round(r * cell_h)}-{round((r + 1) * cell_h) - 1}"] + row)
@@ -0,0 +1,201 @@
+# autoclicker/logic/click_log.py
+"""Click Log - Per-click event log streamed to CSV, JSONL or a packed binary file"""
+
+import csv
+import io
+import json
+import struct
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+# Clicks buffered between writer flushes; the clicker never waits, clicks beyond this are dropped
+RING_CAPACITY = 65536
+
+# Seconds between writer flushes (the writer also wakes early when the ring is half full)
+FLUSH_INTERVAL = 0.25
+
+# File extension -> log format (anything else is written as CSV)
+LOG_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".bin": "binary"}
+
+# Button codes stored in binary logs
+BUTTONS = ("left", "right", "middle", "double")
+
+CSV_HEADER = ("timestamp", "x", "y", "button", "scheduled", "lateness_ms")
+
+# Binary layout: header (magic, version, record size), then fixed-size little-endian records
+BINARY_MAGIC = b"CMXCLOG\x00"
+BINARY_HEADER = struct.Struct("<8sHH")
+BINARY_RECORD = struct.Struct("<ddiiB")  # timestamp, scheduled, x, y, button code
+BINARY_VERSION = 1
+
+
+def log_format(filename: Union[str, Path]) -> str:
+    """Log format chosen by file extension"""
+    return LOG_FORMATS.get(Path(filename).suffix.lower(), "csv")
+
+
+class ClickEventLog:
+    """Per-click events written to a file by a background writer.
+
+    record() runs on the clicker thread: it only stores the event in a
+    preallocated ring under a short lock. The writer thread takes all
+    pending events at once every FLUSH_INTERVAL, formats them and writes
+    them with one call, so file I/O never delays a click. Timestamps are
+    the clock of the clicker (seconds since the epoch); `scheduled` is when
+    the click was due, so timestamp - scheduled is how late it came.
+    """
+
+    def __init__(self, filename: Union[str, Path], capacity: int = RING_CAPACITY):
+        self.path = Path(filename)
+        self.format = log_format(filename)
+        self.capacity = capacity
+        self.written = 0
+        self.dropped = 0
+        self.error: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closing = False
+        self._times = array("d", bytes(8 * capacity))
+        self._scheduled = array("d", bytes(8 * capacity))
+        self._xs = array("i", bytes(4 * capacity))
+        self._ys = array("i", bytes(4 * capacity))
+        self._buttons = array("B", bytes(capacity))
+        self._head = 0  # Next slot to fill
+        self._pending = 0
+
+        # Opened here so a bad path fails in the caller, not in the writer
+        if self.format == "binary":
+            self._file = open(self.path, "wb")
+            self._file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, BINARY_RECORD.size))
+        else:
+            self._file = open(self.path, "w", encoding="utf-8", newline="")
+            if self.format == "csv":
+                csv.writer(self._file).writerow(CSV_HEADER)
+
+        self._writer = threading.Thread(target=self._write_loop, name="ClickLogWriter", daemon=True)
+        self._writer.start()
+
+    # === Clicker side ===
+
+    def record(self, timestamp: float, x: int, y: int, button: str, scheduled: float) -> None:
+        """Store one click (called by the clicker thread, never blocks on I/O)"""
+        code = BUTTONS.index(button) if button in BUTTONS else 0
+        with self._lock:
+            if self._pending >= self.capacity:
+                self.dropped += 1
+                return
+            i = self._head
+            self._times[i] = timestamp
+            self._scheduled[i] = scheduled
+            self._xs[i] = x
+            self._ys[i] = y
+            self._buttons[i] = code
+            self._head = (i + 1) % self.capacity
+            self._pending += 1
+            half_full = self._pending == self.capacity // 2
+        if half_full:
+            self._wake.set()
+
+    # === Writer side ===
+
+    def _take(self) -> tuple:
+        """Move all pending events out of the ring (oldest first)"""
+        with self._lock:
+            n = self._pending
+            start = (self._head - n) % self.capacity
+            end = start + n
+            columns = (self._times, self._scheduled, self._xs, self._ys, self._buttons)
+            if end <= self.capacity:
+                taken = tuple(column[start:end] for column in columns)
+            else:
+                end -= self.capacity
+                taken = tuple(column[start:] + column[:end] for column in columns)
+            self._pending = 0
+        return taken
+
+    def _encode(self, times, scheduled, xs, ys, buttons) -> Union[str, bytes]:
+        """Events in the file format"""
+        if self.format == "binary":
+            pack = BINARY_RECORD.pack
+            return b"".join(pack(*event) for event in zip(times, scheduled, xs, ys, buttons))
+
+        if self.format == "jsonl":
+            return "".join(
+                json.dumps({
+                    "timestamp": round(t, 6),
+                    "x": x,
+                    "y": y,
+                    "button": BUTTONS[b],
+                    "scheduled": round(s, 6),
+                    "lateness_ms": round((t - s) * 1000, 3),
+                }) + "\n"
+                for t, s, x, y, b in zip(times, scheduled, xs, ys, buttons)
+            )
+
+        out = io.StringIO()
+        csv.writer(out).writerows(
+            (f"{t:.6f}", x, y, BUTTONS[b], f"{s:.6f}", f"{(t - s) * 1000:.3f}")
+            for t, s, x, y, b in zip(times, scheduled, xs, ys, buttons)
+        )
+        return out.getvalue()
+
+    def _write_loop(self) -> None:
+        """Writer thread: flush pending events until close()"""
+        while True:
+            self._wake.wait(FLUSH_INTERVAL)
+            self._wake.clear()
+            closing = self._closing
+            batch = self._take()
+            if batch[0] and self.error is None:
+                try:
+                    self._file.write(self._encode(*batch))
+                    self._file.flush()
+                    self.written += len(batch[0])
+                except Exception as e:
+                    self.error = str(e)
+                    print(f"[ERROR] Failed to write click log {self.path}: {e}")
+            if self.error is not None:
+                with self._lock:
+                    self.dropped += len(batch[0])
+            if closing:
+                break
+        try:
+            self._file.close()
+        except Exception as e:
+            self.error = self.error or str(e)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write all pending events and close the file"""
+        self._closing = True
+        self._wake.set()
+        self._writer.join(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        """File, format and counters for the UI"""
+        with self._lock:
+            pending = self._pending
+        return {
+            "filename": str(self.path),
+            "format": self.format,
+            "written": self.written,
+            "pending": pending,
+            "dropped": self.dropped,
+            "error": self.error,
+        }
+
+
+def read_binary_log(filename: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Events of a binary click log, as written"""
+    with open(filename, "rb") as f:
+        magic, version, size = BINARY_HEADER.unpack(f.read(BINARY_HEADER.size))
+        if magic != BINARY_MAGIC or version != BINARY_VERSION or size != BINARY_RECORD.size:
+            raise ValueError(f"Not a click log: {filename}")
+        while True:
+            chunk = f.read(size * 4096)
+            if not chunk:
+                break
+            for t, s, x, y, b in BINARY_RECORD.iter_unpack(chunk[:len(chunk) - len(chunk) % size]):
+                yield {"timestamp": t, "x": x, "y": y, "button": BUTTONS[b] if b < len(BUTTONS) else "left", "scheduled": s}
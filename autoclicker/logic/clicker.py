@@ -6,6 +6,7 @@ import time
 import threading
 import math
 import random
+from array import array
 from threading import Event
 from typing import Optional, Callable
 
@@ -14,17 +15,34 @@ from ..events import (CLICKER_STARTED, CLICKER_STOPPED, CLICKER_COMPLETED, CLICK
 pyautogui.FAILSAFE = True  # Failsafe activated (upper-left corner)
 pyautogui.PAUSE = 0  # No delays between actions
 
+# Click positions kept until drained (x, y pairs); later clicks are not logged past this
+CLICK_LOG_LIMIT = 1_000_000
+
 
 class Clicker:
     """Manages auto-clicking functionality with thread-safe operations"""
 
-    def __init__(self):
+    def __init__(self, clock=None, backend=None, rng=None):
+        # Injectable time source, input backend and randomness (see dry_run for simulated runs).
+        # time() is only used for wall-clock stamps; intervals use perf_counter()/monotonic()
+        self._time = clock or time
+        self._input = backend or pyautogui
+        self._random = rng or random
         self.stop_event = Event()
         self.stop_event.set()
         self.session_start = None
         self.clicking_thread = None
         self.total_clicks = 0
+        self.lifetime_clicks = 0  # All clicks since the program started (never reset)
         self._clicks_lock = threading.Lock()
+        self._click_log = array("i")  # Flat x, y of clicks not yet drained (heatmap)
+        self.series = None  # Optional SecondSeries receiving per-second counts and latency
+        self.intervals = None  # Optional IntervalHistogram receiving every inter-click interval
+        self.event_log = None  # Optional ClickEventLog receiving every click
+        self.rates = None  # Optional ClickRate receiving every click (instantaneous rate)
+        self._last_click_end = None
+        self._deadline = None  # perf_counter() when the next click is due (None: as soon as possible)
+        self._wall_offset = 0.0  # time() - perf_counter() at session start (click log stamps)
         self._notify_callback: Optional[Callable[[str], None]] = None  
 
     def toggle_clicker(
@@ -40,7 +58,6 @@ class Clicker:
         random_delay: bool,
         click_while_pattern: bool = False,
         on_status_changed: Callable[[str], None] = None,
-        on_stats_updated: Callable[[int, float], None] = None,
         notify_when_done: bool = False,
         notify_callback: Optional[Callable[[str], None]] = None,
         interrupt_on_move: bool = False,
@@ -51,9 +68,13 @@ class Clicker:
 
         if self.stop_event.is_set():
             self.stop_event.clear()
-            self.session_start = time.time() # Start clicking
+            self.session_start = self._time.time() # Start clicking
             with self._clicks_lock:
                 self.total_clicks = 0
+                self._click_log = array("i")
+            self._last_click_end = None
+            self._deadline = None
+            self._wall_offset = self._time.time() - self._time.perf_counter()
             on_status_changed(CLICKER_STARTED)
 
             self.clicking_thread = threading.Thread(
@@ -70,8 +91,7 @@ class Clicker:
                     random_delay,
                     click_while_pattern,
                     on_status_changed,
-                    on_stats_updated,
-                    notify_when_done,  
+                    notify_when_done,
                     interrupt_on_move,
                     button_bounds,
                 ),
@@ -96,23 +116,21 @@ class Clicker:
         random_delay: bool,
         click_while_pattern: bool,
         on_status_changed: Callable[[str], None],
-        on_stats_updated: Callable[[int, float], None],
         notify_when_done: bool = False,
         interrupt_on_move: bool = False,
         button_bounds: Optional[tuple[int,int,int,int]] = None
     ) -> None:
-        """Main clicking loop running in separate thread"""
+        """Main clicking loop running in separate thread (counters are read via snapshot())"""
         # Wait for mouse to leave button area if needed
         if not self._wait_for_button_clear(button_bounds, on_status_changed):
             return
 
-        start_time = time.time()
-        last_stats_update = start_time
+        start_time = self._time.monotonic()
 
         # Initialize mouse tracking state
         mouse_state = {
-            'last_user_pos': pyautogui.position(),
-            'last_auto_pos': pyautogui.position(),
+            'last_user_pos': self._input.position(),
+            'last_auto_pos': self._input.position(),
             'last_manual_move': 0,
             'is_paused': False,
             'last_status': None
@@ -143,18 +161,13 @@ class Clicker:
 
                 # Apply delay between click cycles
                 if delay > 0:
-                    actual_delay = delay * random.uniform(0.8, 1.2) if random_delay else delay
-                    time.sleep(actual_delay)
-
-                # Update stats periodically
-                last_stats_update = self._update_stats_if_needed(
-                    last_stats_update, on_stats_updated
-                )
+                    actual_delay = delay * self._random.uniform(0.8, 1.2) if random_delay else delay
+                    self._deadline = self._time.perf_counter() + actual_delay
+                    self._time.sleep(actual_delay)
 
                 # Check if duration limit reached
                 if self._check_duration_complete(
-                    duration, start_time, on_status_changed,
-                    on_stats_updated, notify_when_done
+                    duration, start_time, on_status_changed, notify_when_done
                 ):
                     break
 
@@ -171,7 +184,7 @@ class Clicker:
         last_status = None
 
         while True:
-            x, y = pyautogui.position()
+            x, y = self._input.position()
             if not (x1 <= x <= x2 and y1 <= y <= y2):
                 on_status_changed(CLICKER_RESUMED)
                 return True
@@ -180,7 +193,7 @@ class Clicker:
             if last_status != "waiting":
                 on_status_changed(CLICKER_WAITING)
                 last_status = "waiting"
-            time.sleep(0.05)
+            self._time.sleep(0.05)
 
     def _handle_mouse_interrupt(
         self,
@@ -188,16 +201,16 @@ class Clicker:
         on_status_changed: Callable[[str], None]
     ) -> tuple[bool, dict]:
         """Check for manual mouse movement, handle pause/resume. Returns (should_continue, state)."""
-        current_pos = pyautogui.position()
+        current_pos = self._input.position()
 
         # Check if mouse moved manually (not by automation)
         if current_pos != mouse_state['last_user_pos']:
             if current_pos != mouse_state['last_auto_pos']:
-                mouse_state['last_manual_move'] = time.time()
+                mouse_state['last_manual_move'] = self._time.monotonic()
                 mouse_state['is_paused'] = True
 
         # Auto-resume after 3 seconds of no manual movement
-        if mouse_state['is_paused'] and (time.time() - mouse_state['last_manual_move'] > 3):
+        if mouse_state['is_paused'] and (self._time.monotonic() - mouse_state['last_manual_move'] > 3):
             mouse_state['is_paused'] = False
 
         mouse_state['last_user_pos'] = current_pos
@@ -207,7 +220,7 @@ class Clicker:
             if mouse_state['last_status'] != "paused":
                 on_status_changed(CLICKER_PAUSED)
                 mouse_state['last_status'] = "paused"
-            time.sleep(0.1)
+            self._time.sleep(0.1)
             return False, mouse_state
         else:
             if mouse_state['last_status'] != "running":
@@ -241,7 +254,7 @@ class Clicker:
         click_type: str
     ) -> tuple[int, int]:
         """Execute clicking with optional pattern. Returns last position."""
-        last_pos = pyautogui.position()
+        last_pos = self._input.position()
 
         for _ in range(repeat):
             if self.stop_event.is_set():
@@ -253,48 +266,49 @@ class Clicker:
 
             # Move to fixed position if specified
             if fixed_x is not None and fixed_y is not None:
-                pyautogui.moveTo(fixed_x, fixed_y)
+                self._input.moveTo(fixed_x, fixed_y)
 
-            # Perform click
+            # Perform click (timed for the latency series)
+            click_start = self._time.perf_counter()
             if click_type == "double":
-                pyautogui.doubleClick()
+                self._input.doubleClick()
             else:
-                pyautogui.click(button=click_type)
-
-            # Update click counter
+                self._input.click(button=click_type)
+            click_end = self._time.perf_counter()
+            if self.series is not None:
+                self.series.record(click_end, click_end - click_start)
+            if self.rates is not None:
+                self.rates.record(click_end)
+            if self.intervals is not None and self._last_click_end is not None:
+                self.intervals.record(click_end - self._last_click_end)
+            self._last_click_end = click_end
+
+            # Update click counter and log where the click happened
+            position = (fixed_x, fixed_y) if fixed_x is not None and fixed_y is not None else last_pos
+            if self.event_log is not None:
+                scheduled = click_start if self._deadline is None else self._deadline
+                self.event_log.record(
+                    click_start + self._wall_offset, position[0], position[1], click_type, scheduled + self._wall_offset
+                )
+            self._deadline = click_end  # Repeats are due right after this click
             with self._clicks_lock:
                 self.total_clicks += 1
+                self.lifetime_clicks += 1
+                if len(self._click_log) < 2 * CLICK_LOG_LIMIT:
+                    self._click_log.extend(position)
 
         return last_pos
 
-    def _update_stats_if_needed(
-        self,
-        last_stats_update: float,
-        on_stats_updated: Callable[[int, float], None]
-    ) -> float:
-        """Update stats if 0.5s passed. Returns updated timestamp."""
-        current_time = time.time()
-        if current_time - last_stats_update >= 0.5:
-            with self._clicks_lock:
-                clicks_copy = self.total_clicks
-            on_stats_updated(clicks_copy, self._calculate_click_rate())
-            return current_time
-        return last_stats_update
-
     def _check_duration_complete(
         self,
         duration: int,
         start_time: float,
         on_status_changed: Callable[[str], None],
-        on_stats_updated: Callable[[int, float], None],
         notify_when_done: bool
     ) -> bool:
         """Check if duration reached. Returns True if should stop."""
-        if duration > 0 and (time.time() - start_time) >= duration:
+        if duration > 0 and (self._time.monotonic() - start_time) >= duration:
             self.stop_event.set()
-            with self._clicks_lock:
-                clicks_copy = self.total_clicks
-            on_stats_updated(clicks_copy, self._calculate_click_rate())
             on_status_changed(CLICKER_COMPLETED)
             if notify_when_done and self._notify_callback:
                 self._notify_callback(CLICKER_COMPLETED)
@@ -304,11 +318,11 @@ class Clicker:
 
     def _apply_pattern(self, pattern: str, size: int) -> tuple[int, int]:
         """Apply movement pattern and return new position (x, y)"""
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = self._input.size()
         center_x, center_y = screen_width // 2, screen_height // 2
 
         radius = size
-        t = time.time()
+        t = self._time.time()
         x, y = center_x, center_y
 
         # === Circle pattern ===
@@ -346,8 +360,8 @@ class Clicker:
 
         # === Random pattern ===
         elif pattern == "random":
-            x = center_x + random.randint(-radius, radius)
-            y = center_y + random.randint(-radius, radius)
+            x = center_x + self._random.randint(-radius, radius)
+            y = center_y + self._random.randint(-radius, radius)
 
         # === Spiral pattern ===
         elif pattern == "spiral":
@@ -375,19 +389,21 @@ class Clicker:
         x = max(0, min(x, screen_width - 1))
         y = max(0, min(y, screen_height - 1))
 
-        pyautogui.moveTo(x, y, duration=0)
+        self._input.moveTo(x, y, duration=0)
         return (x, y)
 
 
-    def _calculate_click_rate(self) -> float:
-        """Calculate clicks per second (thread-safe)"""
+    def drain_click_positions(self) -> array:
+        """Take the click positions logged since the last call (flat x, y array)"""
+        with self._clicks_lock:
+            log, self._click_log = self._click_log, array("i")
+        return log
+
+    def snapshot(self) -> dict:
+        """Current counters for the stats pipeline (thread-safe; the GUI pulls these on its own timer)"""
         with self._clicks_lock:
-            if not self.session_start:
-                return 0.0
-            elapsed = time.time() - self.session_start
-            if elapsed > 0:
-                return self.total_clicks / elapsed
-        return 0.0
+            total_clicks = self.total_clicks
+        return {"total_clicks": total_clicks, "running": not self.stop_event.is_set()}
 
     def stop(self) -> None:
         """Stop the clicking thread"""
@@ -0,0 +1,115 @@
+# autoclicker/logic/debounced_writer.py
+"""Debounced Writer - Coalesced, atomic file writes on a background thread"""
+
+import atexit
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+# A file is written once no change arrived for this long (seconds) ...
+DEBOUNCE_SECONDS = 0.5
+
+# ... but at the latest this long after its first unwritten change
+MAX_DEBOUNCE_SECONDS = 2.0
+
+
+def write_atomic(path: Union[str, Path], data: bytes) -> None:
+    """Replace a file in one step: write a temp file next to it, fsync, rename.
+
+    Readers (and a crash at any point) see either the old or the new file,
+    never a partial one.
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.tmp")  # Fixed name: a file left by a crash is overwritten next time
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+    # Make the rename itself durable (POSIX; Windows has no directory handles)
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+
+class DebouncedWriter:
+    """Writes files on a background thread, coalescing bursts of changes.
+
+    schedule(path, render) replaces any pending write of the same path;
+    render() is called on the writer thread once the file has been quiet
+    for DEBOUNCE_SECONDS (at most MAX_DEBOUNCE_SECONDS after its first
+    change), so a burst of saves costs one serialisation and one atomic
+    write. flush() writes everything pending right away and also runs at
+    interpreter exit.
+    """
+
+    def __init__(self, delay: float = DEBOUNCE_SECONDS, max_delay: float = MAX_DEBOUNCE_SECONDS):
+        self.delay = delay
+        self.max_delay = max_delay
+        self._pending: Dict[Path, Callable[[], bytes]] = {}
+        self._first_change = 0.0
+        self._last_change = 0.0
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # Batches are taken and written in order
+        self._thread: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
+    def schedule(self, path: Union[str, Path], render: Callable[[], bytes]) -> None:
+        """Write render() to path soon (replaces a pending write of the same file)"""
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_change = now
+            self._pending[Path(path)] = render
+            self._last_change = now
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="DebouncedWriter", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        """Writer thread: wait until pending writes are due, then write them"""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    due = min(self._last_change + self.delay, self._first_change + self.max_delay)
+                    remaining = due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending files now, on the calling thread"""
+        with self._write_lock:
+            with self._cond:
+                batch, self._pending = self._pending, {}
+            for path, render in batch.items():
+                try:
+                    write_atomic(path, render())
+                except Exception as e:
+                    print(f"[ERROR] Failed to write {path}: {e}")
+
+    def pending(self) -> bool:
+        """True while changes are waiting to be written"""
+        with self._cond:
+            return bool(self._pending)
@@ -0,0 +1,317 @@
+# autoclicker/logic/dry_run.py
+"""Dry Run - Simulate macros and clicker settings on a virtual clock without real input"""
+
+import heapq
+import random
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .click_heatmap import HEATMAP_BATCH, ClickHeatmap
+from .clicker import Clicker
+from .interval_histogram import IntervalHistogram
+from .macro_player import BUTTON_NAMES, iter_program
+
+# Simulated seconds one clicker input call takes (default: free, timing is the delay alone)
+ACTION_COST = 0.0
+
+# Cost assumed instead when the delay is 0 too; otherwise the clock would never advance.
+# Reported as report["action_cost"] so the timing is not mistaken for a measurement.
+ZERO_DELAY_ACTION_COST = 0.001
+
+# Simulated run length for clicker settings without a duration (0 = until stopped)
+DEFAULT_HORIZON = 3600.0
+
+# Number of longest gaps listed in a report
+REPORT_GAPS = 5
+
+# Clicks listed individually in a report (all clicks are counted and binned in its heatmap)
+CLICK_SAMPLE = 1000
+
+# Simulated input actions at most; a run reaching this is stopped and reported as truncated
+MAX_ACTIONS = 500_000
+
+# Screen assumed when the real one is unknown
+DEFAULT_SCREEN = {"width": 1920, "height": 1080}
+
+
+class VirtualClock:
+    """Stand-in for the time module: time(), perf_counter() and monotonic() read and
+    sleep() advances simulated seconds.
+
+    on_limit is called whenever the clock reaches limit (used to stop a run).
+    """
+
+    def __init__(self, limit: Optional[float] = None, on_limit=None):
+        self.now = 0.0
+        self.limit = limit
+        self.on_limit = on_limit
+
+    def time(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.now += seconds
+        if self.limit is not None and self.now >= self.limit and self.on_limit:
+            self.on_limit()
+
+
+class Timeline:
+    """Aggregates of the input actions of a simulated run, updated per action.
+
+    Memory does not grow with the number of actions: counts per kind and
+    per second, the longest gaps and a click heatmap are kept, plus the
+    first CLICK_SAMPLE clicks. After max_actions actions on_full is called
+    (used to stop the run) and the report is marked truncated.
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        screen: Dict[str, int],
+        max_actions: int = MAX_ACTIONS,
+        on_full: Optional[Callable[[], None]] = None,
+        gaps: int = REPORT_GAPS,
+    ):
+        self.clock = clock
+        self.max_actions = max_actions
+        self.on_full = on_full
+        self.truncated = False
+        self.actions = 0
+        self.by_kind: Dict[str, int] = {}
+        self.per_second: List[int] = []
+        self.last_time: Optional[float] = None
+        self._gaps = gaps
+        self._longest: List[Tuple[float, float]] = []  # Min-heap of (length, start)
+        self.click_count = 0
+        self.clicks: List[Tuple[float, int, int, str]] = []
+        self.heatmap = ClickHeatmap(screen)
+        self._xs, self._ys = array("d"), array("d")
+
+    def add(self, kind: str) -> None:
+        """Record one action at the current simulated time"""
+        now = self.clock.now
+        if self.actions >= self.max_actions:
+            # The run is stopped at the next check; actions until then are not counted
+            if not self.truncated:
+                self.truncated = True
+                if self.on_full:
+                    self.on_full()
+            return
+        self.actions += 1
+        self.by_kind[kind] = self.by_kind.get(kind, 0) + 1
+
+        second = int(now)
+        per_second = self.per_second
+        if second >= len(per_second):
+            per_second.extend([0] * (second + 1 - len(per_second)))
+        per_second[second] += 1
+
+        if self.last_time is not None:
+            gap = (now - self.last_time, self.last_time)
+            if len(self._longest) < self._gaps:
+                heapq.heappush(self._longest, gap)
+            elif gap > self._longest[0]:
+                heapq.heapreplace(self._longest, gap)
+        self.last_time = now
+
+    def add_click(self, x: int, y: int, button: str) -> None:
+        """Record a click (button press) and where it happened"""
+        self.add("click")
+        if self.truncated:
+            return
+        self.click_count += 1
+        if len(self.clicks) < CLICK_SAMPLE:
+            self.clicks.append((self.clock.now, x, y, button))
+        self._xs.append(x)
+        self._ys.append(y)
+        if len(self._xs) >= HEATMAP_BATCH:
+            self._bin_clicks()
+
+    def _bin_clicks(self) -> None:
+        """Add buffered click positions to the heatmap"""
+        self.heatmap.add(self._xs, self._ys)
+        self._xs, self._ys = array("d"), array("d")
+
+    def report(self) -> Dict[str, Any]:
+        """Duration, actions per second, click positions and longest gaps"""
+        self._bin_clicks()
+        return {
+            "duration": self.last_time or 0.0,
+            "actions": self.actions,
+            "truncated": self.truncated,
+            "by_kind": dict(self.by_kind),
+            "per_second": list(self.per_second),
+            "peak_rate": max(self.per_second, default=0),
+            "click_count": self.click_count,
+            "clicks": list(self.clicks),
+            "heatmap": self.heatmap,
+            "longest_gaps": [{"start": start, "length": length} for length, start in sorted(self._longest, reverse=True)],
+        }
+
+
+class NullMouse:
+    """pynput mouse.Controller stand-in recording to a Timeline"""
+
+    def __init__(self, timeline: Timeline, screen: Dict[str, int]):
+        self._timeline = timeline
+        self._position = (screen["width"] // 2, screen["height"] // 2)
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return self._position
+
+    @position.setter
+    def position(self, value: Tuple[int, int]) -> None:
+        self._position = value
+        self._timeline.add("move")
+
+    def press(self, button) -> None:
+        self._timeline.add_click(*self._position, getattr(button, "name", str(button)))
+
+    def release(self, button) -> None:
+        self._timeline.add("release")
+
+    def scroll(self, dx: int, dy: int) -> None:
+        self._timeline.add("scroll")
+
+
+class NullKeyboard:
+    """pynput keyboard.Controller stand-in recording to a Timeline"""
+
+    def __init__(self, timeline: Timeline):
+        self._timeline = timeline
+
+    def press(self, key) -> None:
+        self._timeline.add("key_down")
+
+    def release(self, key) -> None:
+        self._timeline.add("key_up")
+
+
+class NullBackend:
+    """pyautogui stand-in for Clicker: records actions, each costs action_cost simulated seconds"""
+
+    def __init__(self, timeline: Timeline, clock: VirtualClock, screen: Dict[str, int], action_cost: float = ACTION_COST):
+        self._timeline = timeline
+        self._clock = clock
+        self._screen = (screen["width"], screen["height"])
+        self._position = (screen["width"] // 2, screen["height"] // 2)
+        self._cost = action_cost
+
+    def size(self) -> Tuple[int, int]:
+        return self._screen
+
+    def position(self) -> Tuple[int, int]:
+        return self._position
+
+    def moveTo(self, x: int, y: int, duration: float = 0) -> None:
+        self._position = (x, y)
+        self._timeline.add("move")
+        self._clock.sleep(self._cost + duration)
+
+    def click(self, button: str = "left") -> None:
+        self._timeline.add_click(*self._position, button)
+        self._clock.sleep(self._cost)
+
+    def doubleClick(self) -> None:
+        self.click("double")
+
+
+def _button_name(button_name) -> str:
+    """Recorded button name as played back (left for unknown names), without pynput"""
+    return button_name if button_name in BUTTON_NAMES else "left"
+
+
+def _key_name(key_name):
+    """Recorded key name unchanged (NullKeyboard only counts key events)"""
+    return key_name
+
+
+def simulate_macro(
+    events: Iterable[Dict[str, Any]],
+    speed: float = 1.0,
+    idle: Optional[Dict[str, float]] = None,
+    screen: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    """Run a macro through the playback compiler with null controllers and a virtual clock"""
+    clock = VirtualClock()
+    screen = screen or DEFAULT_SCREEN
+    timeline = Timeline(clock, screen)
+    program = iter_program(
+        events, NullMouse(timeline, screen), NullKeyboard(timeline), speed, idle,
+        resolve_button=_button_name, resolve_key=_key_name,
+    )
+
+    # Same schedule as run_program, minus the waiting: each step happens at its offset
+    for offset, action, args in program:
+        if offset > clock.now:
+            clock.now = offset
+        action(*args)
+        if timeline.truncated:
+            break
+
+    report = timeline.report()
+    report["time_saved"] = idle["saved"] if idle else 0.0
+    return report
+
+
+def simulate_clicker(
+    settings: Dict[str, Any],
+    horizon: float = DEFAULT_HORIZON,
+    seed: Optional[int] = None,
+    screen: Optional[Dict[str, int]] = None,
+    action_cost: float = ACTION_COST,
+) -> Dict[str, Any]:
+    """Run Clicker._click_loop with profile-style settings on a virtual clock.
+
+    Runs for the configured duration, or `horizon` seconds if it has none,
+    and stops early after MAX_ACTIONS actions (report["truncated"]).
+    Manual-move interrupts and the start-button wait do not apply.
+    report["action_cost"] is the simulated cost per input call that was used.
+    """
+    delay = settings.get("delay", 0.01)
+    if action_cost <= 0 and delay <= 0:
+        action_cost = ZERO_DELAY_ACTION_COST
+
+    clock = VirtualClock()
+    screen = screen or DEFAULT_SCREEN
+    timeline = Timeline(clock, screen)
+    backend = NullBackend(timeline, clock, screen, action_cost)
+    clicker = Clicker(clock=clock, backend=backend, rng=random.Random(seed))
+    timeline.on_full = clicker.stop_event.set
+    clicker.intervals = IntervalHistogram()
+
+    duration = int(settings.get("duration", 0))
+    clock.limit = duration if duration > 0 else horizon
+    clock.on_limit = clicker.stop_event.set
+    clicker.stop_event.clear()
+    clicker.session_start = clock.time()
+
+    def ignore(*args, **kwargs):
+        pass
+
+    clicker._click_loop(
+        delay=delay,
+        duration=duration,
+        fixed_x=settings.get("fixed_x"),
+        fixed_y=settings.get("fixed_y"),
+        click_type=settings.get("click_type", "left"),
+        pattern=settings.get("pattern", "none"),
+        pattern_size=settings.get("pattern_size", 100),
+        repeat=settings.get("repeat", 1),
+        random_delay=settings.get("random_delay", False),
+        click_while_pattern=settings.get("click_while_pattern", False),
+        on_status_changed=ignore,
+    )
+
+    report = timeline.report()
+    report["intervals"] = clicker.intervals.summary()
+    report["action_cost"] = action_cost
+    return report
@@ -0,0 +1,262 @@
+# autoclicker/logic/interval_histogram.py
+"""Interval Histogram - Log-bucketed (HDR-style) histogram of click intervals"""
+
+import math
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Linear sub-buckets per power of two (2**SUB_BUCKET_BITS): values are kept
+# with a relative error below 1 / 2**(SUB_BUCKET_BITS - 1), i.e. < 1 %
+SUB_BUCKET_BITS = 8
+
+# Largest tracked interval in microseconds (~71 minutes); larger ones count as this
+MAX_VALUE_US = (1 << 32) - 1
+
+# Percentiles shown in the Statistics tab and exports
+REPORT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+_HALF = 1 << (SUB_BUCKET_BITS - 1)
+_SIZE = (max(0, MAX_VALUE_US.bit_length() - SUB_BUCKET_BITS) + 2) * _HALF
+
+# to_bytes() layout: version, sub-bucket bits, count, min/max (us), sum, sum of squares, slot count;
+# then the non-empty slot indexes (uint32) and their counts (uint64), little-endian, zlib-compressed
+_BLOB_VERSION = 1
+_BLOB_HEADER = struct.Struct("<BBQQQddI")
+
+
+def _index(value: int) -> int:
+    """Counts slot of a value (microseconds)"""
+    bucket = max(0, value.bit_length() - SUB_BUCKET_BITS)
+    return (bucket << (SUB_BUCKET_BITS - 1)) + (value >> bucket)
+
+
+def _highest_value(index: int) -> int:
+    """Largest value (microseconds) that falls into a slot"""
+    bucket = max(0, (index >> (SUB_BUCKET_BITS - 1)) - 1)
+    sub = index - (bucket << (SUB_BUCKET_BITS - 1))
+    return ((sub + 1) << bucket) - 1
+
+
+class IntervalHistogram:
+    """Click intervals in log-scaled buckets: constant memory, O(1) record().
+
+    Intervals are stored in microseconds. Histograms of different sessions
+    or jobs merge exactly with merge(), and round-trip through to_dict() /
+    from_dict() for storage.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all samples"""
+        with self._lock:
+            self._counts = array("Q", bytes(8 * _SIZE))
+            self.count = 0
+            self.min_us = 0
+            self.max_us = 0
+            self._sum = 0.0
+            self._sum_sq = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one interval"""
+        value = min(max(int(seconds * 1_000_000), 0), MAX_VALUE_US)
+        with self._lock:
+            self._counts[_index(value)] += 1
+            if not self.count or value < self.min_us:
+                self.min_us = value
+            if value > self.max_us:
+                self.max_us = value
+            self.count += 1
+            self._sum += value
+            self._sum_sq += value * value
+
+    def record_many(self, seconds: Iterable[float]) -> None:
+        """Add many intervals under one lock acquisition"""
+        values = [min(max(int(s * 1_000_000), 0), MAX_VALUE_US) for s in seconds]
+        if not values:
+            return
+        with self._lock:
+            counts = self._counts
+            for value in values:
+                counts[_index(value)] += 1
+            low, high = min(values), max(values)
+            self.min_us = low if not self.count else min(self.min_us, low)
+            self.max_us = max(self.max_us, high)
+            self.count += len(values)
+            self._sum += sum(values)
+            self._sum_sq += sum(v * v for v in values)
+
+    def copy(self) -> "IntervalHistogram":
+        """Independent copy; this histogram is locked only while its counts are copied"""
+        duplicate = IntervalHistogram()
+        with self._lock:
+            duplicate._counts = array("Q", self._counts)
+            duplicate.count, duplicate.min_us, duplicate.max_us = self.count, self.min_us, self.max_us
+            duplicate._sum, duplicate._sum_sq = self._sum, self._sum_sq
+        return duplicate
+
+    def merge(self, other: "IntervalHistogram") -> None:
+        """Add all samples of another histogram"""
+        with other._lock:
+            counts, count = array("Q", other._counts), other.count
+            min_us, max_us, total, total_sq = other.min_us, other.max_us, other._sum, other._sum_sq
+        if not count:
+            return
+        with self._lock:
+            mine = self._counts
+            for i, c in enumerate(counts):
+                if c:
+                    mine[i] += c
+            self.min_us = min_us if not self.count else min(self.min_us, min_us)
+            self.max_us = max(self.max_us, max_us)
+            self.count += count
+            self._sum += total
+            self._sum_sq += total_sq
+
+    def percentiles(self, percentiles: Sequence[float] = REPORT_PERCENTILES) -> Dict[float, float]:
+        """Interval (seconds) at or below which each percentile of samples falls, in one pass"""
+        with self._lock:
+            if not self.count:
+                return {p: 0.0 for p in percentiles}
+            targets = sorted((max(1, math.ceil(p / 100 * self.count)), p) for p in percentiles)
+            result = {}
+            seen = 0
+            pending = iter(targets)
+            target, p = next(pending)
+            for index, c in enumerate(self._counts):
+                if not c:
+                    continue
+                seen += c
+                while seen >= target:
+                    result[p] = min(_highest_value(index), self.max_us) / 1_000_000
+                    nxt = next(pending, None)
+                    if nxt is None:
+                        return result
+                    target, p = nxt
+            return result
+
+    def cumulative(self, bounds: Sequence[float]) -> Tuple[List[int], int, float]:
+        """Samples at or below each bound (seconds, ascending), total count and sum in seconds.
+
+        A slot is counted under the first bound its highest value fits, so
+        counts are exact up to the slot resolution (< 1 %).
+        """
+        limits = [bound * 1_000_000 for bound in bounds]
+        with self._lock:
+            result = [0] * len(limits)
+            position = 0
+            for index, c in enumerate(self._counts):
+                if not c:
+                    continue
+                highest = _highest_value(index)
+                while position < len(limits) and highest > limits[position]:
+                    position += 1
+                if position == len(limits):
+                    break
+                result[position] += c
+            count, total = self.count, self._sum
+        for i in range(1, len(result)):
+            result[i] += result[i - 1]
+        return result, count, total / 1_000_000
+
+    def summary(self) -> Dict[str, Any]:
+        """Count, percentiles, min/max, mean and jitter (standard deviation) in seconds"""
+        with self._lock:
+            count, total, total_sq = self.count, self._sum, self._sum_sq
+            min_us, max_us = self.min_us, self.max_us
+        mean = total / count if count else 0.0
+        jitter = math.sqrt(max(0.0, total_sq / count - mean * mean)) if count else 0.0
+        return {
+            "count": count,
+            "percentiles": self.percentiles(),
+            "min": min_us / 1_000_000,
+            "max": max_us / 1_000_000,
+            "mean": mean / 1_000_000,
+            "jitter": jitter / 1_000_000,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form with only non-empty slots"""
+        with self._lock:
+            return {
+                "version": 1,
+                "sub_bucket_bits": SUB_BUCKET_BITS,
+                "count": self.count,
+                "min_us": self.min_us,
+                "max_us": self.max_us,
+                "sum": self._sum,
+                "sum_sq": self._sum_sq,
+                "counts": [[i, c] for i, c in enumerate(self._counts) if c],
+            }
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form (only non-empty slots, compressed), e.g. for database storage"""
+        with self._lock:
+            slots = array("I", (i for i, c in enumerate(self._counts) if c))
+            counts = array("Q", (self._counts[i] for i in slots))
+            header = _BLOB_HEADER.pack(_BLOB_VERSION, SUB_BUCKET_BITS, self.count, self.min_us, self.max_us, self._sum, self._sum_sq, len(slots))
+        if sys.byteorder == "big":
+            slots.byteswap()
+            counts.byteswap()
+        return zlib.compress(header + slots.tobytes() + counts.tobytes())
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "IntervalHistogram":
+        """Rebuild a histogram stored with to_bytes()"""
+        data = zlib.decompress(blob)
+        version, bits, count, min_us, max_us, total, total_sq, n = _BLOB_HEADER.unpack_from(data)
+        if version != _BLOB_VERSION or bits != SUB_BUCKET_BITS:
+            raise ValueError("Incompatible interval histogram layout")
+        slots, counts = array("I"), array("Q")
+        offset = _BLOB_HEADER.size
+        slots.frombytes(data[offset:offset + 4 * n])
+        counts.frombytes(data[offset + 4 * n:offset + 12 * n])
+        if len(counts) != n:
+            raise ValueError("Truncated interval histogram")
+        if sys.byteorder == "big":
+            slots.byteswap()
+            counts.byteswap()
+        histogram = cls()
+        for index, c in zip(slots, counts):
+            if index >= _SIZE:
+                raise ValueError(f"Invalid histogram slot {index}")
+            histogram._counts[index] = c
+        histogram.count, histogram.min_us, histogram.max_us = count, min_us, max_us
+        histogram._sum, histogram._sum_sq = total, total_sq
+        return histogram
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IntervalHistogram":
+        """Rebuild a histogram stored with to_dict()"""
+        if data.get("sub_bucket_bits") != SUB_BUCKET_BITS:
+            raise ValueError("Incompatible interval histogram layout")
+        histogram = cls()
+        for index, c in data.get("counts", []):
+            if not 0 <= index < _SIZE or c < 0:
+                raise ValueError(f"Invalid histogram slot {index}")
+            histogram._counts[index] += c
+        histogram.count = int(data.get("count", 0))
+        histogram.min_us = int(data.get("min_us", 0))
+        histogram.max_us = int(data.get("max_us", 0))
+        histogram._sum = float(data.get("sum", 0.0))
+        histogram._sum_sq = float(data.get("sum_sq", 0.0))
+        return histogram
+
+
+def percentile_name(percentile: float) -> str:
+    """Short label of a percentile, e.g. 'p99.9'"""
+    return f"p{percentile:g}"
+
+
+def merge_histograms(histograms: Iterable[IntervalHistogram]) -> IntervalHistogram:
+    """One histogram holding the samples of all given ones"""
+    merged = IntervalHistogram()
+    for histogram in histograms:
+        merged.merge(histogram)
+    return merged
@@ -0,0 +1,177 @@
+# autoclicker/logic/macro_bulk.py
+"""Bulk Macro Operations - Validate, convert and re-index a macro directory in parallel"""
+
+import json
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from .macro_index import MacroIndex, scan_macro_file
+from .macro_io import MACRO_CODECS, ZSTD_AVAILABLE, MacroWriter, RawMacroReader, codec_for_filename, split_macro_filename
+
+# validate: check every event + re-index, convert: rewrite with another codec + re-index
+BULK_OPERATIONS = ("validate", "convert", "reindex")
+
+# Files queued per worker process (keeps workers busy, bounds what an interrupt discards)
+INFLIGHT_PER_WORKER = 4
+
+# Index entries collected before they are written to the macro index
+INDEX_FLUSH_EVERY = 500
+
+# (file name, mtime_ns, size) - identifies one version of a file in the journal
+FileKey = Tuple[str, int, int]
+
+
+def list_macro_files(directory: Union[str, Path]) -> List[Path]:
+    """Macro files of a directory sorted by name (index, journal and temp files skipped)"""
+    with os.scandir(directory) as it:
+        return sorted(Path(e.path) for e in it if e.is_file() and split_macro_filename(e.name) is not None)
+
+
+def _file_key(path: Path) -> FileKey:
+    """Journal key of the current version of a file"""
+    stat = path.stat()
+    return (path.name, stat.st_mtime_ns, stat.st_size)
+
+
+def convert_macro_file(path: Path, codec: str) -> Path:
+    """Rewrite a macro with another storage codec (events are copied undecoded)"""
+    target = path.with_name(split_macro_filename(path.name) + MACRO_CODECS[codec])
+    reader = RawMacroReader(path)
+    batches = reader.batches()
+    # Header fields are known once the first batch was read
+    first = next(batches, [])
+    with MacroWriter(target, reader.header, codec) as writer:
+        writer.write_encoded(first)
+        for batch in batches:
+            writer.write_encoded(batch)
+    path.unlink()
+    return target
+
+
+def process_macro_file(path: str, operation: str, codec: Optional[str] = None) -> Dict[str, Any]:
+    """Worker: run one operation on one macro file. Returns the index entry and journal key."""
+    path = Path(path)
+    if operation == "convert" and codec_for_filename(path.name) != codec:
+        path = convert_macro_file(path, codec)
+    entry = scan_macro_file(path, validate=(operation == "validate"))
+    return {"entry": entry, "key": _file_key(path)}
+
+
+def _ignore_interrupts() -> None:
+    """Worker initializer: Ctrl+C is handled by the parent, which lets running files finish"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _read_journal(path: Path) -> Set[FileKey]:
+    """Keys of files completed by an earlier, interrupted run"""
+    done: Set[FileKey] = set()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    done.add(tuple(json.loads(line)))
+                except ValueError:
+                    pass  # Line cut short by a crash
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def run_bulk(
+    directory: Union[str, Path],
+    operation: str,
+    codec: Optional[str] = None,
+    workers: Optional[int] = None,
+    resume: bool = True,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run operation on every macro in directory using a process pool.
+
+    Each completed file is appended to a journal in the directory, so a run
+    that was interrupted (Ctrl+C, crash) skips unchanged finished files when
+    started again; the journal is removed after a run without errors.
+    Returns a summary with counts, elapsed seconds and per-file errors.
+    """
+    if operation not in BULK_OPERATIONS:
+        raise ValueError(f"Unknown bulk operation: {operation}")
+    if operation == "convert" and (codec not in MACRO_CODECS or (codec == "zstd" and not ZSTD_AVAILABLE)):
+        raise ValueError(f"Unsupported macro codec: {codec}")
+
+    directory = Path(directory)
+    journal_path = directory / (f".bulk-{operation}-{codec}.journal" if operation == "convert" else f".bulk-{operation}.journal")
+    done = _read_journal(journal_path) if resume else set()
+    files = list_macro_files(directory)
+    pending = [path for path in files if _file_key(path) not in done]
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    summary: Dict[str, Any] = {
+        "operation": operation,
+        "files": len(files),
+        "skipped": len(files) - len(pending),
+        "processed": 0,
+        "events": 0,
+        "bytes": 0,
+        "errors": {},
+        "seconds": 0.0,
+        "interrupted": False,
+    }
+    index = MacroIndex(directory)
+    entries: Dict[str, Dict[str, Any]] = {}
+    start = time.perf_counter()
+
+    def collect(future: Future, path: Path) -> None:
+        """Record the outcome of one finished file"""
+        try:
+            result = future.result()
+        except Exception as e:
+            summary["errors"][path.name] = str(e) or e.__class__.__name__
+            return
+        entry = result["entry"]
+        entries[entry["name"]] = entry
+        summary["processed"] += 1
+        summary["events"] += entry["event_count"]
+        summary["bytes"] += entry["size"]
+        journal.write(json.dumps(result["key"]) + "\n")
+
+    # Line-buffered, so every finished file is on disk before the next one is reported
+    with open(journal_path, "a" if resume else "w", encoding="utf-8", buffering=1) as journal:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_ignore_interrupts)
+        running: Dict[Future, Path] = {}
+        queue = iter(pending)
+        try:
+            while True:
+                while len(running) < workers * INFLIGHT_PER_WORKER:
+                    path = next(queue, None)
+                    if path is None:
+                        break
+                    running[pool.submit(process_macro_file, str(path), operation, codec)] = path
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    collect(future, running.pop(future))
+                if len(entries) >= INDEX_FLUSH_EVERY:
+                    index.put_many(entries)
+                    entries.clear()
+                if on_progress:
+                    summary["seconds"] = time.perf_counter() - start
+                    on_progress(summary)
+        except KeyboardInterrupt:
+            summary["interrupted"] = True
+        finally:
+            # Queued files are dropped; files already being processed are finished and kept
+            pool.shutdown(wait=True, cancel_futures=True)
+            for future, path in running.items():
+                if not future.cancelled():
+                    collect(future, path)
+            index.put_many(entries)
+
+    summary["seconds"] = time.perf_counter() - start
+    if not summary["interrupted"] and not summary["errors"]:
+        journal_path.unlink()
+    return summary
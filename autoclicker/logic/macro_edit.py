@@ -0,0 +1,263 @@
+# autoclicker/logic/macro_edit.py
+"""Macro Editing - Trim, cut, concatenate, splice and retime saved macros"""
+
+import re
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .macro_geometry import GEOMETRY_FIELDS
+from .macro_io import MacroFormatError, MacroWriter, RawMacroReader, codec_for_filename, read_macro_header, split_macro_filename
+
+# Slack for comparing user-entered seconds with float timestamps
+TIME_EPSILON = 1e-6
+
+_TIMESTAMP_RE = re.compile(r'"timestamp":\s*(-?[0-9][0-9.eE+-]*)')
+_TIMESTAMP_SPLIT_RE = re.compile(r'^(.*"timestamp":\s*)(-?[0-9][0-9.eE+-]*)(.*)$', re.MULTILINE)
+
+# A batch of encoded events with their timestamps
+Batch = Tuple[List[str], List[float]]
+
+
+def _batches(source: Union[str, Path]) -> Iterator[Batch]:
+    """Encoded event batches with timestamps, parsed batch-wise (events stay undecoded)"""
+    for lines in RawMacroReader(source).batches():
+        stamps = list(map(float, _TIMESTAMP_RE.findall("\n".join(lines))))
+        if len(stamps) != len(lines):
+            raise MacroFormatError("Macro event without timestamp")
+        yield lines, stamps
+
+
+def _retimed(lines: List[str], stamps: Iterable[float]) -> List[str]:
+    """Replace the timestamp of each encoded event"""
+    parts = _TIMESTAMP_SPLIT_RE.findall("\n".join(lines))
+    return [f"{head}{ts!r}{tail}" for (head, _, tail), ts in zip(parts, stamps)]
+
+
+def _shifted(lines: List[str], stamps: List[float], delta: float, floor: Optional[float] = None) -> Batch:
+    """Move encoded events by delta seconds, never before floor (the last timestamp already written).
+
+    Shifting by a difference of float timestamps can land an event a
+    rounding error before its predecessor, so shifted events are clamped.
+    """
+    if not lines or (not delta and (floor is None or stamps[0] >= floor)):
+        return lines, stamps
+    new = [ts + delta for ts in stamps]
+    if floor is not None and new[0] < floor:
+        new = [ts if ts >= floor else floor for ts in new]
+    return _retimed(lines, new), new
+
+
+def _shared_geometry(sources: List[Union[str, Path]]) -> Dict[str, object]:
+    """Screen geometry fields for the result; sources must use the same coordinate space"""
+    geometry: Dict[str, object] = {}
+    for source in sources:
+        header = read_macro_header(source)
+        fields = {key: header[key] for key in GEOMETRY_FIELDS if key in header}
+        if not fields:
+            continue
+        if not geometry:
+            geometry = fields
+        elif fields.get("coordinates") != geometry.get("coordinates") or (
+            fields.get("coordinates") != "normalized" and fields.get("screen") != geometry.get("screen")
+        ):
+            raise MacroFormatError("Macros were recorded with different screen coordinates")
+    return geometry
+
+
+def _write(
+    target: Union[str, Path],
+    name: str,
+    sources: List[Union[str, Path]],
+    edit: str,
+    batches: Iterable[Batch],
+) -> Dict[str, int]:
+    """Write encoded event batches to target, keeping the codec of the first source.
+
+    Raises MacroFormatError (and leaves target untouched) if the result is
+    not in timestamp order, so an edit never writes a file check_events rejects.
+    """
+    header = {
+        "name": name,
+        "created": datetime.now().isoformat(),
+        "edited_from": [split_macro_filename(Path(source).name) for source in sources],
+        "edit": edit,
+        **_shared_geometry(sources),
+    }
+    codec = codec_for_filename(Path(sources[0]).name)
+    previous = float("-inf")
+    with MacroWriter(target, header, codec) as writer:
+        for lines, stamps in batches:
+            if not lines:
+                continue
+            for number, ts in enumerate(stamps, writer.event_count + 1):
+                if ts < previous:
+                    raise MacroFormatError(f"Edited macro: event {number} goes backwards in time")
+                previous = ts
+            writer.write_encoded(lines)
+        return {"events": writer.event_count}
+
+
+# Edits below take times in seconds relative to the first event and assume
+# events are in timestamp order (as recorded).
+
+def trim_macro(source, target, name: str, start: float, end: float) -> Dict[str, int]:
+    """Keep only events between start and end seconds"""
+    def batches():
+        t0 = None
+        for lines, stamps in _batches(source):
+            if t0 is None:
+                t0 = stamps[0]
+            lo = bisect_left(stamps, t0 + start - TIME_EPSILON)
+            hi = bisect_right(stamps, t0 + end + TIME_EPSILON)
+            if lo < hi:
+                yield lines[lo:hi], stamps[lo:hi]
+            if hi < len(lines):
+                return
+
+    return _write(target, name, [source], "trim", batches())
+
+
+def cut_macro(source, target, name: str, start: float, end: float) -> Dict[str, int]:
+    """Remove events between start and end seconds and close the gap"""
+    removed = max(0.0, end - start)
+
+    def batches():
+        t0 = None
+        last: Optional[float] = None
+        for lines, stamps in _batches(source):
+            if t0 is None:
+                t0 = stamps[0]
+            lo = bisect_left(stamps, t0 + start - TIME_EPSILON)
+            hi = bisect_left(stamps, t0 + end - TIME_EPSILON)
+            if lo:
+                last = stamps[lo - 1]
+            tail_lines, tail_stamps = _shifted(lines[hi:], stamps[hi:], -removed, last)
+            if tail_stamps:
+                last = tail_stamps[-1]
+            yield lines[:lo] + tail_lines, stamps[:lo] + tail_stamps
+
+    return _write(target, name, [source], "cut", batches())
+
+
+def concat_macros(sources: List[Union[str, Path]], target, name: str, gap: float = 0.0) -> Dict[str, int]:
+    """Append macros one after another, `gap` seconds apart"""
+    if not sources:
+        raise ValueError("Nothing to concatenate")
+
+    def batches():
+        last_ts: Optional[float] = None
+        for source in sources:
+            delta = None
+            for lines, stamps in _batches(source):
+                if delta is None:
+                    delta = 0.0 if last_ts is None else last_ts + gap - stamps[0]
+                batch = _shifted(lines, stamps, delta, last_ts)
+                last_ts = batch[1][-1]
+                yield batch
+
+    return _write(target, name, list(sources), "concat", batches())
+
+
+def splice_macro(base, insert, target, name: str, at: float) -> Dict[str, int]:
+    """Insert a macro at `at` seconds into base; later base events move back by its length"""
+    def batches():
+        base_batches = _batches(base)
+        held: Optional[Batch] = None
+        t0 = None
+        last: Optional[float] = None
+        for lines, stamps in base_batches:
+            if t0 is None:
+                t0 = stamps[0]
+            split = bisect_left(stamps, t0 + at - TIME_EPSILON)
+            if split:
+                last = stamps[split - 1]
+                yield lines[:split], stamps[:split]
+            if split < len(lines):
+                held = (lines[split:], stamps[split:])
+                break
+
+        insert_start = (t0 if t0 is not None else 0.0) + at
+        delta = None
+        length = 0.0
+        for lines, stamps in _batches(insert):
+            if delta is None:
+                delta = insert_start - stamps[0]
+            length = stamps[-1] + delta - insert_start
+            batch = _shifted(lines, stamps, delta, last)
+            last = batch[1][-1]
+            yield batch
+
+        if held is not None:
+            for lines, stamps in chain([held], base_batches):
+                batch = _shifted(lines, stamps, length, last)
+                last = batch[1][-1]
+                yield batch
+
+    return _write(target, name, [base, insert], "splice", batches())
+
+
+def retime_macro(
+    source,
+    target,
+    name: str,
+    scale: float = 1.0,
+    shift_at: float = 0.0,
+    shift: float = 0.0,
+) -> Dict[str, int]:
+    """Scale all event spacing, then shift events from shift_at seconds on by `shift`.
+
+    A negative shift removes time, but never moves an event before the
+    one preceding it.
+    """
+    if scale <= 0:
+        raise ValueError("Scale must be positive")
+
+    def batches():
+        t0 = None
+        previous = None
+        for lines, stamps in _batches(source):
+            if t0 is None:
+                t0 = previous = stamps[0]
+            split = bisect_left(stamps, t0 + shift_at - TIME_EPSILON)
+            new = [t0 + (ts - t0) * scale for ts in stamps]
+            if split < len(new) and shift >= 0:
+                new[split:] = [ts + shift for ts in new[split:]]
+            elif split < len(new):
+                floor = new[split - 1] if split else previous
+                for i in range(split, len(new)):
+                    ts = new[i] + shift
+                    if ts < floor:
+                        ts = floor
+                    new[i] = floor = ts
+            previous = new[-1]
+            yield _retimed(lines, new), new
+
+    return _write(target, name, [source], "retime", batches())
+
+
+# Edit name -> (function, minimum number of source macros)
+EDIT_OPERATIONS = {
+    "trim": (trim_macro, 1),
+    "cut": (cut_macro, 1),
+    "concat": (concat_macros, 2),
+    "splice": (splice_macro, 2),
+    "retime": (retime_macro, 1),
+}
+
+
+def apply_edit(operation: str, sources: List[Union[str, Path]], target, name: str, **params) -> Dict[str, int]:
+    """Run one edit by name: concat takes all sources, splice inserts sources[1] into sources[0]"""
+    if operation not in EDIT_OPERATIONS:
+        raise ValueError(f"Unknown macro edit: {operation}")
+    func, min_sources = EDIT_OPERATIONS[operation]
+    if len(sources) < min_sources:
+        raise ValueError(f"Macro edit '{operation}' needs {min_sources} macros")
+
+    if operation == "concat":
+        return func(sources, target, name, **params)
+    if operation == "splice":
+        return func(sources[0], sources[1], target, name, **params)
+    return func(sources[0], target, name, **params)
@@ -0,0 +1,149 @@
+# autoclicker/logic/macro_geometry.py
+"""Macro Screen Geometry - Map recorded mouse coordinates onto the current screen"""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Stored coordinate spaces ("pixels" = screen pixels of the recording screen)
+COORDINATE_SPACES = ("pixels", "normalized")
+
+# Header fields describing the stored coordinates (copied when deriving macros)
+GEOMETRY_FIELDS = ("coordinates", "screen")
+
+# Decimals kept for normalized coordinates (sub-pixel even on 8K screens)
+NORMALIZED_DIGITS = 6
+
+# Events transformed per vectorised pass when streaming from disk
+TRANSFORM_BATCH = 4096
+
+# Affine map applied per axis: (scale_x, offset_x, scale_y, offset_y)
+Transform = Tuple[float, float, float, float]
+
+
+def screen_geometry() -> Optional[Dict[str, int]]:
+    """Size of the primary screen in pixels, or None if it cannot be queried"""
+    try:
+        import pyautogui  # Imported here so the mapping code works without a display
+        width, height = pyautogui.size()
+    except Exception:
+        return None
+    return {"width": int(width), "height": int(height)}
+
+
+def geometry_header(screen: Optional[Dict[str, int]], normalize: bool = False) -> Dict[str, Any]:
+    """Header fields describing how mouse coordinates of a macro are stored"""
+    header: Dict[str, Any] = {"coordinates": "normalized" if normalize and screen else "pixels"}
+    if screen:
+        header["screen"] = screen
+    return header
+
+
+def normalize_transform(screen: Dict[str, int]) -> Transform:
+    """Pixels -> [0, 1] pixel centres of the given screen"""
+    sx, sy = 1.0 / screen["width"], 1.0 / screen["height"]
+    return (sx, 0.5 * sx, sy, 0.5 * sy)
+
+
+def playback_transform(header: Dict[str, Any], current: Optional[Dict[str, int]]) -> Optional[Transform]:
+    """Stored coordinates -> current screen pixels. None if they can be used as stored.
+
+    Normalized macros are scaled to the current screen (or the recording screen
+    if the current one is unknown); pixel macros are rescaled pixel-centre to
+    pixel-centre when the recording screen differs from the current one.
+    """
+    recorded = header.get("screen")
+    if header.get("coordinates") == "normalized":
+        target = current or recorded
+        if not target:
+            return None
+        return (float(target["width"]), -0.5, float(target["height"]), -0.5)
+
+    if not recorded or not current or recorded == current:
+        return None
+    sx = current["width"] / recorded["width"]
+    sy = current["height"] / recorded["height"]
+    return (sx, 0.5 * sx - 0.5, sy, 0.5 * sy - 0.5)
+
+
+def apply_transform(
+    events: List[Dict[str, Any]],
+    transform: Transform,
+    bounds: Optional[Dict[str, int]] = None,
+    digits: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Return events with the affine map applied to every mouse_move at once.
+
+    With bounds the result is rounded to whole pixels inside the screen,
+    otherwise to `digits` decimals. Other events are passed through; the
+    input list and its dicts are not modified.
+    """
+    moves = [i for i, event in enumerate(events) if event.get("type") == "mouse_move"]
+    if not moves:
+        return events
+
+    sx, ox, sy, oy = transform
+    xs = [events[i]["x"] for i in moves]
+    ys = [events[i]["y"] for i in moves]
+
+    if NUMPY_AVAILABLE:
+        xs = np.asarray(xs, dtype=np.float64) * sx + ox
+        ys = np.asarray(ys, dtype=np.float64) * sy + oy
+        if bounds:
+            xs = np.clip(np.rint(xs), 0, bounds["width"] - 1).astype(np.int64)
+            ys = np.clip(np.rint(ys), 0, bounds["height"] - 1).astype(np.int64)
+        elif digits is not None:
+            xs, ys = np.round(xs, digits), np.round(ys, digits)
+        xs, ys = xs.tolist(), ys.tolist()
+    elif bounds:
+        max_x, max_y = bounds["width"] - 1, bounds["height"] - 1
+        xs = [min(max(round(x * sx + ox), 0), max_x) for x in xs]
+        ys = [min(max(round(y * sy + oy), 0), max_y) for y in ys]
+    else:
+        xs = [round(x * sx + ox, digits) if digits is not None else x * sx + ox for x in xs]
+        ys = [round(y * sy + oy, digits) if digits is not None else y * sy + oy for y in ys]
+
+    result = list(events)
+    for i, x, y in zip(moves, xs, ys):
+        result[i] = {**events[i], "x": x, "y": y}
+    return result
+
+
+def map_to_screen(
+    events: List[Dict[str, Any]],
+    header: Dict[str, Any],
+    current: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """Map the events of a loaded macro onto the current screen"""
+    current = current or screen_geometry()
+    transform = playback_transform(header, current)
+    if transform is None:
+        return events
+    return apply_transform(events, transform, bounds=current or header.get("screen"))
+
+
+def iter_mapped(reader, current: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream events of a MacroReader mapped onto the current screen, batch-wise.
+
+    The transform is resolved once the first batch was read, since the
+    reader collects header fields as it goes.
+    """
+    current = current or screen_geometry()
+    events: Iterable[Dict[str, Any]] = iter(reader)
+    transform = bounds = None
+    first = True
+    while True:
+        batch = list(islice(events, TRANSFORM_BATCH))
+        if not batch:
+            return
+        if first:
+            transform = playback_transform(reader.header, current)
+            bounds = current or reader.header.get("screen")
+            first = False
+        yield from (apply_transform(batch, transform, bounds=bounds) if transform else batch)
@@ -0,0 +1,172 @@
+# autoclicker/logic/macro_index.py
+"""Macro Library Index - Cached per-macro metadata for fast listing"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .macro_io import MacroReader, check_events, detect_codec, find_macro_file, split_macro_filename
+
+# Index file inside the macro directory (no macro suffix, so it is never listed as a macro)
+INDEX_FILENAME = ".index"
+INDEX_VERSION = 2
+
+
+def _hash_file(path: Path) -> str:
+    """Content hash of a macro file"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_macro_file(path: Path, validate: bool = False) -> Dict[str, Any]:
+    """Build an index entry by streaming through a macro file (validate: check every event)"""
+    stat = path.stat()
+    reader = MacroReader(path)
+    count = 0
+    first_ts = last_ts = 0.0
+    for event in (check_events(reader) if validate else reader):
+        ts = event.get("timestamp", 0.0)
+        if count == 0:
+            first_ts = ts
+        last_ts = ts
+        count += 1
+
+    return {
+        "name": split_macro_filename(path.name),
+        "event_count": count,
+        "duration": max(0.0, last_ts - first_ts),
+        "size": stat.st_size,
+        "created": reader.header.get("created"),
+        "hash": _hash_file(path),
+        "mtime": stat.st_mtime_ns,
+        "codec": detect_codec(path),
+    }
+
+
+class MacroIndex:
+    """Keeps name, event count, duration, size, created, hash, mtime and codec per macro.
+
+    Entries are validated against directory mtimes/sizes, so only new or
+    changed files are re-read; listing an unchanged library never opens a
+    macro body.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.index_file = self.directory / INDEX_FILENAME
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted index (empty on first use or version mismatch)"""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION:
+                    self._entries = data.get("macros", {})
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"[WARN] Macro index unreadable, rebuilding: {e}")
+        return self._entries
+
+    def _save(self) -> None:
+        """Persist index atomically"""
+        try:
+            self.directory.mkdir(exist_ok=True)
+            tmp = self.index_file.with_name(INDEX_FILENAME + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "macros": self._entries}, f, separators=(",", ":"))
+            os.replace(tmp, self.index_file)
+        except Exception as e:
+            print(f"[WARN] Failed to write macro index: {e}")
+
+    def refresh(self) -> Dict[str, Dict[str, Any]]:
+        """Reconcile index with the directory (stat only for unchanged files)"""
+        with self._lock:
+            entries = self._load()
+            if not self.directory.exists():
+                return dict(entries)
+
+            changed = False
+            seen = set()
+            with os.scandir(self.directory) as it:
+                for dir_entry in it:
+                    name = split_macro_filename(dir_entry.name)
+                    if name is None or not dir_entry.is_file():
+                        continue
+                    seen.add(name)
+                    stat = dir_entry.stat()
+                    cached = entries.get(name)
+                    if cached and cached["mtime"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                        continue
+                    try:
+                        entries[name] = scan_macro_file(Path(dir_entry.path))
+                    except Exception as e:
+                        print(f"[WARN] Skipping unreadable macro '{name}': {e}")
+                        entries.pop(name, None)
+                    changed = True
+
+            for name in set(entries) - seen:
+                del entries[name]
+                changed = True
+
+            if changed:
+                self._save()
+            return dict(entries)
+
+    def update(self, name: str) -> Optional[Dict[str, Any]]:
+        """Re-index one macro after it was written"""
+        path = find_macro_file(self.directory, name)
+        with self._lock:
+            entries = self._load()
+            try:
+                if path is None:
+                    raise FileNotFoundError(name)
+                entries[name] = scan_macro_file(path)
+            except Exception as e:
+                print(f"[WARN] Failed to index macro '{name}': {e}")
+                entries.pop(name, None)
+            self._save()
+            return entries.get(name)
+
+    def put_many(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Store entries scanned elsewhere (e.g. by bulk worker processes) in one write"""
+        if not entries:
+            return
+        with self._lock:
+            self._load().update(entries)
+            self._save()
+
+    def remove(self, name: str) -> None:
+        """Drop one macro from the index after deletion"""
+        with self._lock:
+            if self._load().pop(name, None) is not None:
+                self._save()
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Metadata for one macro (None if unknown), re-indexed only if changed"""
+        path = find_macro_file(self.directory, name)
+        if path is None:
+            self.remove(name)
+            return None
+        stat = path.stat()
+
+        with self._lock:
+            cached = self._load().get(name)
+        if cached and cached["mtime"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return dict(cached)
+        return self.update(name)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Metadata for all macros, sorted by name"""
+        entries = self.refresh()
+        return [dict(entries[name]) for name in sorted(entries)]
@@ -0,0 +1,441 @@
+# autoclicker/logic/macro_io.py
+"""Macro File I/O - Streaming reader and writer for saved macro files"""
+
+import gzip
+import io
+import json
+import lzma
+import os
+import re
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# Read size for incremental parsing (characters)
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\r\n"
+_WHITESPACE_RE = re.compile(r"[ \t\r\n]*")
+_SEPARATOR_RE = re.compile(r"[ \t\r\n]*([,\]])")
+
+# Storage codecs and their file suffixes ("json" = uncompressed)
+MACRO_CODECS = {
+    "json": ".json",
+    "gzip": ".json.gz",
+    "xz": ".json.xz",
+    "zstd": ".json.zst",
+}
+
+_MAGIC_BYTES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Fields every event of a type must carry (besides "timestamp")
+EVENT_FIELDS = {
+    "mouse_move": ("x", "y"),
+    "mouse_click": ("button", "action"),
+    "mouse_wheel": ("delta",),
+    "key_event": ("key", "action"),
+}
+
+
+class MacroFormatError(ValueError):
+    """Raised when a macro file is not a valid macro document"""
+
+
+def codec_for_filename(filename: str) -> Optional[str]:
+    """Return storage codec implied by a macro file suffix, else None"""
+    for codec, suffix in MACRO_CODECS.items():
+        if filename.endswith(suffix):
+            return codec
+    return None
+
+
+def split_macro_filename(filename: str) -> Optional[str]:
+    """Return macro name for a known macro file suffix, else None"""
+    codec = codec_for_filename(filename)
+    if codec is None:
+        return None
+    return filename[:-len(MACRO_CODECS[codec])]
+
+
+def find_macro_file(directory: Path, name: str) -> Optional[Path]:
+    """Locate a saved macro by name, whatever codec it was stored with"""
+    for suffix in MACRO_CODECS.values():
+        path = directory / f"{name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def detect_codec(path: Union[str, Path]) -> str:
+    """Identify storage codec from magic bytes (falls back to plain JSON)"""
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for magic, codec in _MAGIC_BYTES:
+        if head.startswith(magic):
+            return codec
+    return "json"
+
+
+def open_macro_file(path: Union[str, Path], mode: str = "r", codec: Optional[str] = None) -> IO[str]:
+    """Open a macro file as a (de)compressing text stream.
+
+    For reading the codec is detected from the file content; for writing it
+    is taken from ``codec`` or the file suffix.
+    """
+    path = Path(path)
+    if mode == "r":
+        codec = detect_codec(path)
+    elif codec is None:
+        codec = codec_for_filename(path.name) or "json"
+
+    if codec == "json":
+        return open(path, mode, encoding="utf-8")
+    if codec == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=GZIP_LEVEL)
+    if codec == "xz":
+        return lzma.open(path, mode + "t", encoding="utf-8")
+    if codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise MacroFormatError("zstd macro files require the 'zstandard' package")
+        raw = open(path, mode + "b")
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        else:
+            stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    raise MacroFormatError(f"Unknown macro codec: {codec}")
+
+
+def check_events(events: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Pass events through, raising MacroFormatError at the first malformed one"""
+    previous = None
+    for number, event in enumerate(events, 1):
+        ts = event.get("timestamp")
+        if ts.__class__ not in (int, float):
+            raise MacroFormatError(f"Event {number}: missing or invalid timestamp")
+        if previous is not None and ts < previous:
+            raise MacroFormatError(f"Event {number}: timestamp goes backwards")
+        fields = EVENT_FIELDS.get(event.get("type"))
+        if fields is None:
+            raise MacroFormatError(f"Event {number}: unknown type {event.get('type')!r}")
+        for field in fields:
+            if field not in event:
+                raise MacroFormatError(f"Event {number}: {event['type']} without '{field}'")
+        previous = ts
+        yield event
+
+
+class _Scanner:
+    """Minimal incremental JSON tokenizer on top of a text stream"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer. Returns False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return next non-whitespace character ('' at EOF)"""
+        while True:
+            buf, pos, n = self._buf, self._pos, len(self._buf)
+            while pos < n and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < n:
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def take(self, char: str) -> bool:
+        """Consume char if it is the next token"""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        """Consume char or raise MacroFormatError"""
+        if not self.take(char):
+            raise MacroFormatError(f"Expected '{char}' in macro file")
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A value touching the buffer end may be truncated (e.g. numbers)
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return obj
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise MacroFormatError(f"Invalid macro file: {e.msg}") from e
+            self._fill()
+
+    def array_values(self) -> Iterator[Any]:
+        """Yield the values of an array whose '[' was already consumed.
+
+        Hot path for event lists: calls the C scanner directly and matches
+        the separator with a regex instead of going through peek()/take().
+        """
+        if self.take("]"):
+            return
+
+        scan = self._decoder.scan_once
+        skip_ws = _WHITESPACE_RE.match
+        separator = _SEPARATOR_RE.match
+
+        while True:
+            buf = self._buf
+            pos = skip_ws(buf, self._pos).end()
+            try:
+                obj, end = scan(buf, pos)
+                match = separator(buf, end)
+            except (StopIteration, json.JSONDecodeError):
+                match = None
+
+            if match is None:
+                # Value or separator runs past the buffer: read more and retry
+                if not self._fill():
+                    raise MacroFormatError("Invalid macro file: unterminated array")
+                continue
+
+            self._pos = match.end()
+            yield obj
+            if match.group(1) == "]":
+                return
+
+
+class MacroReader:
+    """Iterates macro events from a file without materializing the event list.
+
+    Top-level fields other than "events" are collected in ``header`` as they
+    are encountered (fields stored after the event array are only available
+    once iteration has finished).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.header: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with open_macro_file(self.path, "r") as f:
+            yield from self._parse(_Scanner(f))
+
+    def _parse(self, scanner: _Scanner) -> Iterator[Dict[str, Any]]:
+        """Walk the top-level object and yield events one by one"""
+        scanner.expect("{")
+        if scanner.take("}"):
+            return
+
+        while True:
+            key = scanner.value()
+            scanner.expect(":")
+
+            if key == "events":
+                scanner.expect("[")
+                for event in scanner.array_values():
+                    if event.__class__ is not dict:
+                        raise MacroFormatError("Macro events must be objects")
+                    yield event
+            else:
+                self.header[key] = scanner.value()
+
+            if scanner.take(","):
+                continue
+            scanner.expect("}")
+            return
+
+
+def read_macro_header(path: Union[str, Path]) -> Dict[str, Any]:
+    """Return the header fields stored before the event array (reads at most one event)"""
+    reader = MacroReader(path)
+    events = iter(reader)
+    try:
+        next(events, None)
+    finally:
+        events.close()
+    return reader.header
+
+
+class RawMacroReader:
+    """Reads events of a macro file as compact JSON strings, in batches.
+
+    Files written by MacroWriter (one event per line) are split chunk-wise
+    without decoding events; other layouts fall back to MacroReader and
+    re-encode each event. ``header`` holds the fields stored before the
+    event array.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.header: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[str]:
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self) -> Iterator[List[str]]:
+        """Yield lists of encoded events (about CHUNK_SIZE characters each)"""
+        with open_macro_file(self.path, "r") as f:
+            if self._read_header(f):
+                yield from self._split_chunks(f)
+                return
+
+        reader = MacroReader(self.path)
+        # Shared dict: fields before the event array are in place after the first batch
+        self.header = reader.header
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        batch: List[str] = []
+        for event in reader:
+            batch.append(encode(event))
+            if len(batch) >= 1024:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _read_header(self, f: IO[str]) -> bool:
+        """Parse MacroWriter header lines. False if the file has another layout."""
+        if f.readline() != "{\n":
+            return False
+        for line in f:
+            if line == '"events": [\n':
+                return True
+            if not line.endswith(",\n"):
+                return False
+            try:
+                self.header.update(json.loads("{" + line[:-2] + "}"))
+            except ValueError:
+                return False
+        return False
+
+    @staticmethod
+    def _split_chunks(f: IO[str]) -> Iterator[List[str]]:
+        """Split whole-line chunks at ",\n" up to the closing bracket line"""
+        while True:
+            chunk = f.read(CHUNK_SIZE * 4)
+            if not chunk:
+                raise MacroFormatError("Invalid macro file: unterminated array")
+            if chunk[-1] != "\n":
+                chunk += f.readline()
+            if chunk[0] == "]":
+                return
+            # Compact JSON never contains a raw newline, so "\n]" can only be the array end
+            end = chunk.find("\n]")
+            body = (chunk if end == -1 else chunk[:end]).rstrip(",\n")
+            if body:
+                yield body.split(",\n")
+            if end != -1:
+                return
+
+
+class MacroWriter:
+    """Writes a macro file event by event (atomic replace on close).
+
+    The output is a regular macro JSON document (optionally compressed, see
+    MACRO_CODECS); events are written compactly, one per line.
+    """
+
+    def __init__(self, path: Union[str, Path], header: Dict[str, Any], codec: Optional[str] = None):
+        self.path = Path(path)
+        self.codec = codec
+        self.header = {k: v for k, v in header.items() if k not in ("events", "event_count")}
+        self.event_count = 0
+        self._encode = json.JSONEncoder(separators=(",", ":")).encode
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = None
+
+    def __enter__(self) -> "MacroWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def open(self) -> None:
+        """Create temp file and write header fields"""
+        codec = self.codec or codec_for_filename(self.path.name) or "json"
+        self._file = open_macro_file(self._tmp_path, "w", codec)
+        self._file.write("{\n")
+        for key, value in self.header.items():
+            self._file.write(f"{json.dumps(key)}: {json.dumps(value)},\n")
+        self._file.write('"events": [')
+
+    def write(self, event: Dict[str, Any]) -> None:
+        """Append one event"""
+        self._file.write(",\n" if self.event_count else "\n")
+        self._file.write(self._encode(event))
+        self.event_count += 1
+
+    def write_many(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Append events in batches (fewer stream writes than write())"""
+        encode = self._encode
+        batch = []
+        for event in events:
+            batch.append(encode(event))
+            if len(batch) >= 1024:
+                self._write_batch(batch)
+                batch = []
+        if batch:
+            self._write_batch(batch)
+
+    def write_encoded(self, encoded: list) -> None:
+        """Append events that are already compact JSON strings (see RawMacroReader)"""
+        if encoded:
+            self._write_batch(encoded)
+
+    def _write_batch(self, encoded: list) -> None:
+        """Write already-encoded events"""
+        self._file.write((",\n" if self.event_count else "\n") + ",\n".join(encoded))
+        self.event_count += len(encoded)
+
+    def close(self) -> None:
+        """Finish document and move it into place"""
+        if self._file is None:
+            return
+        self._file.write(f"\n],\n\"event_count\": {self.event_count}\n}}\n")
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard partially written file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            self._tmp_path.unlink()
+        except OSError:
+            pass
+
@@ -0,0 +1,408 @@
+# autoclicker/logic/macro_player.py
+"""Macro Playback Engine - Absolute-deadline scheduling and timing statistics"""
+
+import threading
+import time
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .interval_histogram import IntervalHistogram
+
+try:
+    from pynput import mouse, keyboard
+except ImportError:
+    mouse = None
+    keyboard = None
+
+# Sleep until this close to a deadline, then spin (covers OS sleep overshoot)
+SPIN_THRESHOLD = 0.002
+
+# Prefetch buffer bounds for streamed playback (compiled events held ahead of the player)
+PREFETCH_MIN_DEPTH = 256
+PREFETCH_MAX_DEPTH = 65536
+
+# Events handed from the reader thread per lock acquisition
+PREFETCH_BATCH = 64
+
+# Buffered playback time the reader keeps ahead of the player (grows depth if short)
+PREFETCH_MIN_LEAD = 0.5
+
+# Minimum seconds between progress callbacks (caps progress events at 10 Hz)
+PROGRESS_INTERVAL = 0.1
+
+# Recorded mouse button names; anything else plays as a left click
+BUTTON_NAMES = ("left", "right", "middle")
+
+# One pre-decoded step: (offset from start in seconds, bound callable, call args)
+MacroOp = Tuple[float, Callable[..., Any], tuple]
+
+
+def wait_until(deadline: float) -> None:
+    """Block until time.perf_counter() reaches deadline (no-op if already late)"""
+    remaining = deadline - time.perf_counter()
+    if remaining > SPIN_THRESHOLD:
+        time.sleep(remaining - SPIN_THRESHOLD)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class PlaybackControl:
+    """Stop/pause/resume requests shared between the GUI and the playback thread.
+
+    The playback loop checks one attribute per event (`interrupted`) and waits
+    on an Event instead of time.sleep, so requests also cut long idle gaps short.
+    """
+
+    def __init__(self):
+        self.interrupted = False
+        self._stop = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._wake = threading.Event()
+
+    @property
+    def stopped(self) -> bool:
+        """True once stop() was requested"""
+        return self._stop.is_set()
+
+    @property
+    def paused(self) -> bool:
+        """True while paused (and not stopped)"""
+        return not self._resume.is_set() and not self._stop.is_set()
+
+    def reset(self) -> None:
+        """Clear all requests before a new playback"""
+        self._stop.clear()
+        self._wake.clear()
+        self._resume.set()
+        self.interrupted = False
+
+    def stop(self) -> None:
+        """Request stop (also ends a pause)"""
+        self._stop.set()
+        self.interrupted = True
+        self._resume.set()
+        self._wake.set()
+
+    def pause(self) -> None:
+        """Hold playback before the next event"""
+        if not self._stop.is_set():
+            self._resume.clear()
+            self.interrupted = True
+            self._wake.set()
+
+    def resume(self) -> None:
+        """Continue a paused playback (remaining events keep their spacing)"""
+        if not self._stop.is_set():
+            self._wake.clear()
+            self.interrupted = False
+            self._resume.set()
+
+    def wait_until(self, deadline: float) -> Optional[float]:
+        """Interruptible wait_until. Returns seconds spent paused, or None once stopped."""
+        clock = time.perf_counter
+        paused_for = 0.0
+        while True:
+            if self.interrupted:
+                if self._stop.is_set():
+                    return None
+                if not self._resume.is_set():
+                    paused_at = clock()
+                    self._resume.wait()
+                    paused_for += clock() - paused_at
+                    continue
+
+            remaining = deadline + paused_for - clock()
+            if remaining <= SPIN_THRESHOLD or not self._wake.wait(remaining - SPIN_THRESHOLD):
+                break
+
+        target = deadline + paused_for
+        while clock() < target:
+            pass
+        return paused_for
+
+
+class LatenessTracker:
+    """Collects per-event lateness (seconds behind schedule) for one playback run.
+
+    Samples go into an IntervalHistogram, so memory stays constant however
+    long a (streamed) run lasts.
+    """
+
+    def __init__(self):
+        self.histogram = IntervalHistogram()
+
+    def add(self, lateness: float) -> None:
+        """Record lateness of one event (negative values count as on time)"""
+        self.histogram.record(lateness if lateness > 0 else 0.0)
+
+    def export(self, histogram: IntervalHistogram) -> None:
+        """Add all samples to a histogram (kept across runs, e.g. for metrics)"""
+        histogram.merge(self.histogram)
+
+    def summary(self) -> Dict[str, float]:
+        """Return mean/p99/max lateness in milliseconds"""
+        summary = self.histogram.summary()
+        return {
+            "events": summary["count"],
+            "mean_ms": summary["mean"] * 1000,
+            "p99_ms": summary["percentiles"][99.0] * 1000,
+            "max_ms": summary["max"] * 1000,
+        }
+
+
+def _resolve_button(button_name):
+    """Map recorded button name to pynput Button (left for unknown names)"""
+    return getattr(mouse.Button, button_name if button_name in BUTTON_NAMES else "left")
+
+
+def _resolve_key(key_name):
+    """Map recorded key name to pynput Key (special keys) or plain character"""
+    try:
+        if hasattr(keyboard.Key, key_name):
+            return getattr(keyboard.Key, key_name)
+    except TypeError:
+        pass
+    return key_name
+
+
+def iter_program(
+    events: Iterable[Dict[str, Any]],
+    mouse_controller,
+    keyboard_controller,
+    speed: float = 1.0,
+    idle: Optional[Dict[str, float]] = None,
+    resolve_button: Callable[[str], Any] = _resolve_button,
+    resolve_key: Callable[[str], Any] = _resolve_key,
+) -> Iterator[MacroOp]:
+    """Decode events lazily into (offset, callable, args) steps for playback.
+
+    Event types, button names and key names are resolved here, so the
+    playback loop only waits for the offset and calls the bound method.
+    Unknown event types are dropped. Names map to pynput Button/Key unless
+    other resolvers are passed (the dry run keeps plain names, no pynput).
+
+    idle = {"threshold": s, "scale": f} shortens every recorded gap longer
+    than threshold to threshold + excess * scale (scale 0 caps it). The
+    playback seconds removed so far are kept in idle["saved"].
+    """
+    buttons: Dict[Any, Any] = {}
+    set_position = partial(setattr, mouse_controller, "position")
+    mouse_actions = {"down": mouse_controller.press, "up": mouse_controller.release}
+    key_actions = {"down": keyboard_controller.press, "up": keyboard_controller.release}
+    keys: Dict[Any, Any] = {}
+
+    threshold = idle["threshold"] if idle else None
+    keep_ratio = idle.get("scale", 0.0) if idle else 1.0
+    removed = 0.0
+    first_ts = prev_ts = None
+
+    for event in events:
+        ts = event["timestamp"]
+        if first_ts is None:
+            first_ts = prev_ts = ts
+        if threshold is not None:
+            gap = ts - prev_ts
+            if gap > threshold:
+                removed += (gap - threshold) * (1.0 - keep_ratio)
+                idle["saved"] = removed / speed
+            prev_ts = ts
+        offset = (ts - first_ts - removed) / speed
+        event_type = event.get("type")
+
+        if event_type == "mouse_move":
+            yield (offset, set_position, ((event["x"], event["y"]),))
+
+        elif event_type == "mouse_click":
+            action = mouse_actions.get(event.get("action", "down"))
+            if action is not None:
+                button_name = event.get("button", "left")
+                try:
+                    button = buttons[button_name]
+                except KeyError:
+                    button = buttons[button_name] = resolve_button(button_name)
+                yield (offset, action, (button,))
+
+        elif event_type == "mouse_wheel":
+            yield (offset, mouse_controller.scroll, (0, event.get("delta", 0)))
+
+        elif event_type == "key_event":
+            action = key_actions.get(event.get("action"))
+            if action is not None:
+                key_name = event.get("key")
+                try:
+                    key = keys[key_name]
+                except KeyError:
+                    key = keys[key_name] = resolve_key(key_name)
+                yield (offset, action, (key,))
+
+
+def compile_macro(
+    events: Iterable[Dict[str, Any]],
+    mouse_controller,
+    keyboard_controller,
+    speed: float = 1.0,
+    idle: Optional[Dict[str, float]] = None,
+) -> List[MacroOp]:
+    """Decode all events once into a playback program (see iter_program)"""
+    return list(iter_program(events, mouse_controller, keyboard_controller, speed, idle))
+
+
+class PrefetchStream:
+    """Bounded buffer of compiled steps, filled by a reader thread during playback.
+
+    The reader refills from half-full up to `depth` steps. The depth doubles
+    whenever the buffered steps cover less than PREFETCH_MIN_LEAD seconds of
+    playback or the player finds the buffer empty, so a slow source (disk,
+    decompression) is absorbed by a deeper buffer instead of late events.
+    Memory stays bounded by PREFETCH_MAX_DEPTH steps.
+    """
+
+    def __init__(self, program: Iterable[MacroOp], depth: int = PREFETCH_MIN_DEPTH):
+        self.depth = depth
+        self.underruns = 0
+        self._program = program
+        self._buffer: deque = deque()
+        self._cond = threading.Condition()
+        self._done = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._fill, daemon=True)
+
+    def start(self) -> "PrefetchStream":
+        """Start the reader thread and wait until the initial depth is buffered"""
+        primed = self.depth
+        self._thread.start()
+        with self._cond:
+            while len(self._buffer) < primed and not self._done:
+                self._cond.wait()
+        return self
+
+    def close(self) -> None:
+        """Stop the reader thread early (buffered steps are dropped)"""
+        with self._cond:
+            self._closed = True
+            self._buffer.clear()
+            self._cond.notify_all()
+
+    def _fill(self) -> None:
+        """Reader thread: compile steps into the buffer in small batches"""
+        try:
+            batch: List[MacroOp] = []
+            for op in self._program:
+                batch.append(op)
+                if len(batch) >= PREFETCH_BATCH:
+                    if not self._push(batch):
+                        return
+                    batch = []
+                    # Hand the GIL back so the player never waits a full switch interval
+                    time.sleep(0)
+            self._push(batch)
+        except Exception as e:
+            self._error = e
+        finally:
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    def _push(self, batch: List[MacroOp]) -> bool:
+        """Append a batch, blocking while the buffer is full. False once closed."""
+        buffer = self._buffer
+        with self._cond:
+            if len(buffer) >= self.depth:
+                while len(buffer) > self.depth // 2 and not self._closed:
+                    self._cond.wait()
+            if self._closed:
+                return False
+            buffer.extend(batch)
+            if buffer and buffer[-1][0] - buffer[0][0] < PREFETCH_MIN_LEAD and len(buffer) >= self.depth:
+                self.depth = min(self.depth * 2, PREFETCH_MAX_DEPTH)
+            self._cond.notify_all()
+        return True
+
+    def _wait_for_data(self) -> bool:
+        """Block on an empty buffer (counts as underrun). False at end of stream."""
+        with self._cond:
+            if not self._buffer and not self._done and not self._closed:
+                self.underruns += 1
+                self.depth = min(self.depth * 2, PREFETCH_MAX_DEPTH)
+                while not self._buffer and not self._done and not self._closed:
+                    self._cond.wait()
+            if not self._buffer and self._error is not None:
+                raise self._error
+            return bool(self._buffer)
+
+    def __iter__(self) -> Iterator[MacroOp]:
+        buffer = self._buffer
+        cond = self._cond
+        while True:
+            try:
+                op = buffer.popleft()
+            except IndexError:
+                if not self._wait_for_data():
+                    return
+                continue
+            if len(buffer) == self.depth // 2:
+                with cond:
+                    cond.notify_all()
+            yield op
+
+
+def run_program(
+    program: Iterable[MacroOp],
+    control: Optional[PlaybackControl] = None,
+    on_progress: Optional[Callable[[int, Optional[int], float, Optional[float]], None]] = None,
+    total: Optional[int] = None,
+    duration: Optional[float] = None,
+    lateness_sink: Optional[IntervalHistogram] = None,
+) -> Dict[str, float]:
+    """Execute a compiled program (list or PrefetchStream) against absolute deadlines.
+
+    With a control, stop/pause take effect before the next event and pauses
+    shift the remaining schedule. on_progress(index, total, elapsed, eta) is
+    called at most every PROGRESS_INTERVAL seconds. total/duration are taken
+    from a list program; for streams they can be passed in (else eta is None).
+    Per-event lateness is added to lateness_sink after the run.
+    Returns timing summary.
+    """
+    lateness = LatenessTracker()
+    add_lateness = lateness.add
+    clock = time.perf_counter
+    if isinstance(program, list):
+        total = len(program)
+        duration = program[-1][0] if program else 0.0
+    offset = 0.0
+    index = 0
+    start = clock()
+    next_progress = start + PROGRESS_INTERVAL if on_progress is not None else float("inf")
+
+    for offset, op, args in program:
+        deadline = start + offset
+        if control is None:
+            wait_until(deadline)
+        else:
+            paused_for = control.wait_until(deadline)
+            if paused_for is None:
+                break
+            if paused_for:
+                start += paused_for
+                deadline += paused_for
+        now = clock()
+        add_lateness(now - deadline)
+        try:
+            op(*args)
+        except Exception as e:
+            print(f"Error playing event: {e}")
+        index += 1
+
+        if now >= next_progress:
+            next_progress = now + PROGRESS_INTERVAL
+            on_progress(index, total, now - start, max(0.0, duration - offset) if duration is not None else None)
+
+    elapsed = clock() - start
+    timing = lateness.summary()
+    if lateness_sink is not None:
+        lateness.export(lateness_sink)
+    timing["drift_ms"] = (elapsed - offset) * 1000
+    return timing
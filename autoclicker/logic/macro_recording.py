@@ -3,8 +3,7 @@
 
 import threading
 import time
-import json
-from typing import Callable, Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any, Iterable
 from pathlib import Path
 from datetime import datetime
 
@@ -16,9 +15,20 @@ except ImportError:
     keyboard = None
     MACRO_LIBS_AVAILABLE = False
 
-from ..events import (MACRO_RECORDING_STARTED, MACRO_RECORDING_STOPPED, MACRO_ALREADY_RECORDING, MACRO_NOT_RECORDING, MACRO_SAVED, MACRO_SAVE_ERROR, MACRO_LOADED, MACRO_LOAD_ERROR, MACRO_PLAYING, MACRO_PLAY_COMPLETED, MACRO_PLAY_ERROR, MACRO_DELETED, MACRO_DELETE_ERROR, MACRO_NO_EVENTS, MACRO_INVALID_NAME, MACRO_NOT_FOUND, MACRO_LIBS_UNAVAILABLE)
+from ..events import (MACRO_RECORDING_STARTED, MACRO_RECORDING_STOPPED, MACRO_ALREADY_RECORDING, MACRO_NOT_RECORDING, MACRO_SAVED, MACRO_SAVE_ERROR, MACRO_LOADED, MACRO_LOAD_ERROR, MACRO_PLAYING, MACRO_PLAY_COMPLETED, MACRO_PLAY_ERROR, MACRO_DELETED, MACRO_DELETE_ERROR, MACRO_NO_EVENTS, MACRO_INVALID_NAME, MACRO_NOT_FOUND, MACRO_LIBS_UNAVAILABLE, MACRO_SIMPLIFIED, MACRO_SIMPLIFY_ERROR, MACRO_LOOP_COMPLETED, MACRO_ALREADY_PLAYING, MACRO_PLAYBACK_STOPPED, MACRO_SCHEDULED, MACRO_SCHEDULE_CANCELLED, MACRO_SCHEDULE_ERROR, MACRO_PROGRESS, MACRO_PAUSED, MACRO_RESUMED, MACRO_EDITED, MACRO_EDIT_ERROR, MACRO_SIMULATED, MACRO_SIMULATE_ERROR)
 from ..utils.validators import validate_macro_name
-from ..utils.constants import MACROS_DIR
+from ..utils.constants import MACROS_DIR, MIN_MACRO_SPEED, MAX_MACRO_SPEED, MAX_MACRO_LOOPS, MAX_MACRO_LOOP_GAP, MAX_MACRO_IDLE_GAP
+from .macro_simplify import simplify_macro_file, DEFAULT_TOLERANCE_PX
+from .macro_edit import apply_edit
+from .dry_run import DEFAULT_SCREEN, simulate_macro
+from .click_heatmap import ClickHeatmap
+from .macro_timeline import MacroTimeline
+from .macro_player import PlaybackControl, PrefetchStream, compile_macro, iter_program, run_program
+from .macro_index import MacroIndex
+from .interval_histogram import IntervalHistogram
+from .macro_geometry import NORMALIZED_DIGITS, apply_transform, geometry_header, iter_mapped, map_to_screen, normalize_transform, screen_geometry
+from .macro_scheduler import MacroScheduler
+from .macro_io import MacroReader, MacroWriter, MACRO_CODECS, ZSTD_AVAILABLE, codec_for_filename, find_macro_file
 
 class MacroRecording:
     """Manages macro recording and playback using pynput (cross-platform)"""
@@ -30,6 +40,8 @@ class MacroRecording:
         self._events_lock = threading.Lock()
         self.recording_start_time = None
         self.recorded_macro_name = None
+        # Screen the in-memory macro_events refer to (recording or current screen)
+        self.macro_screen: Optional[Dict[str, int]] = None
         self.hotkeys = hotkeys or {
             "start_macro_recording": "f3",
             "stop_macro_recording": "f4",
@@ -37,11 +49,86 @@ class MacroRecording:
         }
         self._mouse_listener = None
         self._keyboard_listener = None
+        self.index = MacroIndex(MACROS_DIR)
+        self.scheduler = MacroScheduler()
+        self._playback_thread: Optional[threading.Thread] = None
+        self._playback_lock = threading.Lock()
+        self.playback_control = PlaybackControl()
+        self.playback_lateness = IntervalHistogram()  # Event lateness of all playback runs (metrics)
 
     def _validate_macro_name(self, name: str) -> bool:
         """Validate macro name to prevent path traversal"""
         return validate_macro_name(name)
 
+    def _macro_file(self, name: str, codec: str = "json") -> Optional[Path]:
+        """Return macro file path, or None if it escapes MACROS_DIR (symlink-safe)"""
+        filename = MACROS_DIR / f"{name}{MACRO_CODECS[codec]}"
+        try:
+            filename.resolve().relative_to(MACROS_DIR.resolve())
+        except (ValueError, OSError):
+            return None
+        return filename
+
+    def _remove_other_codecs(self, name: str, codec: str) -> None:
+        """Drop copies of a macro stored with a different codec than the one just written"""
+        for other in MACRO_CODECS:
+            other_file = self._macro_file(name, other)
+            if other != codec and other_file is not None and other_file.exists():
+                other_file.unlink()
+
+    def _start_playback(self, target: Callable[[], None], on_status: Callable[[str], None]) -> bool:
+        """Run target on the playback thread unless a macro is already playing"""
+        with self._playback_lock:
+            if self._playback_thread is not None and self._playback_thread.is_alive():
+                on_status(MACRO_ALREADY_PLAYING)
+                return False
+            self.playback_control.reset()
+            on_status(MACRO_PLAYING)
+            self._playback_thread = threading.Thread(target=target, daemon=True)
+            self._playback_thread.start()
+        return True
+
+    def _progress_reporter(self, on_status: Callable[[str], None], loop: int = 1, loops: int = 1) -> Callable[..., None]:
+        """Bind loop info into a run_program progress callback"""
+        def report(index, total, elapsed, eta):
+            on_status(MACRO_PROGRESS, index=index, total=total, elapsed=elapsed, eta=eta, loop=loop, loops=loops)
+        return report
+
+    def _idle_settings(self, max_idle: float, idle_scale: float) -> Optional[Dict[str, float]]:
+        """Idle-gap compression settings for compile_macro (None = off)"""
+        if max_idle <= 0:
+            return None
+        return {"threshold": min(MAX_MACRO_IDLE_GAP, max_idle), "scale": max(0.0, min(1.0, idle_scale)), "saved": 0.0}
+
+    def _run_loops(
+        self,
+        program: List[Any],
+        on_status: Callable[[str], None],
+        loops: int,
+        gap: float,
+        saved: float = 0.0,
+    ) -> None:
+        """Replay one compiled program `loops` times (0 = until stopped) with a gap between runs"""
+        control = self.playback_control
+        loop = 0
+        timing: Dict[str, float] = {}
+        while loops == 0 or loop < loops:
+            if loop and control.wait_until(time.perf_counter() + gap) is None:
+                break
+            if control.stopped:
+                break
+            timing = run_program(program, control, self._progress_reporter(on_status, loop + 1, loops), lateness_sink=self.playback_lateness)
+            if control.stopped:
+                break
+            loop += 1
+            if loops != 1:
+                on_status(MACRO_LOOP_COMPLETED, loop=loop, loops=loops, time_saved=saved, **timing)
+
+        if control.stopped:
+            on_status(MACRO_PLAYBACK_STOPPED, loops=loop)
+        else:
+            on_status(MACRO_PLAY_COMPLETED, loops=loop, time_saved=saved * loop, **timing)
+
     def update_hotkeys(self, hotkeys: dict[str, str]) -> None:
         """Update hotkey bindings (registration handled by SetupHotkeys)"""
         self.hotkeys.update(hotkeys)
@@ -61,6 +148,7 @@ class MacroRecording:
         with self._events_lock:
             self.macro_events = []
 
+        self.macro_screen = screen_geometry()
         self.recording_start_time = time.time()
         on_status(MACRO_RECORDING_STARTED)
 
@@ -171,8 +259,12 @@ class MacroRecording:
         on_status(MACRO_RECORDING_STOPPED, count=len(self.macro_events))
         return True
 
-    def save_macro(self, name: str, on_status: Callable[[str], None]) -> bool:
-        """Save recorded macro to JSON file"""
+    def save_macro(self, name: str, on_status: Callable[[str], None], codec: str = "json", normalize: bool = False) -> bool:
+        """Save recorded macro as JSON (optionally compressed: gzip, xz, zstd).
+
+        The screen size is stored with the macro; with normalize=True mouse
+        coordinates are stored as fractions of it (0..1) instead of pixels.
+        """
         if not self._validate_macro_name(name):
             on_status(MACRO_INVALID_NAME)
             return False
@@ -181,29 +273,28 @@ class MacroRecording:
             on_status(MACRO_NO_EVENTS)
             return False
 
+        if codec not in MACRO_CODECS or (codec == "zstd" and not ZSTD_AVAILABLE):
+            on_status(MACRO_SAVE_ERROR)
+            return False
+
         try:
             MACROS_DIR.mkdir(exist_ok=True)
-            filename = MACROS_DIR / f"{name}.json"
-
-            # SECURITY: Verify path is within MACROS_DIR (symlink-safe)
-            try:
-                filename_resolved = filename.resolve()
-                macro_dir_resolved = MACROS_DIR.resolve()
-                filename_resolved.relative_to(macro_dir_resolved)
-            except (ValueError, OSError):
+            filename = self._macro_file(name, codec)
+            if filename is None:
                 on_status(MACRO_SAVE_ERROR)
                 return False
 
-            macro_data = {
-                "name": name,
-                "created": datetime.now().isoformat(),
-                "events": self.macro_events,
-                "event_count": len(self.macro_events),
-            }
+            screen = self.macro_screen
+            events = self.macro_events
+            if normalize and screen:
+                events = apply_transform(events, normalize_transform(screen), digits=NORMALIZED_DIGITS)
 
-            with open(filename, "w") as f:
-                json.dump(macro_data, f, indent=2)
+            header = {"name": name, "created": datetime.now().isoformat(), **geometry_header(screen, normalize)}
+            with MacroWriter(filename, header, codec) as writer:
+                writer.write_many(events)
 
+            self._remove_other_codecs(name, codec)
+            self.index.update(name)
             self.recorded_macro_name = name
             on_status(MACRO_SAVED, name=name)
             return True
@@ -221,25 +312,22 @@ class MacroRecording:
             return False
 
         try:
-            filename = MACROS_DIR / f"{name}.json"
-
-            # SECURITY: Verify path is within MACROS_DIR (symlink-safe)
-            try:
-                filename_resolved = filename.resolve()
-                macro_dir_resolved = MACROS_DIR.resolve()
-                filename_resolved.relative_to(macro_dir_resolved)
-            except (ValueError, OSError):
-                on_status(MACRO_LOAD_ERROR)
-                return False
-
-            if not filename.exists():
+            filename = find_macro_file(MACROS_DIR, name)
+            if filename is None:
                 on_status(MACRO_NOT_FOUND, name=name)
                 return False
 
-            with open(filename, "r") as f:
-                macro_data = json.load(f)
+            if self._macro_file(name, codec_for_filename(filename.name)) is None:
+                on_status(MACRO_LOAD_ERROR)
+                return False
 
-            self.macro_events = macro_data.get("events", [])
+            # Decompress and parse incrementally instead of reading the whole file first
+            reader = MacroReader(filename)
+            events = list(reader)
+            # Mouse coordinates are mapped onto the current screen once, at load time
+            screen = screen_geometry()
+            self.macro_events = map_to_screen(events, reader.header, screen)
+            self.macro_screen = screen or reader.header.get("screen")
             self.recorded_macro_name = name
             on_status(MACRO_LOADED, name=name, count=len(self.macro_events))
             return True
@@ -248,8 +336,20 @@ class MacroRecording:
             on_status(MACRO_LOAD_ERROR)
             return False
 
-    def play_macro(self, on_status: Callable[[str], None]) -> bool:
-        """Playback recorded macro with timing preservation"""
+    def play_macro(
+        self,
+        on_status: Callable[[str], None],
+        speed: float = 1.0,
+        loops: int = 1,
+        gap: float = 0.0,
+        max_idle: float = 0.0,
+        idle_scale: float = 0.0,
+    ) -> bool:
+        """Playback recorded macro `loops` times (0 = until stopped), decoded once.
+
+        Recorded gaps longer than max_idle seconds (0 = off) are shortened to
+        max_idle plus idle_scale times the excess.
+        """
         if not self.macro_events:
             on_status(MACRO_NO_EVENTS)
             return False
@@ -258,80 +358,264 @@ class MacroRecording:
             on_status(MACRO_LIBS_UNAVAILABLE)
             return False
 
-        on_status(MACRO_PLAYING)
+        speed = max(MIN_MACRO_SPEED, min(MAX_MACRO_SPEED, speed))
+        loops = max(0, min(MAX_MACRO_LOOPS, int(loops)))
+        gap = max(0.0, min(MAX_MACRO_LOOP_GAP, gap))
+        idle = self._idle_settings(max_idle, idle_scale)
+        events = self.macro_events
 
         def playback():
-            mouse_controller = mouse.Controller()
-            keyboard_controller = keyboard.Controller()
+            try:
+                program = compile_macro(events, mouse.Controller(), keyboard.Controller(), speed, idle)
+                self._run_loops(program, on_status, loops, gap, idle["saved"] if idle else 0.0)
+            except Exception as e:
+                print(f"[ERROR] Failed to play macro: {e}")
+                on_status(MACRO_PLAY_ERROR)
 
-            for i, event in enumerate(self.macro_events):
-                event_type = event.get("type")
+        return self._start_playback(playback, on_status)
 
-                try:
-                    if event_type == "mouse_move":
-                        mouse_controller.position = (event["x"], event["y"])
-
-                    elif event_type == "mouse_click":
-                        button_name = event.get("button", "left")
-                        # Convert button string to pynput Button
-                        if button_name == "left":
-                            button = mouse.Button.left
-                        elif button_name == "right":
-                            button = mouse.Button.right
-                        elif button_name == "middle":
-                            button = mouse.Button.middle
-                        else:
-                            button = mouse.Button.left
-
-                        action = event.get("action", "down")
-                        if action == "down":
-                            mouse_controller.press(button)
-                        elif action == "up":
-                            mouse_controller.release(button)
-
-                    elif event_type == "mouse_wheel":
-                        delta = event.get("delta", 0)
-                        mouse_controller.scroll(0, delta)
-
-                    elif event_type == "key_event":
-                        key_name = event.get("key")
-                        action = event.get("action")
-
-                        # Try to convert key name to pynput key
-                        try:
-                            # Check if it's a special key
-                            if hasattr(keyboard.Key, key_name):
-                                key = getattr(keyboard.Key, key_name)
-                            else:
-                                # Regular character
-                                key = key_name
-                        except:
-                            key = key_name
-
-                        if action == "down":
-                            keyboard_controller.press(key)
-                        elif action == "up":
-                            keyboard_controller.release(key)
+    def stop_playback(self) -> None:
+        """Stop playback before the next event"""
+        self.playback_control.stop()
+
+    def pause_playback(self, on_status: Callable[[str], None]) -> bool:
+        """Pause playback before the next event"""
+        if not self.is_playing() or self.playback_control.paused:
+            return False
+        self.playback_control.pause()
+        on_status(MACRO_PAUSED)
+        return True
+
+    def resume_playback(self, on_status: Callable[[str], None]) -> bool:
+        """Resume paused playback"""
+        if not self.is_playing() or not self.playback_control.paused:
+            return False
+        self.playback_control.resume()
+        on_status(MACRO_RESUMED)
+        return True
 
+    def is_playing(self) -> bool:
+        """Check whether the playback thread is running"""
+        thread = self._playback_thread
+        return thread is not None and thread.is_alive()
+
+    def schedule_macro(
+        self,
+        name: str,
+        on_status: Callable[[str], None],
+        at: Optional[datetime] = None,
+        every_minutes: Optional[float] = None,
+        speed: float = 1.0,
+        loops: int = 1,
+        gap: float = 0.0,
+        max_idle: float = 0.0,
+        idle_scale: float = 0.0,
+    ) -> Optional[int]:
+        """Schedule a saved macro at a wall-clock time and/or every N minutes. Returns schedule id."""
+        if not self._validate_macro_name(name):
+            on_status(MACRO_INVALID_NAME)
+            return None
+
+        if not MACRO_LIBS_AVAILABLE:
+            on_status(MACRO_LIBS_UNAVAILABLE)
+            return None
+
+        filename = find_macro_file(MACROS_DIR, name)
+        if filename is None:
+            on_status(MACRO_NOT_FOUND, name=name)
+            return None
+
+        speed = max(MIN_MACRO_SPEED, min(MAX_MACRO_SPEED, speed))
+        loops = max(0, min(MAX_MACRO_LOOPS, int(loops)))
+        gap = max(0.0, min(MAX_MACRO_LOOP_GAP, gap))
+        idle = self._idle_settings(max_idle, idle_scale)
+        # Compiled program is kept between runs and rebuilt only if the file changed
+        cache: Dict[str, Any] = {"key": None, "program": None, "saved": 0.0}
+
+        def run_scheduled():
+            path = find_macro_file(MACROS_DIR, name)
+            if path is None or self._macro_file(name, codec_for_filename(path.name)) is None:
+                on_status(MACRO_NOT_FOUND, name=name)
+                return
+            stat = path.stat()
+            key = (path.name, stat.st_mtime_ns, stat.st_size)
+
+            def playback():
+                try:
+                    if cache["key"] != key:
+                        cache["program"] = compile_macro(iter_mapped(MacroReader(path)), mouse.Controller(), keyboard.Controller(), speed, idle)
+                        cache["saved"] = idle["saved"] if idle else 0.0
+                        cache["key"] = key
+                    self._run_loops(cache["program"], on_status, loops, gap, cache["saved"])
                 except Exception as e:
-                    print(f"Error playing event: {e}")
-                    continue
+                    print(f"[ERROR] Failed to play scheduled macro '{name}': {e}")
+                    on_status(MACRO_PLAY_ERROR)
 
-                # Wait for next event
-                if i < len(self.macro_events) - 1:
-                    current_ts = event["timestamp"]
-                    next_ts = self.macro_events[i + 1]["timestamp"]
-                    delay = 1.1 * (next_ts - current_ts)
-                    if delay > 0:
-                        time.sleep(delay)
+            self._start_playback(playback, on_status)
 
-            on_status(MACRO_PLAY_COMPLETED)
+        try:
+            interval = every_minutes * 60 if every_minutes else None
+            job_id = self.scheduler.add(run_scheduled, at=at, interval=interval, label=name)
+        except ValueError as e:
+            print(f"[ERROR] Invalid macro schedule: {e}")
+            on_status(MACRO_SCHEDULE_ERROR)
+            return None
 
-        thread = threading.Thread(target=playback, daemon=True)
-        thread.start()
+        on_status(MACRO_SCHEDULED, name=name, id=job_id)
+        return job_id
 
+    def cancel_schedule(self, job_id: int, on_status: Callable[[str], None]) -> bool:
+        """Cancel a scheduled macro start"""
+        if not self.scheduler.cancel(job_id):
+            on_status(MACRO_SCHEDULE_ERROR)
+            return False
+        on_status(MACRO_SCHEDULE_CANCELLED, id=job_id)
         return True
 
+    def get_schedules(self) -> List[Dict[str, Any]]:
+        """Get pending scheduled macro starts (id, macro name, interval, next run)"""
+        return self.scheduler.jobs()
+
+    def stream_macro(
+        self,
+        name: str,
+        on_status: Callable[[str], None],
+        speed: float = 1.0,
+        max_idle: float = 0.0,
+        idle_scale: float = 0.0,
+    ) -> bool:
+        """Play a saved macro straight from disk (constant memory, starts immediately)"""
+        if not self._validate_macro_name(name):
+            on_status(MACRO_INVALID_NAME)
+            return False
+
+        if not MACRO_LIBS_AVAILABLE:
+            on_status(MACRO_LIBS_UNAVAILABLE)
+            return False
+
+        filename = find_macro_file(MACROS_DIR, name)
+        if filename is None:
+            on_status(MACRO_NOT_FOUND, name=name)
+            return False
+
+        if self._macro_file(name, codec_for_filename(filename.name)) is None:
+            on_status(MACRO_LOAD_ERROR)
+            return False
+
+        speed = max(MIN_MACRO_SPEED, min(MAX_MACRO_SPEED, speed))
+        # Event count and duration from the index give the stream a progress total and ETA
+        info = self.get_macro_info(name) or {}
+        total = info.get("event_count")
+        idle = self._idle_settings(max_idle, idle_scale)
+        # Compressed duration is only known once the stream is read, so no ETA then
+        duration = info["duration"] / speed if "duration" in info and idle is None else None
+
+        def playback():
+            control = self.playback_control
+            stream = None
+            try:
+                stream = PrefetchStream(iter_program(iter_mapped(MacroReader(filename)), mouse.Controller(), keyboard.Controller(), speed, idle))
+                timing = run_program(stream.start(), control, self._progress_reporter(on_status), total, duration, self.playback_lateness)
+            except Exception as e:
+                print(f"[ERROR] Failed to stream macro: {e}")
+                on_status(MACRO_PLAY_ERROR)
+                return
+            finally:
+                if stream is not None:
+                    stream.close()
+            if control.stopped:
+                on_status(MACRO_PLAYBACK_STOPPED, loops=0)
+                return
+            on_status(
+                MACRO_PLAY_COMPLETED,
+                time_saved=idle["saved"] if idle else 0.0,
+                underruns=stream.underruns,
+                prefetch_depth=stream.depth,
+                **timing,
+            )
+
+        return self._start_playback(playback, on_status)
+
+    def _macro_source(self, on_status: Callable[[str], None], name: Optional[str] = None) -> Optional[Iterable[Dict[str, Any]]]:
+        """Events of the loaded macro, or a stream of a saved one mapped to this screen (None on error)"""
+        if name is None:
+            if not self.macro_events:
+                on_status(MACRO_NO_EVENTS)
+                return None
+            return self.macro_events
+
+        if not self._validate_macro_name(name):
+            on_status(MACRO_INVALID_NAME)
+            return None
+        filename = find_macro_file(MACROS_DIR, name)
+        if filename is None:
+            on_status(MACRO_NOT_FOUND, name=name)
+            return None
+        if self._macro_file(name, codec_for_filename(filename.name)) is None:
+            on_status(MACRO_LOAD_ERROR)
+            return None
+        return iter_mapped(MacroReader(filename))
+
+    def simulate_macro(
+        self,
+        on_status: Callable[[str], None],
+        name: Optional[str] = None,
+        speed: float = 1.0,
+        max_idle: float = 0.0,
+        idle_scale: float = 0.0,
+    ) -> Optional[Dict[str, Any]]:
+        """Dry-run the loaded macro (or a saved one by name) on a virtual clock, no input sent (no pynput needed)"""
+        events = self._macro_source(on_status, name)
+        if events is None:
+            return None
+
+        speed = max(MIN_MACRO_SPEED, min(MAX_MACRO_SPEED, speed))
+        try:
+            report = simulate_macro(events, speed, self._idle_settings(max_idle, idle_scale), self.macro_screen or screen_geometry())
+        except Exception as e:
+            print(f"[ERROR] Failed to simulate macro: {e}")
+            on_status(MACRO_SIMULATE_ERROR)
+            return None
+
+        longest_gap = report["longest_gaps"][0]["length"] if report["longest_gaps"] else 0.0
+        on_status(
+            MACRO_SIMULATED,
+            duration=report["duration"],
+            actions=report["actions"],
+            clicks=report["click_count"],
+            peak_rate=report["peak_rate"],
+            longest_gap=longest_gap,
+        )
+        return report
+
+    def build_timeline(self, on_status: Callable[[str], None], name: Optional[str] = None) -> Optional[MacroTimeline]:
+        """Level-of-detail timeline of the loaded macro (or a saved one by name) for the viewer"""
+        events = self._macro_source(on_status, name)
+        if events is None:
+            return None
+
+        try:
+            return MacroTimeline(events)
+        except Exception as e:
+            print(f"[ERROR] Failed to build macro timeline: {e}")
+            on_status(MACRO_LOAD_ERROR)
+            return None
+
+    def build_heatmap(self, on_status: Callable[[str], None], name: Optional[str] = None) -> Optional[ClickHeatmap]:
+        """Click heatmap of the loaded macro (or a saved one by name) on the current screen"""
+        events = self._macro_source(on_status, name)
+        if events is None:
+            return None
+
+        try:
+            heatmap = ClickHeatmap(screen_geometry() or self.macro_screen or DEFAULT_SCREEN)
+            heatmap.add_events(events)
+        except Exception as e:
+            print(f"[ERROR] Failed to build click heatmap: {e}")
+            on_status(MACRO_LOAD_ERROR)
+            return None
+        return heatmap
+
     def delete_macro(self, name: str, on_status: Callable[[str], None]) -> bool:
         """Delete saved macro file"""
         if not self._validate_macro_name(name):
@@ -339,19 +623,16 @@ class MacroRecording:
             return False
 
         try:
-            filename = MACROS_DIR / f"{name}.json"
+            filename = find_macro_file(MACROS_DIR, name)
 
             # SECURITY: Verify path is within MACROS_DIR (symlink-safe)
-            try:
-                filename_resolved = filename.resolve()
-                macro_dir_resolved = MACROS_DIR.resolve()
-                filename_resolved.relative_to(macro_dir_resolved)
-            except (ValueError, OSError):
+            if filename is not None and self._macro_file(name, codec_for_filename(filename.name)) is None:
                 on_status(MACRO_DELETE_ERROR)
                 return False
 
-            if filename.exists():
+            if filename is not None:
                 filename.unlink()
+                self.index.remove(name)
                 if name == self.recorded_macro_name:
                     self.recorded_macro_name = None
                 on_status(MACRO_DELETED, name=name)
@@ -364,24 +645,107 @@ class MacroRecording:
             on_status(MACRO_DELETE_ERROR)
             return False
 
+    def simplify_macro(
+        self,
+        name: str,
+        new_name: str,
+        on_status: Callable[[str], None],
+        tolerance: float = DEFAULT_TOLERANCE_PX,
+    ) -> Optional[Dict[str, int]]:
+        """Write a copy of a saved macro with simplified mouse paths. Returns report."""
+        if not self._validate_macro_name(name) or not self._validate_macro_name(new_name):
+            on_status(MACRO_INVALID_NAME)
+            return None
+
+        source = find_macro_file(MACROS_DIR, name)
+        if source is None:
+            on_status(MACRO_NOT_FOUND, name=name)
+            return None
+
+        # Keep the storage codec of the source macro
+        codec = codec_for_filename(source.name)
+        target = self._macro_file(new_name, codec)
+        if self._macro_file(name, codec) is None or target is None or name == new_name:
+            on_status(MACRO_SIMPLIFY_ERROR)
+            return None
+
+        try:
+            report = simplify_macro_file(source, target, new_name, tolerance)
+            self._remove_other_codecs(new_name, codec)
+            self.index.update(new_name)
+        except Exception as e:
+            print(f"[ERROR] Failed to simplify macro: {e}")
+            on_status(MACRO_SIMPLIFY_ERROR)
+            return None
+
+        on_status(MACRO_SIMPLIFIED, name=new_name, before=report["events_before"], after=report["events_after"])
+        return report
+
+    def edit_macro(
+        self,
+        operation: str,
+        sources: List[str],
+        new_name: str,
+        on_status: Callable[[str], None],
+        **params: float,
+    ) -> Optional[Dict[str, int]]:
+        """Write a new macro by trim/cut/concat/splice/retime of saved macros (see macro_edit)"""
+        if not sources or not all(self._validate_macro_name(name) for name in [*sources, new_name]):
+            on_status(MACRO_INVALID_NAME)
+            return None
+
+        paths = []
+        for name in sources:
+            path = find_macro_file(MACROS_DIR, name)
+            if path is None:
+                on_status(MACRO_NOT_FOUND, name=name)
+                return None
+            if self._macro_file(name, codec_for_filename(path.name)) is None:
+                on_status(MACRO_EDIT_ERROR)
+                return None
+            paths.append(path)
+
+        # Result keeps the storage codec of the first source
+        codec = codec_for_filename(paths[0].name)
+        target = self._macro_file(new_name, codec)
+        if target is None or new_name in sources:
+            on_status(MACRO_EDIT_ERROR)
+            return None
+
+        try:
+            report = apply_edit(operation, paths, target, new_name, **params)
+            self._remove_other_codecs(new_name, codec)
+            self.index.update(new_name)
+        except Exception as e:
+            print(f"[ERROR] Failed to edit macro: {e}")
+            on_status(MACRO_EDIT_ERROR)
+            return None
+
+        on_status(MACRO_EDITED, name=new_name, count=report["events"])
+        return report
+
     def get_saved_macros(self) -> List[str]:
         """Get list of all saved macro names"""
         try:
-            if MACROS_DIR.exists():
-                return [f.stem for f in MACROS_DIR.glob("*.json")]
-            return []
+            return [entry["name"] for entry in self.index.list()]
         except Exception as e:
             print(f"Error getting macros: {e}")
             return []
 
-    def get_macro_info(self, name: str) -> Optional[Dict[str, Any]]:
-        """Get metadata about a saved macro"""
+    def get_macro_library(self) -> List[Dict[str, Any]]:
+        """Get metadata (event count, duration, size, created, hash) for all saved macros"""
         try:
-            filename = MACROS_DIR / f"{name}.json"
-            if filename.exists():
-                with open(filename, "r") as f:
-                    return json.load(f)
+            return self.index.list()
+        except Exception as e:
+            print(f"Error getting macro library: {e}")
+            return []
+
+    def get_macro_info(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get metadata about a saved macro (from the index, without reading events)"""
+        if not self._validate_macro_name(name):
             return None
+        try:
+            return self.index.get(name)
         except Exception as e:
             print(f"Error getting macro info: {e}")
             return None
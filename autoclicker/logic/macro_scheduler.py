@@ -0,0 +1,133 @@
+# autoclicker/logic/macro_scheduler.py
+"""Macro Scheduler - One timer thread serving all scheduled macro starts"""
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Longest single wait; the due time is rechecked against the wall clock after each
+MAX_WAIT = 60.0
+
+
+class MacroScheduler:
+    """Runs callbacks at wall-clock times or fixed intervals from a single thread.
+
+    Due times are wall-clock timestamps (time.time()) in a heap; the thread sleeps
+    on a condition until the earliest one, so any number of schedules costs one
+    thread. Waits are capped at MAX_WAIT and the remaining delay is recomputed on
+    every wake, so clock steps (DST, NTP, suspend/resume) are picked up within a
+    minute. Cancelled jobs are dropped lazily when they reach the top of the heap.
+    Callbacks run on the scheduler thread and should only hand work off.
+    """
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._jobs: Dict[int, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def add(
+        self,
+        callback: Callable[[], None],
+        at: Optional[datetime] = None,
+        interval: Optional[float] = None,
+        label: str = "",
+    ) -> int:
+        """Schedule callback at `at` (default: now + interval), repeating every interval seconds"""
+        if at is None and not interval:
+            raise ValueError("Schedule needs a start time or an interval")
+        if interval is not None and interval <= 0:
+            raise ValueError("Interval must be positive")
+
+        with self._cond:
+            job_id = next(self._ids)
+            due = at.timestamp() if at is not None else time.time() + interval
+            self._jobs[job_id] = {"callback": callback, "interval": interval, "label": label, "due": due}
+            heapq.heappush(self._heap, (due, job_id))
+            self._ensure_thread()
+            self._cond.notify()
+        return job_id
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a scheduled job. Returns False if unknown."""
+        with self._cond:
+            if self._jobs.pop(job_id, None) is None:
+                return False
+            self._cond.notify()
+        return True
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        """Pending jobs with id, label, interval and next run (wall clock)"""
+        with self._cond:
+            return [
+                {
+                    "id": job_id,
+                    "label": job["label"],
+                    "interval": job["interval"],
+                    "next_run": datetime.fromtimestamp(job["due"]).isoformat(timespec="seconds"),
+                }
+                for job_id, job in sorted(self._jobs.items(), key=lambda item: item[1]["due"])
+            ]
+
+    def shutdown(self) -> None:
+        """Cancel all jobs and stop the scheduler thread"""
+        with self._cond:
+            self._jobs.clear()
+            self._heap.clear()
+            self._running = False
+            self._cond.notify()
+
+    def _ensure_thread(self) -> None:
+        """Start the scheduler thread on first use (caller holds the lock)"""
+        self._running = True
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Scheduler thread: sleep until the earliest due job, fire it, reschedule repeats"""
+        while True:
+            with self._cond:
+                callback = None
+                while self._running and callback is None:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+
+                    due, job_id = self._heap[0]
+                    job = self._jobs.get(job_id)
+                    if job is None or job["due"] != due:
+                        heapq.heappop(self._heap)
+                        continue
+
+                    remaining = due - time.time()
+                    if remaining > 0:
+                        self._cond.wait(min(remaining, MAX_WAIT))
+                        continue
+
+                    heapq.heappop(self._heap)
+                    callback = job["callback"]
+                    if job["interval"]:
+                        # Skip missed runs instead of firing a burst after a stall
+                        now = time.time()
+                        next_due = due + job["interval"]
+                        if next_due <= now:
+                            next_due = now + job["interval"]
+                        job["due"] = next_due
+                        heapq.heappush(self._heap, (next_due, job_id))
+                    else:
+                        del self._jobs[job_id]
+
+                if not self._running:
+                    self._thread = None
+                    return
+
+            try:
+                callback()
+            except Exception as e:
+                print(f"[ERROR] Scheduled macro failed: {e}")
@@ -0,0 +1,113 @@
+# autoclicker/logic/macro_simplify.py
+"""Macro Simplification - Time-aware Ramer-Douglas-Peucker for mouse paths"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+from .macro_geometry import GEOMETRY_FIELDS
+from .macro_io import MacroReader, MacroWriter, read_macro_header, split_macro_filename
+
+# Default maximum deviation from the recorded path (pixels)
+DEFAULT_TOLERANCE_PX = 2.0
+
+# Upper bound of buffered mouse_move events per run (bounds memory and RDP cost)
+MAX_RUN_LENGTH = 4096
+
+
+def simplify_run(run: List[Dict[str, Any]], tolerance: float) -> List[Dict[str, Any]]:
+    """Simplify one mouse_move run, keeping first and last point.
+
+    Uses the synchronized euclidean distance: each dropped point is compared
+    with the position interpolated *at its own timestamp* between the kept
+    neighbours, so playback timing along the path is preserved as well.
+    """
+    n = len(run)
+    if n <= 2:
+        return run
+
+    xs = [e["x"] for e in run]
+    ys = [e["y"] for e in run]
+    ts = [e["timestamp"] for e in run]
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    tol_sq = tolerance * tolerance
+
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        x0, y0, t0 = xs[first], ys[first], ts[first]
+        dx, dy, dt = xs[last] - x0, ys[last] - y0, ts[last] - t0
+
+        max_dist, index = -1.0, first
+        for i in range(first + 1, last):
+            ratio = (ts[i] - t0) / dt if dt > 0 else 0.0
+            ex = xs[i] - (x0 + dx * ratio)
+            ey = ys[i] - (y0 + dy * ratio)
+            dist = ex * ex + ey * ey
+            if dist > max_dist:
+                max_dist, index = dist, i
+
+        if max_dist > tol_sq:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [e for e, k in zip(run, keep) if k]
+
+
+def simplify_macro_file(
+    source: Union[str, Path],
+    target: Union[str, Path],
+    name: str,
+    tolerance: float = DEFAULT_TOLERANCE_PX,
+) -> Dict[str, int]:
+    """Stream source macro into target with simplified mouse paths.
+
+    Button, key and wheel events are copied unchanged. Returns a report with
+    event counts before and after.
+    """
+    geometry = {key: value for key, value in read_macro_header(source).items() if key in GEOMETRY_FIELDS}
+    tolerance_px = tolerance
+    if geometry.get("coordinates") == "normalized" and geometry.get("screen"):
+        # Pixel tolerance on the recording screen, in normalized units
+        tolerance = tolerance / max(geometry["screen"]["width"], geometry["screen"]["height"])
+
+    reader = MacroReader(source)
+    report = {"events_before": 0, "events_after": 0, "moves_before": 0, "moves_after": 0}
+    header = {"name": name, "created": datetime.now().isoformat(), "simplified_from": split_macro_filename(Path(source).name), "tolerance_px": tolerance_px, **geometry}
+
+    with MacroWriter(target, header) as writer:
+        run: List[Dict[str, Any]] = []
+
+        def flush_run(final: bool) -> None:
+            """Write simplified run; keep last point as anchor unless final"""
+            kept = simplify_run(run, tolerance)
+            tail = kept if final else kept[:-1]
+            for e in tail:
+                writer.write(e)
+            report["moves_after"] += len(tail)
+            run[:] = [] if final else kept[-1:]
+
+        for event in reader:
+            report["events_before"] += 1
+            if event.get("type") == "mouse_move":
+                report["moves_before"] += 1
+                run.append(event)
+                if len(run) >= MAX_RUN_LENGTH:
+                    flush_run(final=False)
+                continue
+
+            if run:
+                flush_run(final=True)
+            writer.write(event)
+
+        if run:
+            flush_run(final=True)
+
+        report["events_after"] = writer.event_count
+
+    return report
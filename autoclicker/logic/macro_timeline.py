@@ -0,0 +1,141 @@
+# autoclicker/logic/macro_timeline.py
+"""Macro Timeline - Level-of-detail summaries of a macro for drawing"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Width of the finest activity bucket (seconds)
+BASE_BUCKET = 0.01
+
+# The finest level has at most this many buckets; longer macros double the bucket width
+MAX_BASE_BUCKETS = 2 ** 16
+
+# Levels are added until the coarsest one has at most this many buckets / points
+MIN_LEVEL_SIZE = 64
+
+# Activity lanes counted per bucket
+TIMELINE_KINDS = ("moves", "clicks", "keys")
+
+
+def _pairwise_sums(counts: array) -> array:
+    """Next coarser level: each bucket is the sum of two neighbours"""
+    summed = array(counts.typecode, map(sum, zip(counts[0::2], counts[1::2])))
+    if len(counts) % 2:
+        summed.append(counts[-1])
+    return summed
+
+
+class MacroTimeline:
+    """Mouse path and activity counts of a macro at power-of-two levels of detail.
+
+    Activity level k has buckets of BASE_BUCKET * 2**k seconds counting moves,
+    clicks and key presses; path level k keeps every 2**k-th mouse position.
+    A view picks the coarsest level that still has about one bucket (or
+    point) per pixel, so drawing costs depend on the canvas size, not on the
+    macro length. Times are seconds from the first event. For macros longer
+    than MAX_BASE_BUCKETS base buckets, base_bucket is doubled until they fit,
+    so memory and build time stay bounded however long the macro runs.
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]], base_bucket: float = BASE_BUCKET):
+        move_t, move_x, move_y = array("d"), array("d"), array("d")
+        click_t, click_x, click_y = array("d"), array("d"), array("d")
+        key_t = array("d")
+        x = y = 0.0
+        first = None
+
+        for event in events:
+            if first is None:
+                first = event["timestamp"]
+            t = event["timestamp"] - first
+            event_type = event.get("type")
+            if event_type == "mouse_move":
+                x, y = event["x"], event["y"]
+                move_t.append(t)
+                move_x.append(x)
+                move_y.append(y)
+            elif event_type == "mouse_click":
+                if event.get("action", "down") == "down":
+                    click_t.append(t)
+                    click_x.append(x)
+                    click_y.append(y)
+            elif event_type == "key_event" and event.get("action") == "down":
+                key_t.append(t)
+
+        # max() instead of the last timestamp keeps hand-edited, unsorted macros in range
+        self.duration = max([0.0] + [max(times) for times in (move_t, click_t, key_t) if times])
+        self.event_count = len(move_t) + len(click_t) + len(key_t)
+        self.clicks = (click_t, click_x, click_y)
+        self.bounds = (
+            (min(move_x), min(move_y), max(move_x), max(move_y)) if move_t else (0.0, 0.0, 0.0, 0.0)
+        )
+
+        while self.duration / base_bucket >= MAX_BASE_BUCKETS:
+            base_bucket *= 2
+        self.base_bucket = base_bucket
+
+        # Activity pyramid: level -> {kind: counts}
+        size = int(self.duration / base_bucket) + 1
+        base: Dict[str, array] = {}
+        for kind, times in zip(TIMELINE_KINDS, (move_t, click_t, key_t)):
+            counts = array("I", bytes(4 * size))
+            for t in times:
+                counts[max(0, int(t / base_bucket))] += 1
+            base[kind] = counts
+        self._activity: List[Dict[str, array]] = [base]
+        while size > MIN_LEVEL_SIZE:
+            base = {kind: _pairwise_sums(counts) for kind, counts in base.items()}
+            size = len(base["moves"])
+            self._activity.append(base)
+
+        # Path pyramid: level -> (times, xs, ys)
+        level = (move_t, move_x, move_y)
+        self._paths: List[Tuple[array, array, array]] = [level]
+        while len(level[0]) > MIN_LEVEL_SIZE:
+            level = tuple(values[::2] for values in level)
+            self._paths.append(level)
+
+    def activity(self, start: float, end: float, buckets: int) -> Tuple[float, int, Dict[str, array]]:
+        """Counts per bucket for [start, end] with about `buckets` buckets.
+
+        Returns (bucket width in seconds, index of the first bucket, {kind: counts}).
+        """
+        span = max(end - start, self.base_bucket)
+        k = 0
+        while k + 1 < len(self._activity) and self.base_bucket * (2 ** k) * max(buckets, 1) < span:
+            k += 1
+        width = self.base_bucket * (2 ** k)
+        level = self._activity[k]
+        first = max(0, int(start / width))
+        last = int(end / width) + 1
+        return width, first, {kind: counts[first:last] for kind, counts in level.items()}
+
+    def path(self, start: float, end: float, max_points: int) -> List[float]:
+        """Mouse path in [start, end] as flat x, y coordinates, at most max_points points"""
+        for times, xs, ys in self._paths:
+            lo = bisect_left(times, start)
+            hi = bisect_right(times, end)
+            if hi - lo <= max_points or times is self._paths[-1][0]:
+                coords: List[float] = [0.0] * (2 * (hi - lo))
+                coords[0::2] = xs[lo:hi]
+                coords[1::2] = ys[lo:hi]
+                return coords
+        return []
+
+    def clicks_in(self, start: float, end: float, max_points: int) -> List[Tuple[float, float]]:
+        """Click positions in [start, end], thinned evenly to at most max_points"""
+        times, xs, ys = self.clicks
+        lo = bisect_left(times, start)
+        hi = bisect_right(times, end)
+        step = max(1, -(-(hi - lo) // max(max_points, 1)))
+        return list(zip(xs[lo:hi:step], ys[lo:hi:step]))
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals for the status line"""
+        return {
+            "duration": self.duration,
+            "moves": len(self._paths[0][0]),
+            "clicks": len(self.clicks[0]),
+            "keys": sum(self._activity[-1]["keys"]),
+        }
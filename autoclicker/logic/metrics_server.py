@@ -0,0 +1,153 @@
+# autoclicker/logic/metrics_server.py
+"""Metrics Server - Live metrics over HTTP in OpenMetrics text format (localhost only)"""
+
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .interval_histogram import IntervalHistogram
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Histogram bucket bounds (seconds) for intervals, lateness and latency
+HISTOGRAM_BOUNDS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric family: {"name", "type", "help", "samples": [(suffix, labels, value)]}
+Family = Dict[str, Any]
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Optional[Dict[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def gauge(name: str, help_text: str, value: float, labels: Optional[Dict[str, str]] = None) -> Family:
+    """Gauge family with one sample"""
+    return {"name": name, "type": "gauge", "help": help_text, "samples": [("", labels, value)]}
+
+
+def labelled_gauge(name: str, help_text: str, label: str, values: Dict[str, float]) -> Family:
+    """Gauge family with one sample per label value"""
+    return {"name": name, "type": "gauge", "help": help_text, "samples": [("", {label: key}, value) for key, value in values.items()]}
+
+
+def counter(name: str, help_text: str, value: float) -> Family:
+    """Counter family (exposed as name_total)"""
+    return {"name": name, "type": "counter", "help": help_text, "samples": [("_total", None, value)]}
+
+
+def histogram(name: str, help_text: str, source: IntervalHistogram, bounds: Sequence[float] = HISTOGRAM_BOUNDS) -> Family:
+    """Histogram family from an IntervalHistogram (cumulative buckets, count and sum in seconds)"""
+    counts, count, total = source.cumulative(bounds)
+    samples: List[Tuple[str, Optional[Dict[str, str]], float]] = [
+        ("_bucket", {"le": _format_value(float(bound))}, n) for bound, n in zip(bounds, counts)
+    ]
+    samples.append(("_bucket", {"le": "+Inf"}, count))
+    samples.append(("_count", None, count))
+    samples.append(("_sum", None, total))
+    return {"name": name, "type": "histogram", "help": help_text, "samples": samples}
+
+
+def render_metrics(families: Sequence[Family]) -> str:
+    """Families in OpenMetrics text format (terminated by # EOF)"""
+    lines = []
+    for family in families:
+        name = family["name"]
+        lines.append(f"# TYPE {name} {family['type']}")
+        lines.append(f"# HELP {name} {family['help']}")
+        for suffix, labels, value in family["samples"]:
+            lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """Resident set size of this process (psutil, or /proc on Linux), None if unknown"""
+    if PSUTIL_AVAILABLE:
+        try:
+            return psutil.Process().memory_info().rss
+        except Exception:
+            return None
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class MetricsServer:
+    """HTTP endpoint serving GET /metrics from one daemon thread.
+
+    collect() is called per scrape on the server thread and must only read
+    snapshots (no Tk access, no waiting on the clicker); scrapes are served
+    one at a time, so a slow scraper cannot pile up threads.
+    """
+
+    def __init__(self, collect: Callable[[], Sequence[Family]], host: str, port: int):
+        self.collect = collect
+        self.host = host
+        self.port = port
+        self._server: Optional[HTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Bind the port and start serving (raises OSError if the port is taken)"""
+        collect = self.collect
+
+        class Handler(BaseHTTPRequestHandler):
+            timeout = 5  # Drop connections that never send a request
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                try:
+                    body = render_metrics(collect()).encode("utf-8")
+                except Exception as e:
+                    print(f"[ERROR] Failed to collect metrics: {e}")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # No console line per scrape
+
+        self._server = HTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
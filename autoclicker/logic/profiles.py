@@ -2,18 +2,74 @@
 """Profile Management Logic - Save, load, delete profiles"""
 
 import json
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 try:
-    from jsonschema import validate, ValidationError
+    from jsonschema import Draft7Validator
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
-    print("Warning: jsonschema not installed. Profile validation disabled.")
+    print("Warning: jsonschema not installed. Using built-in profile validation.")
 
 from ..utils.validators import validate_profile_name
-from ..utils.constants import PROFILES_FILE, LAST_PROFILE_FILE
+from ..utils.constants import PROFILES_FILE, LAST_PROFILE_FILE, STATS_REFRESH_MS, MIN_STATS_REFRESH_MS, MAX_STATS_REFRESH_MS
+from .debounced_writer import DebouncedWriter
+
+# JSON Schema types -> Python types (bool is excluded from the numeric types, as in JSON Schema)
+_SCHEMA_TYPES = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int, float),
+    "boolean": (bool,),
+    "object": (dict,),
+    "array": (list,),
+    "null": (type(None),),
+}
+
+# Property keywords the built-in checks understand; schemas using anything else go through jsonschema
+_FIELD_KEYWORDS = {"type", "minimum", "maximum", "enum"}
+
+
+def _compile_field_checks(schema: Dict[str, Any]) -> Optional[List[tuple]]:
+    """Per-field checks (name, type, python types, minimum, maximum, enum) of a flat object schema, None if unsupported"""
+    if set(schema) - {"type", "properties", "additionalProperties"} or schema.get("type") != "object":
+        return None
+    if schema.get("additionalProperties", True) is not True:
+        return None
+    checks = []
+    for name, rules in schema.get("properties", {}).items():
+        if set(rules) - _FIELD_KEYWORDS or rules.get("type") not in _SCHEMA_TYPES:
+            return None
+        checks.append((name, rules["type"], _SCHEMA_TYPES[rules["type"]], rules.get("minimum"), rules.get("maximum"), rules.get("enum")))
+    return checks
+
+
+def _field_errors(checks: List[tuple], data: Any) -> List[str]:
+    """Messages for every field of data that breaks its check (same wording as jsonschema)"""
+    if not isinstance(data, dict):
+        return [f"(profile): {data!r} is not of type 'object'"]
+    errors = []
+    for name, type_name, types, minimum, maximum, enum in checks:
+        if name not in data:
+            continue
+        value = data[name]
+        # Each keyword is checked on its own, so one field can report several problems
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if type_name in ("number", "integer"):
+            type_ok = is_number and (type_name == "number" or not isinstance(value, float) or value.is_integer())
+        else:
+            type_ok = isinstance(value, types)
+        if not type_ok:
+            errors.append(f"{name}: {value!r} is not of type {type_name!r}")
+        if enum is not None and value not in enum:
+            errors.append(f"{name}: {value!r} is not one of {enum!r}")
+        if is_number and minimum is not None and value < minimum:
+            errors.append(f"{name}: {value!r} is less than the minimum of {minimum!r}")
+        if is_number and maximum is not None and value > maximum:
+            errors.append(f"{name}: {value!r} is greater than the maximum of {maximum!r}")
+    return errors
 
 
 class Profiles:
@@ -37,6 +93,8 @@ class Profiles:
             "notify_when_done": {"type": "boolean"},
             "click_while_pattern": {"type": "boolean"},
             "interrupt_on_move": {"type": "boolean"},
+            "macro_speed": {"type": "number", "minimum": 0.25, "maximum": 10},
+            "stats_refresh_ms": {"type": "integer", "minimum": MIN_STATS_REFRESH_MS, "maximum": MAX_STATS_REFRESH_MS},
             "language": {"type": "string"},
             "theme": {"type": "string"},
             "hotkeys": {"type": "object"}
@@ -45,27 +103,52 @@ class Profiles:
     }
 
     def __init__(self):
+        self._lock = threading.Lock()  # Guards self.profiles against the writer's snapshot
+        self._writer = DebouncedWriter()
         self.profiles = self._load_profiles_from_file()
 
     def _validate_profile_name(self, name: str) -> bool:
         """Validate profile name to prevent path traversal"""
         return validate_profile_name(name)
 
-    def _validate_profile_data(self, data: Dict[str, Any]) -> bool:
-        """Validate profile data against JSON schema"""
+    @classmethod
+    def _schema_checks(cls) -> Optional[List[tuple]]:
+        """Built-in field checks of PROFILE_SCHEMA (compiled once), None if the schema needs jsonschema"""
+        if "_compiled_checks" not in cls.__dict__:
+            cls._compiled_checks = _compile_field_checks(cls.PROFILE_SCHEMA)
+        return cls._compiled_checks
+
+    @classmethod
+    def _schema_validator(cls):
+        """Draft 7 validator of PROFILE_SCHEMA (schema checked and validator built once)"""
+        if "_compiled_validator" not in cls.__dict__:
+            Draft7Validator.check_schema(cls.PROFILE_SCHEMA)
+            cls._compiled_validator = Draft7Validator(cls.PROFILE_SCHEMA)
+        return cls._compiled_validator
+
+    def profile_errors(self, data: Any) -> List[str]:
+        """Every schema violation of profile data as 'field: message' (empty if valid)"""
+        checks = self._schema_checks()
+        if checks is not None:
+            return _field_errors(checks, data)
         if not JSONSCHEMA_AVAILABLE:
-            # If jsonschema is not available, skip validation
-            return isinstance(data, dict)
+            # Schema beyond the built-in checks and no jsonschema: only the shape can be checked
+            return [] if isinstance(data, dict) else [f"(profile): {data!r} is not of type 'object'"]
+        return [
+            f"{'/'.join(str(part) for part in error.absolute_path) or '(profile)'}: {error.message}"
+            for error in self._schema_validator().iter_errors(data)
+        ]
 
+    def _validate_profile_data(self, data: Dict[str, Any]) -> bool:
+        """Validate profile data against JSON schema"""
         try:
-            validate(instance=data, schema=self.PROFILE_SCHEMA)
-            return True
-        except ValidationError as e:
-            print(f"Invalid profile data: {e.message}")
-            return False
+            errors = self.profile_errors(data)
         except Exception as e:
             print(f"Error validating profile: {e}")
             return False
+        for error in errors:
+            print(f"Invalid profile data: {error}")
+        return not errors
 
     def _load_profiles_from_file(self) -> Dict[str, Dict[str, Any]]:
         """Load all profiles from JSON file"""
@@ -79,22 +162,23 @@ class Profiles:
         return {"Default": {}}
 
     def _save_profiles_to_file(self) -> bool:
-        """Save all profiles to JSON file"""
-        try:
-            with open(self.PROFILES_FILE, "w") as f:
-                json.dump(self.profiles, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error saving profiles: {e}")
-            return False
+        """Queue an atomic rewrite of the profiles file (coalesced, serialised on the writer thread)"""
+        self._writer.schedule(self.PROFILES_FILE, self._encode_profiles)
+        return True
+
+    def _encode_profiles(self) -> bytes:
+        """Profiles file contents (writer thread; profile dicts are replaced, never mutated, so a shallow copy is enough)"""
+        with self._lock:
+            snapshot = dict(self.profiles)
+        return json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
 
     def save_last_profile(self, name: str) -> None:
         """Save last active profile name for auto-loading"""
-        try:
-            with open(self.LAST_PROFILE_FILE, "w") as f:
-                json.dump({"last_profile": name}, f)
-        except Exception as e:
-            print(f"Error saving last profile: {e}")
+        self._writer.schedule(self.LAST_PROFILE_FILE, lambda: json.dumps({"last_profile": name}).encode("utf-8"))
+
+    def flush(self) -> None:
+        """Write pending profile changes now (called on exit)"""
+        self._writer.flush()
 
     def load_last_profile(self) -> Optional[str]:
         """Load last active profile name"""
@@ -129,7 +213,8 @@ class Profiles:
         # Use copy to avoid mutating the original settings dict
         default = self.get_default_profile()
         default.update(settings.copy())
-        self.profiles[name] = default
+        with self._lock:
+            self.profiles[name] = default
 
         return self._save_profiles_to_file()
 
@@ -143,7 +228,8 @@ class Profiles:
             return False
 
         if name in self.profiles:
-            del self.profiles[name]
+            with self._lock:
+                del self.profiles[name]
             return self._save_profiles_to_file()
 
         return False
@@ -174,16 +260,23 @@ class Profiles:
             with open(filename, "r") as f:
                 imported = json.load(f)
 
+            # Check every profile before rejecting the file, so all problems are reported at once
+            valid = True
             for profile_name, profile_data in imported.items():
                 if not self._validate_profile_name(profile_name):
                     print(f"Error: Invalid profile name in import: '{profile_name}'")
-                    return False
+                    valid = False
+                    continue
 
-                if not self._validate_profile_data(profile_data):
-                    print(f"Error: Invalid profile data for '{profile_name}'")
-                    return False
+                for error in self.profile_errors(profile_data):
+                    print(f"Error: Invalid profile data for '{profile_name}': {error}")
+                    valid = False
+
+            if not valid:
+                return False
 
-            self.profiles.update(imported)
+            with self._lock:
+                self.profiles.update(imported)
             return self._save_profiles_to_file()
         except Exception as e:
             print(f"Error importing profiles: {e}")
@@ -212,6 +305,8 @@ class Profiles:
             "notify_when_done": False,
             "click_while_pattern": True,
             "interrupt_on_move": False,
+            "macro_speed": 1.0,
+            "stats_refresh_ms": STATS_REFRESH_MS,
             "language": "English",
             "theme": "cyborg",
             "hotkeys": {
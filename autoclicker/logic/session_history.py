@@ -0,0 +1,302 @@
+# autoclicker/logic/session_history.py
+"""Session History - Clicker sessions persisted in a local SQLite database"""
+
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .interval_histogram import IntervalHistogram
+
+SCHEMA_VERSION = 2
+
+# Sessions written per transaction at most, and how long the writer waits to fill a batch (seconds)
+WRITE_BATCH = 256
+WRITE_LINGER = 0.5
+
+# Rows per history page
+PAGE_SIZE = 50
+
+# Session columns in insert order (id is assigned by SQLite)
+SESSION_COLUMNS = (
+    "profile", "started", "ended", "day", "clicks", "rate", "peak_rate",
+    "p50", "p90", "p99", "p999", "max_interval", "jitter", "config_hash", "config",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    started REAL NOT NULL,
+    ended REAL NOT NULL,
+    day TEXT NOT NULL,
+    clicks INTEGER NOT NULL,
+    rate REAL NOT NULL,
+    peak_rate REAL NOT NULL,
+    p50 REAL NOT NULL,
+    p90 REAL NOT NULL,
+    p99 REAL NOT NULL,
+    p999 REAL NOT NULL,
+    max_interval REAL NOT NULL,
+    jitter REAL NOT NULL,
+    config_hash TEXT NOT NULL,
+    config TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_started ON sessions (started);
+CREATE INDEX IF NOT EXISTS sessions_profile ON sessions (profile, started);
+CREATE INDEX IF NOT EXISTS sessions_day ON sessions (day);
+CREATE TABLE IF NOT EXISTS profile_totals (
+    profile TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL,
+    clicks INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    first_started REAL NOT NULL,
+    last_ended REAL NOT NULL,
+    max_p99 REAL NOT NULL,
+    histogram BLOB
+);
+"""
+
+# Schema 1 databases have sessions but no totals: start the totals from them (no histograms)
+_BACKFILL_TOTALS = """
+INSERT OR IGNORE INTO profile_totals (profile, sessions, clicks, seconds, first_started, last_ended, max_p99, histogram)
+SELECT profile, COUNT(*), SUM(clicks), SUM(ended - started), MIN(started), MAX(ended), MAX(p99), NULL
+FROM sessions GROUP BY profile
+"""
+
+_UPSERT_TOTALS = """
+INSERT INTO profile_totals (profile, sessions, clicks, seconds, first_started, last_ended, max_p99, histogram)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (profile) DO UPDATE SET
+    sessions = sessions + excluded.sessions,
+    clicks = clicks + excluded.clicks,
+    seconds = seconds + excluded.seconds,
+    first_started = MIN(first_started, excluded.first_started),
+    last_ended = MAX(last_ended, excluded.last_ended),
+    max_p99 = MAX(max_p99, excluded.max_p99),
+    histogram = excluded.histogram
+"""
+
+# Keyset cursor: (started, id) of the last row of a page
+Cursor = Tuple[float, int]
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Stable short hash of clicker settings (same settings -> same hash)"""
+    encoded = json.dumps(config, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def session_record(
+    profile: str,
+    started: float,
+    ended: float,
+    clicks: int,
+    peak_rate: float,
+    intervals: Dict[str, Any],
+    config: Dict[str, Any],
+    histogram: Optional[bytes] = None,
+) -> Dict[str, Any]:
+    """Row for one finished session (intervals: IntervalHistogram.summary(), histogram: its to_bytes())"""
+    percentiles = intervals["percentiles"]
+    duration = max(ended - started, 0.0)
+    return {
+        "profile": profile,
+        "started": started,
+        "ended": ended,
+        "day": datetime.fromtimestamp(started).strftime("%Y-%m-%d"),
+        "clicks": clicks,
+        "rate": clicks / duration if duration > 0 else 0.0,
+        "peak_rate": peak_rate,
+        "p50": percentiles.get(50.0, 0.0),
+        "p90": percentiles.get(90.0, 0.0),
+        "p99": percentiles.get(99.0, 0.0),
+        "p999": percentiles.get(99.9, 0.0),
+        "max_interval": intervals["max"],
+        "jitter": intervals["jitter"],
+        "config_hash": config_hash(config),
+        "config": json.dumps(config, sort_keys=True),
+        "histogram": histogram,
+    }
+
+
+class SessionHistory:
+    """Session database (WAL mode) with a background writer.
+
+    record() only queues the row; a writer thread inserts queued rows in
+    batched transactions, so the GUI thread never waits for the disk.
+    Reads use a separate connection and are served from indexes: history
+    pages use keyset pagination on (started, id) and aggregates group on
+    indexed profile/day columns. Lifetime totals per profile (with the
+    merged interval histogram) are updated in the same transaction as the
+    session insert, so reading them is a single-row lookup.
+    """
+
+    def __init__(self, path: Union[str, Path], on_written: Optional[Callable[[int], None]] = None):
+        self.path = Path(path)
+        self.on_written = on_written
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self._read_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and make sure the schema exists"""
+        connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with connection:
+                connection.executescript(_SCHEMA)
+                if version < 2:
+                    connection.execute(_BACKFILL_TOTALS)
+                connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        return connection
+
+    # === Writing ===
+
+    def record(self, session: Dict[str, Any]) -> None:
+        """Queue a finished session (see session_record) for writing"""
+        with self._start_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="SessionHistoryWriter", daemon=True)
+                self._writer.start()
+        self._queue.put(session)
+
+    def _write_loop(self) -> None:
+        """Writer thread: insert queued sessions in batches until close()"""
+        try:
+            connection = self._connect()
+        except Exception as e:
+            print(f"[ERROR] Failed to open session history: {e}")
+            return
+        insert = f"INSERT INTO sessions ({', '.join(SESSION_COLUMNS)}) VALUES ({', '.join('?' * len(SESSION_COLUMNS))})"
+
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Linger briefly so sessions finishing together share one transaction
+            while len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get(timeout=WRITE_LINGER))
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+            rows = [tuple(s[c] for c in SESSION_COLUMNS) for s in batch if s is not None]
+            if not rows:
+                continue
+            try:
+                with connection:
+                    connection.executemany(insert, rows)
+                    self._update_totals(connection, [s for s in batch if s is not None])
+            except Exception as e:
+                print(f"[ERROR] Failed to write {len(rows)} session(s) to history: {e}")
+                continue
+            if self.on_written:
+                self.on_written(len(rows))
+        connection.close()
+
+    @staticmethod
+    def _update_totals(connection: sqlite3.Connection, sessions: List[Dict[str, Any]]) -> None:
+        """Add sessions to their profiles' lifetime totals (writer thread, inside the insert transaction)"""
+        by_profile: Dict[str, List[Dict[str, Any]]] = {}
+        for session in sessions:
+            by_profile.setdefault(session["profile"], []).append(session)
+
+        for profile, items in by_profile.items():
+            row = connection.execute("SELECT histogram FROM profile_totals WHERE profile = ?", (profile,)).fetchone()
+            merged = IntervalHistogram.from_bytes(row[0]) if row and row[0] else IntervalHistogram()
+            for session in items:
+                if session.get("histogram"):
+                    merged.merge(IntervalHistogram.from_bytes(session["histogram"]))
+            connection.execute(_UPSERT_TOTALS, (
+                profile,
+                len(items),
+                sum(s["clicks"] for s in items),
+                sum(s["ended"] - s["started"] for s in items),
+                min(s["started"] for s in items),
+                max(s["ended"] for s in items),
+                max(s["p99"] for s in items),
+                merged.to_bytes(),
+            ))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write all queued sessions, then stop the writer and close connections"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout)
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    # === Reading ===
+
+    def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run a read query on the shared reader connection"""
+        with self._read_lock:
+            if self._reader is None:
+                if not self.path.exists():
+                    return []
+                self._reader = self._connect()
+                self._reader.row_factory = sqlite3.Row
+            return self._reader.execute(sql, params).fetchall()
+
+    def page(self, after: Optional[Cursor] = None, profile: Optional[str] = None, limit: int = PAGE_SIZE) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
+        """Newest-first sessions after a cursor. Returns (rows, cursor of the next page or None)."""
+        where, params = [], []
+        if profile:
+            where.append("profile = ?")
+            params.append(profile)
+        if after is not None:
+            where.append("(started, id) < (?, ?)")
+            params.extend(after)
+        sql = "SELECT * FROM sessions"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY started DESC, id DESC LIMIT ?"
+        rows = [dict(row) for row in self._query(sql, (*params, limit + 1))]
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return rows, ((rows[-1]["started"], rows[-1]["id"]) if more else None)
+
+    def count(self, profile: Optional[str] = None) -> int:
+        """Number of stored sessions (of one profile)"""
+        if profile:
+            rows = self._query("SELECT COUNT(*) AS n FROM sessions WHERE profile = ?", (profile,))
+        else:
+            rows = self._query("SELECT COUNT(*) AS n FROM sessions")
+        return rows[0]["n"] if rows else 0
+
+    def per_profile(self) -> List[Dict[str, Any]]:
+        """Sessions, clicks, click time, average rate and worst p99 per profile (from the lifetime totals)"""
+        return [dict(row) for row in self._query(
+            "SELECT profile AS label, sessions, clicks, seconds, clicks / MAX(seconds, 1e-9) AS rate, "
+            "max_p99 AS p99 FROM profile_totals ORDER BY clicks DESC"
+        )]
+
+    def profile_totals(self, profile: str) -> Optional[Dict[str, Any]]:
+        """Lifetime totals of one profile with its merged interval summary (None before its first session)"""
+        rows = self._query("SELECT * FROM profile_totals WHERE profile = ?", (profile,))
+        if not rows:
+            return None
+        totals = dict(rows[0])
+        blob = totals.pop("histogram")
+        totals["intervals"] = (IntervalHistogram.from_bytes(blob) if blob else IntervalHistogram()).summary()
+        return totals
+
+    def per_day(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Same aggregates per day for the most recent `days` days with sessions"""
+        return [dict(row) for row in self._query(
+            "SELECT day AS label, COUNT(*) AS sessions, SUM(clicks) AS clicks, "
+            "SUM(ended - started) AS seconds, SUM(clicks) / MAX(SUM(ended - started), 1e-9) AS rate, "
+            "MAX(p99) AS p99 FROM sessions GROUP BY day ORDER BY day DESC LIMIT ?",
+            (days,),
+        )]
@@ -3,6 +3,9 @@
 
 from typing import Callable, Dict, Union, Optional, TYPE_CHECKING
 import sys
+import time
+
+from .interval_histogram import IntervalHistogram
 
 try:
     from pynput import keyboard
@@ -32,6 +35,7 @@ class SetupHotkeys:
         self.registered_hotkeys: Dict[str, Callable] = {}
         self._listener = None
         self._active_combinations = {}
+        self.latency = IntervalHistogram()  # Key press to hotkey callback done (metrics)
 
     def _normalize_key(self, key_str: str) -> Optional[Union['Key', 'KeyCode']]:
         """Convert string key to pynput Key or KeyCode"""
@@ -130,10 +134,12 @@ class SetupHotkeys:
         def on_press(key):
             # Check if this key has a registered callback
             if key in self._active_combinations:
+                started = time.perf_counter()
                 try:
                     self._active_combinations[key]()
                 except Exception as e:
                     print(f"Error executing hotkey callback: {e}")
+                self.latency.record(time.perf_counter() - started)
 
         self._listener = keyboard.Listener(on_press=on_press)
         self._listener.start()
@@ -1,13 +1,29 @@
 # autoclicker/logic/stats.py
 """Statistics Logic - Session tracking and reporting"""
 
+import csv
+import json
+import math
 import threading
 import time
-from typing import Callable, Optional, Tuple
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
 
+from .interval_histogram import IntervalHistogram, percentile_name
+
+# Seconds kept by the per-second time series (24 h, ~690 KB)
+SERIES_CAPACITY = 86400
+
+# Time constant of the exponentially weighted click rate (seconds)
+RATE_EWMA_TAU = 1.0
+
+# Sliding windows of the instantaneous click rate (seconds) and sub-buckets per window
+RATE_WINDOWS = (1.0, 10.0)
+RATE_BUCKETS = 10
+
 
 class ExportResult(Enum):
     """Result codes for stats export operation"""
@@ -17,16 +33,220 @@ class ExportResult(Enum):
     WRITE_ERROR = "write_error"
 
 
+class SecondSeries:
+    """Ring buffer of per-second click counts and max click latency.
+
+    Slot i holds second i (since start) modulo capacity, so memory is fixed
+    and the newest `capacity` seconds are always available. record() is O(1)
+    per click; crossing into a new second zeroes the slots skipped since the
+    last click (at most capacity of them). Times are time.perf_counter()
+    readings, so clock steps do not shift seconds.
+    """
+
+    def __init__(self, capacity: int = SERIES_CAPACITY):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._origin = None  # perf_counter() of second 0
+        self._reset()
+
+    def start(self, now: float) -> None:
+        """Clear the series and count seconds from now"""
+        with self._lock:
+            self._reset()
+            self._origin = now
+
+    def clear(self) -> None:
+        """Drop all samples (the next start() begins a new series)"""
+        with self._lock:
+            self._reset()
+            self._origin = None
+
+    def _reset(self) -> None:
+        """Empty buffers (lock held)"""
+        self._clicks = array("I", bytes(4 * self.capacity))
+        self._latency = array("f", bytes(4 * self.capacity))  # Seconds
+        self._last = -1  # Newest second written
+
+    def _advance(self, second: int) -> None:
+        """Zero the slots of seconds without clicks up to second (lock held)"""
+        for s in range(max(self._last + 1, second - self.capacity + 1), second + 1):
+            slot = s % self.capacity
+            self._clicks[slot] = 0
+            self._latency[slot] = 0.0
+        self._last = second
+
+    def record(self, now: float, latency: float = 0.0) -> None:
+        """Count one click at time now that took latency seconds"""
+        with self._lock:
+            if self._origin is None:
+                self._origin = now
+            second = int(now - self._origin)
+            if second > self._last:
+                self._advance(second)
+            elif second <= self._last - self.capacity or second < 0:
+                return  # Older than the buffer
+            slot = second % self.capacity
+            self._clicks[slot] += 1
+            if latency > self._latency[slot]:
+                self._latency[slot] = latency
+
+    def window(self, seconds: int, now: Optional[float] = None, points: Optional[int] = None) -> Tuple[List[float], List[float]]:
+        """Click rates and max latencies of the last `seconds` seconds, oldest first.
+
+        Seconds without clicks count as 0. With points, consecutive seconds are
+        merged into at most that many buckets (average rate, max latency).
+        """
+        seconds = max(1, min(int(seconds), self.capacity))
+        with self._lock:
+            if self._origin is None:
+                size = min(seconds, points or seconds)
+                return [0.0] * size, [0.0] * size
+            end = int((time.perf_counter() if now is None else now) - self._origin)
+            if end > self._last:
+                self._advance(end)
+            end = self._last
+            first = end - seconds + 1
+            clicks, latency = [], []
+            for s in range(first, end + 1):
+                if s < 0:
+                    clicks.append(0)
+                    latency.append(0.0)
+                else:
+                    clicks.append(self._clicks[s % self.capacity])
+                    latency.append(self._latency[s % self.capacity])
+
+        if not points or points >= seconds:
+            return [float(c) for c in clicks], latency
+        size = -(-seconds // points)
+        return (
+            [sum(clicks[i:i + size]) / len(clicks[i:i + size]) for i in range(0, seconds, size)],
+            [max(latency[i:i + size]) for i in range(0, seconds, size)],
+        )
+
+    def summary(self, seconds: int, now: Optional[float] = None) -> dict:
+        """Average and peak click rate and max latency over the last `seconds` seconds"""
+        clicks, latency = self.window(seconds, now)
+        return {
+            "seconds": len(clicks),
+            "clicks": int(sum(clicks)),
+            "rate": sum(clicks) / len(clicks),
+            "peak_rate": max(clicks),
+            "max_latency": max(latency),
+        }
+
+
+class SlidingCount:
+    """Clicks within the last `window` seconds, kept in a ring of sub-buckets.
+
+    add() is O(1) amortised: moving to a newer bucket empties the buckets
+    that fell out of the window and subtracts them from the running total.
+    """
+
+    def __init__(self, window: float, buckets: int = RATE_BUCKETS):
+        self.window = window
+        self.buckets = buckets
+        self.width = window / buckets
+        self._counts = array("I", bytes(4 * buckets))
+        self._total = 0
+        self._current = None  # Newest bucket number (absolute time / width)
+
+    def _advance(self, bucket: int) -> None:
+        """Make bucket the newest one, emptying buckets that left the window"""
+        if self._current is None or bucket - self._current >= self.buckets:
+            self._counts = array("I", bytes(4 * self.buckets))
+            self._total = 0
+        elif bucket > self._current:
+            for b in range(self._current + 1, bucket + 1):
+                slot = b % self.buckets
+                self._total -= self._counts[slot]
+                self._counts[slot] = 0
+        else:
+            return
+        self._current = bucket
+
+    def add(self, now: float) -> None:
+        """Count one click at time now"""
+        bucket = int(now / self.width)
+        self._advance(bucket)
+        if bucket > self._current - self.buckets:
+            self._counts[bucket % self.buckets] += 1
+            self._total += 1
+
+    def rate(self, now: float, since: float) -> float:
+        """Clicks per second over the window ending now (shorter right after `since`)"""
+        bucket = int(now / self.width)
+        self._advance(bucket)
+        span = min((self.buckets - 1) * self.width + (now - bucket * self.width), now - since)
+        return self._total / span if span > 0 else 0.0
+
+
+class ClickRate:
+    """Instantaneous click rate: an EWMA plus sliding-window counts, O(1) per click.
+
+    The EWMA decays with time constant RATE_EWMA_TAU between clicks, so it
+    follows rate changes within a few seconds instead of averaging over the
+    whole session; the sliding windows give the plain count-based rates.
+    Times are time.perf_counter() readings.
+    """
+
+    def __init__(self, tau: float = RATE_EWMA_TAU, windows: Tuple[float, ...] = RATE_WINDOWS):
+        self.tau = tau
+        self.window_lengths = windows
+        self._lock = threading.Lock()
+        self.clear()
+
+    def _reset(self, origin: Optional[float]) -> None:
+        """Empty estimators (lock held)"""
+        self._origin = origin
+        self._ewma = 0.0
+        self._last = None
+        self._windows = [SlidingCount(w) for w in self.window_lengths]
+
+    def start(self, now: float) -> None:
+        """Clear the estimators and measure from now"""
+        with self._lock:
+            self._reset(now)
+
+    def clear(self) -> None:
+        """Drop all clicks"""
+        with self._lock:
+            self._reset(None)
+
+    def record(self, now: float) -> None:
+        """Count one click at time now"""
+        with self._lock:
+            if self._origin is None:
+                self._origin = now
+            if self._last is not None:
+                self._ewma *= math.exp(-max(now - self._last, 0.0) / self.tau)
+            self._ewma += 1.0 / self.tau
+            self._last = now
+            for window in self._windows:
+                window.add(now)
+
+    def rates(self, now: Optional[float] = None) -> Dict[str, object]:
+        """EWMA rate and {window seconds: rate} at time now, in clicks per second"""
+        now = time.perf_counter() if now is None else now
+        with self._lock:
+            if self._last is None:
+                return {"ewma": 0.0, "windows": {w: 0.0 for w in self.window_lengths}}
+            return {
+                "ewma": self._ewma * math.exp(-max(now - self._last, 0.0) / self.tau),
+                "windows": {w.window: w.rate(now, self._origin) for w in self._windows},
+            }
+
+
 class Stats:
     """Manages session statistics and reporting"""
 
     def __init__(self):
         self._lock = threading.Lock()
         self._session_start = None
+        self._started = None  # perf_counter() at session start (elapsed time, series, rates)
         self._total_clicks = 0
-        self.stats_thread = None
-        self._stop_stats_thread = False
-        self._stop_lock = threading.Lock()
+        self.series = SecondSeries()
+        self.intervals = IntervalHistogram()
+        self.rates = ClickRate()
 
     @property
     def session_start(self):
@@ -48,22 +268,33 @@ class Stats:
         with self._lock:
             self._total_clicks = value
 
+    def elapsed(self) -> float:
+        """Seconds since the session started (monotonic, 0 without a session)"""
+        started = self._started
+        return time.perf_counter() - started if started is not None else 0.0
+
     def start_session(self):
         """Start a new session"""
         self.session_start = time.time()
+        self._started = time.perf_counter()
         self.total_clicks = 0
+        self.series.start(self._started)
+        self.intervals.clear()
+        self.rates.start(self._started)
 
     def update_stats(
         self,
         total_clicks: int,
-        on_stats_changed: Callable[[str, str, str], None],
+        on_stats_changed: Callable[[str, str, str, dict], None],
+        running: bool = True,
     ):
-        """Update statistics display"""
+        """Update statistics display: session time, lifetime average and instantaneous rates"""
 
         if not self.session_start:
             return
 
-        elapsed = time.time() - self.session_start
+        now = time.perf_counter()
+        elapsed = now - self._started
         hours, remainder = divmod(int(elapsed), 3600)
         minutes, seconds = divmod(remainder, 60)
         session_time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
@@ -71,40 +302,19 @@ class Stats:
         click_rate = total_clicks / elapsed if elapsed > 0 else 0
         click_rate_str = f"{click_rate:.1f} clicks/s"
 
-        on_stats_changed(session_time_str, click_rate_str, f"{total_clicks} clicks")
+        # A stopped clicker clicks at 0/s, whatever the last clicks suggest
+        rates = self.rates.rates(now) if running else {"ewma": 0.0, "windows": {w: 0.0 for w in self.rates.window_lengths}}
 
-    def start_background_updater(
-        self,
-        total_clicks_getter: Callable[[], int],
-        on_stats_changed: Callable[[str, str, str], None],
-    ):
-        """Start background thread for continuous stats updates"""
-
-        with self._stop_lock:
-            self._stop_stats_thread = False
-
-        def update_loop():
-            while True:
-                with self._stop_lock:
-                    if self._stop_stats_thread:
-                        break
-                if self.session_start:
-                    current_clicks = total_clicks_getter()
-                    self.update_stats(current_clicks, on_stats_changed)
-                time.sleep(1)
-
-        self.stats_thread = threading.Thread(target=update_loop, daemon=True)
-        self.stats_thread.start()
-
-    def stop_background_updater(self):
-        """Stop background stats updater"""
-        with self._stop_lock:
-            self._stop_stats_thread = True
+        on_stats_changed(session_time_str, click_rate_str, f"{total_clicks} clicks", rates)
 
     def reset_stats(self):
         """Reset all statistics"""
         self.session_start = None
+        self._started = None
         self.total_clicks = 0
+        self.series.clear()
+        self.intervals.clear()
+        self.rates.clear()
 
     def export_stats(
         self,
@@ -114,15 +324,45 @@ class Stats:
         click_rate_str: str,
         profile_name: str,
     ) -> Tuple[ExportResult, str]:
-        """Export statistics to file. Returns (ExportResult, message)."""
+        """Export statistics to file (.csv: metric/value rows, .json: with the mergeable interval histogram). Returns (ExportResult, message)."""
         path = Path(filename)
 
         # === Validate path ===
         if not path.parent.exists():
             return ExportResult.INVALID_PATH, f"Verzeichnis existiert nicht: {path.parent}"
 
+        intervals = self.intervals.summary()
         try:
             with open(path, "w", encoding="utf-8") as f:
+                if path.suffix.lower() == ".json":
+                    json.dump({
+                        "date": datetime.now().isoformat(timespec="seconds"),
+                        "total_clicks": total_clicks,
+                        "session_time": session_time_str,
+                        "click_rate": click_rate_str,
+                        "profile": profile_name,
+                        "intervals": dict(intervals, percentiles={percentile_name(p): v for p, v in intervals["percentiles"].items()}),
+                        "interval_histogram": self.intervals.to_dict(),
+                    }, f, indent=2)
+                    return ExportResult.SUCCESS, str(path)
+
+                if path.suffix.lower() == ".csv":
+                    writer = csv.writer(f, lineterminator="\n")
+                    writer.writerow(["metric", "value"])
+                    writer.writerows([
+                        ["date", datetime.now().isoformat(timespec="seconds")],
+                        ["total_clicks", total_clicks],
+                        ["session_time", session_time_str],
+                        ["click_rate", click_rate_str],
+                        ["profile", profile_name],
+                        ["interval_count", intervals["count"]],
+                    ])
+                    if intervals["count"]:
+                        writer.writerows([f"interval_{percentile_name(p)}_ms", f"{v * 1000:.3f}"] for p, v in intervals["percentiles"].items())
+                        writer.writerow(["interval_max_ms", f"{intervals['max'] * 1000:.3f}"])
+                        writer.writerow(["interval_jitter_ms", f"{intervals['jitter'] * 1000:.3f}"])
+                    return ExportResult.SUCCESS, str(path)
+
                 f.write("ClickMAX Statistics\n")
                 f.write("=" * 40 + "\n")
                 f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -130,6 +370,12 @@ class Stats:
                 f.write(f"Session Time: {session_time_str}\n")
                 f.write(f"Click Rate: {click_rate_str}\n")
                 f.write(f"Profile Used: {profile_name}\n")
+                if intervals["count"]:
+                    f.write(f"Click Intervals: {intervals['count']}\n")
+                    for p, value in intervals["percentiles"].items():
+                        f.write(f"  {percentile_name(p)}: {value * 1000:.3f} ms\n")
+                    f.write(f"  max: {intervals['max'] * 1000:.3f} ms\n")
+                    f.write(f"  jitter: {intervals['jitter'] * 1000:.3f} ms\n")
             return ExportResult.SUCCESS, str(path)
 
         except PermissionError:
@@ -1,11 +1,22 @@
 # autoclicker/model.py
 """ApplicationModel - Central MVC Controller (Facade Pattern)"""
 
+import threading
+import time
+from datetime import datetime
 from typing import Callable, Optional
 from tkinter import StringVar, IntVar, BooleanVar
 from autoclicker.logic import (Clicker, CaptureCoordinates, Stats, Profiles, SetupHotkeys, MacroRecording)
+from autoclicker.logic.dry_run import DEFAULT_HORIZON, DEFAULT_SCREEN, simulate_clicker
+from autoclicker.logic.click_heatmap import ClickHeatmap
+from autoclicker.logic.click_log import ClickEventLog
+from autoclicker.logic.metrics_server import MetricsServer, counter, gauge, histogram, labelled_gauge, resident_memory_bytes
+from autoclicker.logic.macro_geometry import screen_geometry
+from autoclicker.logic.session_history import SessionHistory, session_record
+from autoclicker.logic.stats import SERIES_CAPACITY
+from autoclicker.events import CLICKER_COMPLETED, CLICKER_STOPPED, CLICK_LOG_STARTED, CLICK_LOG_STOPPED, CLICK_LOG_ERROR, HEATMAP_EXPORTED, HEATMAP_EXPORT_ERROR
 from autoclicker.utils import (ThemeManager, NotificationManager, TranslationManager)
-from autoclicker.utils.constants import (LANGUAGE_CODES, LANGUAGE_DISPLAY_NAMES, HOTKEY_DISPLAY_TO_INTERNAL)
+from autoclicker.utils.constants import (LANGUAGE_CODES, LANGUAGE_DISPLAY_NAMES, HOTKEY_DISPLAY_TO_INTERNAL, HISTORY_FILE, METRICS_HOST)
 from autoclicker.utils.validators import validate_hotkey
 
 
@@ -17,6 +28,8 @@ class ApplicationModel:
         self.total_clicks = None
         self.session_time = None
         self.click_rate = None
+        self.instant_rate = None
+        self.rate_windows = None
         self.language = None
         self.current_profile = None
 
@@ -26,6 +39,7 @@ class ApplicationModel:
         self.on_coordinates_captured = None
         self.on_language_update = None
         self.on_macro_status_update = None
+        self.on_history_changed = None
         self._notify_callback = None
 
         # === Hotkey Callback Registry ===
@@ -35,9 +49,17 @@ class ApplicationModel:
         self.clicker = Clicker()
         self.capture = CaptureCoordinates()
         self.stats = Stats()
+        self.clicker.series = self.stats.series
+        self.clicker.intervals = self.stats.intervals
+        self.clicker.rates = self.stats.rates
         self.profiles = Profiles()
         self.hotkeys = SetupHotkeys()
         self.macro = MacroRecording(hotkeys=self.hotkeys.get_all_hotkeys())
+        self.session_heatmap: Optional[ClickHeatmap] = None
+        self.history = SessionHistory(HISTORY_FILE, on_written=self._on_history_written)
+        self._active_session: Optional[dict] = None  # Profile and settings of the running clicker session
+        self._session_lock = threading.Lock()
+        self.metrics_server: Optional[MetricsServer] = None
 
         # === Utility Components ===
         self.theme_manager = ThemeManager()
@@ -50,6 +72,8 @@ class ApplicationModel:
         self.total_clicks = IntVar(value=0)
         self.session_time = StringVar(value="00:00:00")
         self.click_rate = StringVar(value="0 clicks/s")
+        self.instant_rate = StringVar(value="0 clicks/s")
+        self.rate_windows = StringVar(value="")
         self.language = StringVar(value=self._lang_code_to_name(self.translation_manager.get_current_language()))
         self.language.trace_add("write", self._on_language_changed)
         self.current_profile = StringVar(value="Default")
@@ -190,6 +214,23 @@ class ApplicationModel:
         button_bounds: tuple[int,int,int,int] = None
     ):
         """Start or stop the auto-clicker"""
+        if not self.is_clicker_running():
+            with self._session_lock:
+                self._active_session = {
+                    "profile": self.current_profile.get() if self.current_profile else "Default",
+                    "config": {
+                        "delay": delay,
+                        "duration": duration,
+                        "fixed_x": fixed_x or None,
+                        "fixed_y": fixed_y or None,
+                        "click_type": click_type,
+                        "pattern": pattern,
+                        "pattern_size": pattern_size,
+                        "repeat": repeat,
+                        "random_delay": random_delay,
+                        "click_while_pattern": click_while_pattern,
+                    },
+                }
         self.clicker.toggle_clicker(
             delay=delay,
             duration=duration,
@@ -201,7 +242,6 @@ class ApplicationModel:
             repeat=repeat,
             random_delay=random_delay,
             on_status_changed=self._on_clicker_status,
-            on_stats_updated=self._on_stats_updated,
             click_while_pattern=click_while_pattern,
             notify_when_done=notify_when_done,
             notify_callback=self._notify_callback,
@@ -219,15 +259,117 @@ class ApplicationModel:
 
     def _on_clicker_status(self, status_text: str, **kwargs):
         """Internal callback handler for clicker status updates"""
+        if status_text in (CLICKER_STOPPED, CLICKER_COMPLETED):
+            self._finish_session()
         if self.on_status_changed:
             self.on_status_changed(status_text, **kwargs)
 
-    def _on_stats_updated(self, total_clicks: int, click_rate: float):
-        """Internal callback handler for stats updates from clicker"""
-        if self.total_clicks:
-            self.total_clicks.set(total_clicks)
-        if self.click_rate:
-            self.click_rate.set(f"{click_rate:.1f} clicks/s")
+    # ============================================
+    # === SESSION HISTORY METHODS ===
+    # ============================================
+
+    def _finish_session(self):
+        """Queue the session that just ended for the history database (any thread, no Tk access)"""
+        with self._session_lock:
+            session, self._active_session = self._active_session, None
+        started = self.stats.session_start
+        if session is None or not started:
+            return
+
+        ended = time.time()
+        window = max(1, min(int(self.stats.elapsed()) + 1, SERIES_CAPACITY))
+        self.history.record(session_record(
+            profile=session["profile"],
+            started=started,
+            ended=ended,
+            clicks=self.clicker.snapshot()["total_clicks"],
+            peak_rate=self.stats.series.summary(window)["peak_rate"],
+            intervals=self.stats.intervals.summary(),
+            config=session["config"],
+            histogram=self.stats.intervals.to_bytes(),
+        ))
+
+    def _on_history_written(self, count: int):
+        """Called from the history writer thread after sessions were stored"""
+        if self.on_history_changed:
+            self.on_history_changed()
+
+    def get_history_page(self, after=None, profile: Optional[str] = None) -> tuple[list[dict], Optional[tuple]]:
+        """One page of past sessions (newest first) and the cursor of the next page"""
+        return self.history.page(after=after, profile=profile)
+
+    def get_lifetime_stats(self, profile: Optional[str] = None) -> Optional[dict]:
+        """Lifetime totals of a profile (default: the current one), None before its first session"""
+        if profile is None:
+            profile = self.current_profile.get() if self.current_profile else "Default"
+        return self.history.profile_totals(profile)
+
+    def get_history_aggregates(self, group: str) -> list[dict]:
+        """Session totals grouped by 'profile' or 'day'"""
+        return self.history.per_profile() if group == "profile" else self.history.per_day()
+
+    def shutdown_history(self):
+        """Record a session that was still running and write all pending sessions"""
+        self.clicker.stop()
+        self._finish_session()
+        self.history.close()
+
+    # ============================================
+    # === METRICS ENDPOINT METHODS ===
+    # ============================================
+
+    def start_metrics_server(self, port: int) -> bool:
+        """Serve live metrics on http://127.0.0.1:<port>/metrics"""
+        self.stop_metrics_server()
+        server = MetricsServer(self.collect_metrics, METRICS_HOST, port)
+        try:
+            server.start()
+        except OSError as e:
+            print(f"[ERROR] Failed to start metrics endpoint on port {port}: {e}")
+            return False
+        self.metrics_server = server
+        print(f"[OK] Metrics endpoint on http://{METRICS_HOST}:{server.port}/metrics")
+        return True
+
+    def stop_metrics_server(self):
+        """Stop the metrics endpoint (no-op if it is not running)"""
+        server, self.metrics_server = self.metrics_server, None
+        if server is not None:
+            server.stop()
+
+    def collect_metrics(self) -> list:
+        """Metric families for one scrape (metrics server thread: snapshots only, no Tk access).
+
+        Counters are plain attribute reads; histograms are copied first, so
+        the click thread is never locked out while buckets are computed.
+        """
+        clicker = self.clicker
+        running = not clicker.stop_event.is_set()
+        rates = self.stats.rates.rates() if running else {"ewma": 0.0, "windows": {w: 0.0 for w in self.stats.rates.window_lengths}}
+        session_seconds = self.stats.elapsed()
+
+        families = [
+            counter("clickmax_clicks", "Clicks since the program started", clicker.lifetime_clicks),
+            gauge("clickmax_session_clicks", "Clicks of the current or last clicker session", clicker.total_clicks),
+            gauge("clickmax_clicker_running", "1 while the auto-clicker runs", running),
+            gauge("clickmax_session_seconds", "Length of the current or last clicker session", session_seconds),
+            gauge("clickmax_session_click_rate", "Average clicks per second over the session", clicker.total_clicks / session_seconds if session_seconds > 0 else 0.0),
+            labelled_gauge(
+                "clickmax_click_rate",
+                "Instantaneous clicks per second (EWMA and sliding windows)",
+                "window",
+                {"ewma": rates["ewma"], **{f"{seconds:g}s": rate for seconds, rate in rates["windows"].items()}},
+            ),
+            histogram("clickmax_click_interval_seconds", "Time between consecutive clicks of the session", self.stats.intervals.copy()),
+            gauge("clickmax_macro_playing", "1 while a macro is played", self.macro.is_playing()),
+            histogram("clickmax_macro_lateness_seconds", "How late macro events were played, all runs", self.macro.playback_lateness.copy()),
+            histogram("clickmax_hotkey_latency_seconds", "Time from hotkey press until its action returned", self.hotkeys.latency.copy()),
+            gauge("clickmax_threads", "Live Python threads", threading.active_count()),
+        ]
+        rss = resident_memory_bytes()
+        if rss is not None:
+            families.append(gauge("clickmax_resident_memory_bytes", "Resident memory of the process", rss))
+        return families
 
     # ============================================
     # === COORDINATE CAPTURE METHODS ===
@@ -264,33 +406,45 @@ class ApplicationModel:
     def start_session(self):
         """Start a new statistics session and reset all counters"""
         self.stats.start_session()
+        self.session_heatmap = None
         if self.total_clicks:
             self.total_clicks.set(0)
         if self.session_time:
             self.session_time.set("00:00:00")
         if self.click_rate:
             self.click_rate.set("0 clicks/s")
-
-    def start_stats_updater(self):
-        """Start background thread for continuous statistics updates"""
-        self.stats.start_background_updater(
-            total_clicks_getter=lambda: self.total_clicks.get() if self.total_clicks else 0,
-            on_stats_changed=self._on_stats_display_changed,
-        )
-
-    def stop_stats_updater(self):
-        """Stop background statistics updater thread"""
-        self.stats.stop_background_updater()
+        if self.instant_rate:
+            self.instant_rate.set("0 clicks/s")
+        if self.rate_windows:
+            self.rate_windows.set("")
+
+    def refresh_stats(self) -> bool:
+        """Pull the clicker snapshot into the statistics variables (main thread only).
+
+        Returns True while the clicker is running, i.e. while further refreshes are needed.
+        """
+        snapshot = self.clicker.snapshot()
+        self.stats.total_clicks = snapshot["total_clicks"]
+        if self.total_clicks:
+            self.total_clicks.set(snapshot["total_clicks"])
+        self.stats.update_stats(snapshot["total_clicks"], self._on_stats_display_changed, running=snapshot["running"])
+        return snapshot["running"]
 
     def reset_statistics(self):
         """Reset all statistics counters to zero"""
         self.stats.reset_stats()
+        self.clicker.drain_click_positions()
+        self.session_heatmap = None
         if self.total_clicks:
             self.total_clicks.set(0)
         if self.session_time:
             self.session_time.set("00:00:00")
         if self.click_rate:
             self.click_rate.set("0 clicks/s")
+        if self.instant_rate:
+            self.instant_rate.set("0 clicks/s")
+        if self.rate_windows:
+            self.rate_windows.set("")
 
     def export_statistics(self, filename: str):
         """Export current statistics to file"""
@@ -302,8 +456,88 @@ class ApplicationModel:
             profile_name=self.current_profile.get() if self.current_profile else "Default",
         )
 
+    def get_click_series(self, seconds: int, points: Optional[int] = None) -> tuple[list, list]:
+        """Per-second click rates and max latencies of the last `seconds` seconds (oldest first)"""
+        return self.stats.series.window(seconds, points=points)
+
+    def get_click_series_summary(self, seconds: int) -> dict:
+        """Average/peak click rate and max latency over the last `seconds` seconds"""
+        return self.stats.series.summary(seconds)
+
+    def get_interval_summary(self) -> dict:
+        """Inter-click interval percentiles, max and jitter of the current session (seconds)"""
+        return self.stats.intervals.summary()
+
+    def update_session_heatmap(self) -> bool:
+        """Bin clicks logged since the last call into the session heatmap. Returns True if it changed."""
+        positions = self.clicker.drain_click_positions()
+        if self.session_heatmap is None:
+            self.session_heatmap = ClickHeatmap(screen_geometry() or DEFAULT_SCREEN)
+        if not positions:
+            return False
+        self.session_heatmap.add(positions[0::2], positions[1::2])
+        return True
+
+    # ============================================
+    # === CLICK LOG METHODS ===
+    # ============================================
+
+    def start_click_log(self, filename: str) -> bool:
+        """Log every click from now on to filename (.csv, .jsonl or .bin), replacing a running log"""
+        self.stop_click_log()
+        try:
+            self.clicker.event_log = ClickEventLog(filename)
+        except Exception as e:
+            print(f"[ERROR] Failed to open click log: {e}")
+            if self.on_status_changed:
+                self.on_status_changed(CLICK_LOG_ERROR)
+            return False
+        if self.on_status_changed:
+            self.on_status_changed(CLICK_LOG_STARTED, filename=filename)
+        return True
+
+    def stop_click_log(self) -> None:
+        """Stop logging clicks and write the remaining events"""
+        log, self.clicker.event_log = self.clicker.event_log, None
+        if log is None:
+            return
+        log.close()
+        status = log.status()
+        if status["dropped"]:
+            print(f"[WARNING] Click log {status['filename']}: {status['dropped']} click(s) not written")
+        if self.on_status_changed:
+            if status["error"]:
+                self.on_status_changed(CLICK_LOG_ERROR)
+            else:
+                self.on_status_changed(CLICK_LOG_STOPPED, filename=status["filename"], count=status["written"])
+
+    def get_click_log_status(self) -> Optional[dict]:
+        """File and counters of the running click log (None if clicks are not logged)"""
+        log = self.clicker.event_log
+        return log.status() if log is not None else None
+
+    def build_macro_heatmap(self, name: Optional[str] = None) -> Optional[ClickHeatmap]:
+        """Click heatmap of the loaded macro (or a saved one)"""
+        return self.macro.build_heatmap(on_status=self._on_macro_status, name=name)
+
+    def export_heatmap(self, heatmap: ClickHeatmap, filename: str) -> bool:
+        """Export a heatmap as CSV (counts) or PNG (image), chosen by file extension"""
+        try:
+            if filename.lower().endswith(".csv"):
+                heatmap.export_csv(filename)
+            else:
+                heatmap.export_png(filename)
+        except Exception as e:
+            print(f"[ERROR] Failed to export heatmap: {e}")
+            if self.on_status_changed:
+                self.on_status_changed(HEATMAP_EXPORT_ERROR)
+            return False
+        if self.on_status_changed:
+            self.on_status_changed(HEATMAP_EXPORTED, filename=filename)
+        return True
+
     def _on_stats_display_changed(
-        self, session_time_str: str, click_rate_str: str, progress_str: str
+        self, session_time_str: str, click_rate_str: str, progress_str: str, rates: dict
     ):
         """Internal callback handler for statistics display updates"""
         if self.session_time:
@@ -311,16 +545,17 @@ class ApplicationModel:
         if self.click_rate:
             self.click_rate.set(click_rate_str)
 
-        if hasattr(self, "on_progress_changed") and self.on_progress_changed:
-            try:
-                rate_value = float(click_rate_str.split()[0])
-                progress_value = min(rate_value / 1000 * 100, 100)
-                text = f"{rate_value:.1f} clicks/s"
-            except Exception:
-                progress_value = 0
-                text = "0 clicks/s"
+        # Instantaneous rate (EWMA) drives the progress bar; the lifetime average lags after pauses
+        rate_value = rates["ewma"]
+        if self.instant_rate:
+            self.instant_rate.set(f"{rate_value:.1f} clicks/s")
+        if self.rate_windows:
+            windows = " · ".join(f"{seconds:g} s {rate:.1f}" for seconds, rate in rates["windows"].items())
+            self.rate_windows.set(f"{self.t('rate_windows')}: {windows} clicks/s")
 
-            self.on_progress_changed(progress_value, text)
+        if hasattr(self, "on_progress_changed") and self.on_progress_changed:
+            progress_value = min(rate_value / 1000 * 100, 100)
+            self.on_progress_changed(progress_value, f"{rate_value:.1f} clicks/s")
 
     # ============================================
     # === PROFILE METHODS ===
@@ -363,6 +598,10 @@ class ApplicationModel:
         """Export profiles to file"""
         return self.profiles.export_profiles(filename)
 
+    def flush_profiles(self):
+        """Write pending profile changes to disk now"""
+        self.profiles.flush()
+
     # ============================================
     # === MACRO METHODS ===
     # ============================================
@@ -375,26 +614,131 @@ class ApplicationModel:
         """Stop recording the current macro"""
         return self.macro.stop_recording(on_status=self._on_macro_status)
 
-    def save_macro(self, name: str) -> bool:
-        """Save recorded macro to file"""
-        return self.macro.save_macro(name, on_status=self._on_macro_status)
+    def save_macro(self, name: str, codec: str = "json", normalize: bool = False) -> bool:
+        """Save recorded macro to file (codec: json, gzip, xz or zstd; normalize: resolution-independent coordinates)"""
+        return self.macro.save_macro(name, on_status=self._on_macro_status, codec=codec, normalize=normalize)
 
     def load_macro(self, name: str) -> bool:
         """Load macro from file"""
         return self.macro.load_macro(name, on_status=self._on_macro_status)
 
-    def play_macro_recording(self) -> bool:
-        """Play the loaded macro"""
-        return self.macro.play_macro(on_status=self._on_macro_status)
+    def play_macro_recording(
+        self,
+        speed: float = 1.0,
+        loops: int = 1,
+        gap: float = 0.0,
+        max_idle: float = 0.0,
+        idle_scale: float = 0.0,
+    ) -> bool:
+        """Play the loaded macro at the given speed, `loops` times (0 = until stopped), idle gaps capped at max_idle"""
+        return self.macro.play_macro(
+            on_status=self._on_macro_status, speed=speed, loops=loops, gap=gap, max_idle=max_idle, idle_scale=idle_scale
+        )
+
+    def stop_macro_playback(self):
+        """Stop macro playback before the next event"""
+        self.macro.stop_playback()
+
+    def pause_macro_playback(self) -> bool:
+        """Pause macro playback before the next event"""
+        return self.macro.pause_playback(on_status=self._on_macro_status)
+
+    def resume_macro_playback(self) -> bool:
+        """Resume paused macro playback"""
+        return self.macro.resume_playback(on_status=self._on_macro_status)
+
+    def is_macro_paused(self) -> bool:
+        """Check whether macro playback is paused"""
+        return self.macro.is_playing() and self.macro.playback_control.paused
+
+    def is_macro_playing(self) -> bool:
+        """Check whether a macro is currently being played"""
+        return self.macro.is_playing()
+
+    def schedule_macro(
+        self,
+        name: str,
+        at: Optional[datetime] = None,
+        every_minutes: Optional[float] = None,
+        speed: float = 1.0,
+        loops: int = 1,
+        gap: float = 0.0,
+        max_idle: float = 0.0,
+        idle_scale: float = 0.0,
+    ) -> Optional[int]:
+        """Schedule a saved macro at a wall-clock time and/or every N minutes"""
+        return self.macro.schedule_macro(
+            name,
+            on_status=self._on_macro_status,
+            at=at,
+            every_minutes=every_minutes,
+            speed=speed,
+            loops=loops,
+            gap=gap,
+            max_idle=max_idle,
+            idle_scale=idle_scale,
+        )
+
+    def cancel_macro_schedule(self, schedule_id: int) -> bool:
+        """Cancel a scheduled macro start"""
+        return self.macro.cancel_schedule(schedule_id, on_status=self._on_macro_status)
+
+    def get_macro_schedules(self) -> list[dict]:
+        """Get pending scheduled macro starts"""
+        return self.macro.get_schedules()
+
+    def shutdown_macro_scheduler(self):
+        """Cancel all macro schedules and stop looping playback"""
+        self.macro.scheduler.shutdown()
+        self.macro.stop_playback()
+
+    def stream_macro_recording(self, name: str, speed: float = 1.0, max_idle: float = 0.0, idle_scale: float = 0.0) -> bool:
+        """Play a saved macro directly from disk without loading it into memory"""
+        return self.macro.stream_macro(
+            name, on_status=self._on_macro_status, speed=speed, max_idle=max_idle, idle_scale=idle_scale
+        )
+
+    def simulate_macro(self, name: Optional[str] = None, speed: float = 1.0, max_idle: float = 0.0, idle_scale: float = 0.0) -> Optional[dict]:
+        """Dry-run the loaded macro (or a saved one) and return its timeline report"""
+        return self.macro.simulate_macro(
+            on_status=self._on_macro_status, name=name, speed=speed, max_idle=max_idle, idle_scale=idle_scale
+        )
+
+    def build_macro_timeline(self, name: Optional[str] = None):
+        """Level-of-detail timeline of the loaded macro (or a saved one) for the timeline viewer"""
+        return self.macro.build_timeline(on_status=self._on_macro_status, name=name)
+
+    def simulate_clicker(self, settings: dict, horizon: float = DEFAULT_HORIZON, seed: Optional[int] = None) -> dict:
+        """Dry-run clicker settings (profile format) on a virtual clock and return the timeline report"""
+        return simulate_clicker(settings, horizon=horizon, seed=seed)
+
+    def simulate_profile(self, name: str, horizon: float = DEFAULT_HORIZON) -> Optional[dict]:
+        """Dry-run the clicker settings of a saved profile"""
+        settings = self.profiles.get_profile(name)
+        if settings is None:
+            return None
+        return self.simulate_clicker(settings, horizon=horizon)
 
     def delete_macro(self, name: str) -> bool:
         """Delete saved macro file"""
         return self.macro.delete_macro(name, on_status=self._on_macro_status)
 
+    def simplify_macro(self, name: str, new_name: str, tolerance: float = 2.0) -> Optional[dict]:
+        """Write a simplified copy of a saved macro (fewer mouse_move events)"""
+        return self.macro.simplify_macro(name, new_name, on_status=self._on_macro_status, tolerance=tolerance)
+
+    def edit_macro(self, operation: str, sources: list[str], new_name: str, **params: float) -> Optional[dict]:
+        """Create a new macro by trim/cut/concat/splice/retime of saved macros"""
+        return self.macro.edit_macro(operation, sources, new_name, on_status=self._on_macro_status, **params)
+
     def get_saved_macros(self) -> list[str]:
         """Get list of all saved macros"""
         return self.macro.get_saved_macros()
 
+    def get_macro_library(self) -> list[dict]:
+        """Get metadata for all saved macros (served from the macro index)"""
+        return self.macro.get_macro_library()
+
     def _on_macro_status(self, status_text: str, **kwargs):
         """Internal callback handler for macro status updates"""
         if self.on_status_changed:
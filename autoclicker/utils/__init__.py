@@ -1,11 +1,13 @@
 # autoclicker/utils/__init__.py
 """
 Utils Package - Utilities not tied to GUI or Logic
+
+Validators and constants are plain Python; the Tk-based managers are
+imported on first use so headless tools need no display.
 """
 
-from .theme import ThemeManager
-from .show_notification import NotificationManager
-from .translation import TranslationManager
+import importlib
+
 from .validators import (
     validate_safe_filename,
     validate_profile_name,
@@ -15,6 +17,13 @@ from .validators import (
     validate_duration,
     validate_repeat,
     validate_pattern_size,
+    validate_macro_speed,
+    validate_macro_loops,
+    validate_macro_gap,
+    validate_macro_idle,
+    validate_macro_idle_scale,
+    validate_schedule_time,
+    validate_schedule_interval,
     validate_coordinates,
     validate_hotkey,
     VALID_HOTKEYS,
@@ -50,6 +59,13 @@ __all__ = [
     "validate_duration",
     "validate_repeat",
     "validate_pattern_size",
+    "validate_macro_speed",
+    "validate_macro_loops",
+    "validate_macro_gap",
+    "validate_macro_idle",
+    "validate_macro_idle_scale",
+    "validate_schedule_time",
+    "validate_schedule_interval",
     "validate_coordinates",
     "validate_hotkey",
     "VALID_HOTKEYS",
@@ -69,4 +85,19 @@ __all__ = [
     "MACROS_DIR",
     "DEFAULT_THEME",
     "DEFAULT_LANGUAGE",
-]
\ No newline at end of file
+]
+
+# Tk-based managers, imported on first use
+_LAZY_EXPORTS = {
+    "ThemeManager": ".theme",
+    "NotificationManager": ".show_notification",
+    "TranslationManager": ".translation",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -82,6 +82,11 @@ MAX_DELAY_SECONDS = 60
 MAX_PATTERN_SIZE = 1000
 MIN_PATTERN_SIZE = 10
 MAX_REPEAT_COUNT = 100
+MIN_MACRO_SPEED = 0.25
+MAX_MACRO_SPEED = 10.0
+MAX_MACRO_LOOPS = 10000
+MAX_MACRO_LOOP_GAP = 3600
+MAX_MACRO_IDLE_GAP = 3600
 
 # ============================================
 # === FILE PATHS ===
@@ -92,6 +97,15 @@ from pathlib import Path
 PROFILES_FILE = Path.home() / ".autoclicker_profiles.json"
 LAST_PROFILE_FILE = Path.home() / ".autoclicker_last_profile.json"
 MACROS_DIR = Path.home() / ".autoclicker_macros"
+HISTORY_FILE = Path.home() / ".autoclicker_history.db"
+
+# ============================================
+# === METRICS ENDPOINT ===
+# ============================================
+
+# Set CLICKMAX_METRICS_PORT to serve http://127.0.0.1:<port>/metrics (unset or 0: off)
+METRICS_PORT_ENV = "CLICKMAX_METRICS_PORT"
+METRICS_HOST = "127.0.0.1"
 
 # ============================================
 # === UI CONSTANTS ===
@@ -100,8 +114,16 @@ MACROS_DIR = Path.home() / ".autoclicker_macros"
 DEFAULT_THEME = "cyborg"
 DEFAULT_LANGUAGE = "English"
 
-# Stats update interval in seconds
-STATS_UPDATE_INTERVAL = 1
+# Statistics refresh interval while the clicker runs (milliseconds, configurable per profile)
+STATS_REFRESH_MS = 500
+MIN_STATS_REFRESH_MS = 100
+MAX_STATS_REFRESH_MS = 5000
+
+# Live click heatmap refresh interval (milliseconds, at most once per stats refresh)
+HEATMAP_REFRESH_MS = 3000
+
+# Click rate sparkline windows (label, seconds)
+SPARKLINE_WINDOWS = (("1 min", 60), ("10 min", 600), ("1 h", 3600))
 
 # Window dimensions (minimum required dimensions)
 WINDOW_WIDTH_MIN = 950
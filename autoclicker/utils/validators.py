@@ -1,7 +1,8 @@
 # autoclicker/utils/validators.py
 """Shared Validation Logic - Security and input validation functions"""
 
-from typing import Tuple, Union
+from datetime import datetime, timedelta
+from typing import Optional, Tuple, Union
 
 
 def validate_safe_filename(name: str, max_length: int = 100, allow_default: bool = False) -> Tuple[bool, str]:
@@ -97,6 +98,54 @@ def validate_pattern_size(value: Union[int, str]) -> Tuple[bool, str, int]:
     return is_valid, error, int(parsed) if parsed is not None else None
 
 
+def validate_macro_speed(value: Union[float, str]) -> Tuple[bool, str, float]:
+    """Validate macro playback speed multiplier (0.25x - 10x)"""
+    return validate_number(value, min_val=0.25, max_val=10, allow_float=True, name="Macro Speed")
+
+
+def validate_macro_loops(value: Union[int, str]) -> Tuple[bool, str, int]:
+    """Validate macro loop count (0-10000, 0 = until stopped)"""
+    is_valid, error, parsed = validate_number(value, min_val=0, max_val=10000, allow_float=False, name="Macro Loops")
+    return is_valid, error, int(parsed) if parsed is not None else None
+
+
+def validate_macro_gap(value: Union[float, str]) -> Tuple[bool, str, float]:
+    """Validate pause between macro loops in seconds (0-3600)"""
+    return validate_number(value, min_val=0, max_val=3600, allow_float=True, name="Loop Gap")
+
+
+def validate_macro_idle(value: Union[float, str]) -> Tuple[bool, str, float]:
+    """Validate longest idle gap kept during macro playback in seconds (0-3600, 0 = off)"""
+    return validate_number(value, min_val=0, max_val=3600, allow_float=True, name="Max Idle")
+
+
+def validate_macro_idle_scale(value: Union[float, str]) -> Tuple[bool, str, float]:
+    """Validate share of an idle gap's excess over max idle that is kept (0-1, 0 = cut to max idle)"""
+    return validate_number(value, min_val=0, max_val=1, allow_float=True, name="Idle Scale")
+
+
+def validate_schedule_time(value: str) -> Tuple[bool, str, Optional[datetime]]:
+    """Validate HH:MM start time, returns its next occurrence (None if empty = no fixed time)"""
+    value = value.strip()
+    if not value:
+        return True, "", None
+    try:
+        parsed = datetime.strptime(value, "%H:%M")
+    except ValueError:
+        return False, "Start time must be HH:MM", None
+
+    now = datetime.now()
+    at = now.replace(hour=parsed.hour, minute=parsed.minute, second=0, microsecond=0)
+    if at <= now:
+        at += timedelta(days=1)
+    return True, "", at
+
+
+def validate_schedule_interval(value: Union[float, str]) -> Tuple[bool, str, float]:
+    """Validate macro repeat interval in minutes (0-1440, 0 = run once)"""
+    return validate_number(value, min_val=0, max_val=1440, allow_float=True, name="Interval")
+
+
 def validate_coordinates(x: Union[int, str], y: Union[int, str]) -> Tuple[bool, str, Tuple[int, int]]:
     """Validate screen coordinates"""
     is_valid_x, error_x, parsed_x = validate_number(x, min_val=0, max_val=10000, allow_float=False, name="X")
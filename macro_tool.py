@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Macro tool for Auto-Clicker.
+Validates, converts or re-indexes every saved macro in parallel, and
+simplifies the mouse paths of a single macro.
+
+Usage:
+    python macro_tool.py validate [--dir DIR] [--workers N] [--restart]
+    python macro_tool.py convert --codec gzip [--dir DIR] [--workers N] [--restart]
+    python macro_tool.py reindex [--dir DIR] [--workers N] [--restart]
+    python macro_tool.py simplify NAME [--tolerance PX] [--output NEW_NAME] [--dir DIR]
+
+An interrupted bulk run (Ctrl+C) continues where it stopped when started again.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from autoclicker.logic.macro_bulk import BULK_OPERATIONS, run_bulk
+from autoclicker.logic.macro_index import MacroIndex
+from autoclicker.logic.macro_io import MACRO_CODECS, codec_for_filename, find_macro_file
+from autoclicker.logic.macro_simplify import DEFAULT_TOLERANCE_PX, simplify_macro_file
+from autoclicker.utils.constants import MACROS_DIR
+from autoclicker.utils.validators import validate_macro_name
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 1.0
+
+# Help line of each bulk subcommand
+BULK_HELP = {
+    "validate": "check every saved macro",
+    "convert": "re-store every saved macro with another codec",
+    "reindex": "rebuild the macro library index",
+}
+
+
+def format_rate(summary: dict) -> str:
+    """Throughput of a (partial) run as files/s, events/s and MB/s"""
+    seconds = max(summary["seconds"], 1e-9)
+    return (
+        f"{summary['processed'] / seconds:.1f} files/s, "
+        f"{summary['events'] / seconds:,.0f} events/s, "
+        f"{summary['bytes'] / seconds / (1024 * 1024):.1f} MB/s"
+    )
+
+
+def make_progress_printer():
+    """Progress callback printing at most one line per PROGRESS_INTERVAL"""
+    last = [0.0]
+
+    def on_progress(summary: dict) -> None:
+        now = time.monotonic()
+        if now - last[0] < PROGRESS_INTERVAL:
+            return
+        last[0] = now
+        done = summary["skipped"] + summary["processed"] + len(summary["errors"])
+        print(f"   {done}/{summary['files']} files ({format_rate(summary)}, {len(summary['errors'])} errors)")
+
+    return on_progress
+
+
+def simplify(directory: Path, name: str, new_name: str, tolerance: float) -> None:
+    """Write a copy of one macro with simplified mouse paths and print the event counts."""
+    if not validate_macro_name(name) or not validate_macro_name(new_name):
+        print("[ERROR] Invalid macro name")
+        sys.exit(1)
+    if name == new_name:
+        print("[ERROR] The simplified copy needs a different name")
+        sys.exit(1)
+    source = find_macro_file(directory, name)
+    if source is None:
+        print(f"[ERROR] Macro not found: {name}")
+        sys.exit(1)
+
+    # Keep the storage codec of the source macro; drop copies of the new name in other codecs
+    codec = codec_for_filename(source.name)
+    target = directory / f"{new_name}{MACRO_CODECS[codec]}"
+    try:
+        report = simplify_macro_file(source, target, new_name, tolerance)
+        for other, suffix in MACRO_CODECS.items():
+            stale = directory / f"{new_name}{suffix}"
+            if other != codec and stale.exists():
+                stale.unlink()
+        MacroIndex(directory).update(new_name)
+    except Exception as e:
+        print(f"[ERROR] Failed to simplify {name}: {e}")
+        sys.exit(1)
+
+    print(f"[OK] {name} -> {new_name} (tolerance {tolerance:g} px)")
+    print(f"   events: {report['events_before']:,} -> {report['events_after']:,}")
+    print(f"   mouse moves: {report['moves_before']:,} -> {report['moves_after']:,}")
+
+
+def main():
+    """Parse arguments, run the operation and print the report."""
+    parser = argparse.ArgumentParser(description="Validate, convert or re-index saved macros in parallel, or simplify one macro.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--dir", type=Path, default=MACROS_DIR, help=f"macro directory (default: {MACROS_DIR})")
+    bulk = argparse.ArgumentParser(add_help=False, parents=[common])
+    bulk.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    bulk.add_argument("--restart", action="store_true", help="ignore progress of an interrupted run")
+
+    commands = parser.add_subparsers(dest="operation", required=True, metavar="{" + ",".join(BULK_OPERATIONS) + ",simplify}")
+    for operation in BULK_OPERATIONS:
+        command = commands.add_parser(operation, parents=[bulk], help=BULK_HELP.get(operation))
+        if operation == "convert":
+            command.add_argument("--codec", choices=list(MACRO_CODECS), required=True, help="target storage codec")
+    command = commands.add_parser("simplify", parents=[common], help="simplify the mouse paths of one macro")
+    command.add_argument("name", help="macro to simplify")
+    command.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE_PX, help=f"allowed path deviation in pixels (default: {DEFAULT_TOLERANCE_PX:g})")
+    command.add_argument("--output", help="name of the simplified copy (default: NAME_simplified)")
+    args = parser.parse_args()
+
+    if not args.dir.is_dir():
+        print(f"[ERROR] Macro directory not found: {args.dir}")
+        sys.exit(1)
+
+    if args.operation == "simplify":
+        if args.tolerance < 0:
+            parser.error("--tolerance must not be negative")
+        simplify(args.dir, args.name, args.output or f"{args.name}_simplified", args.tolerance)
+        return
+
+    args.codec = getattr(args, "codec", None)
+
+    print("=" * 60)
+    print(f"Macro tool: {args.operation}" + (f" -> {args.codec}" if args.codec else ""))
+    print("=" * 60 + "\n")
+
+    try:
+        summary = run_bulk(
+            args.dir,
+            args.operation,
+            codec=args.codec,
+            workers=args.workers,
+            resume=not args.restart,
+            on_progress=make_progress_printer(),
+        )
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    for filename, error in sorted(summary["errors"].items()):
+        print(f"[ERROR] {filename}: {error}")
+
+    print(f"\n[OK] {summary['processed']} processed, {summary['skipped']} skipped (already done), "
+          f"{len(summary['errors'])} failed of {summary['files']} files")
+    print(f"   {summary['events']:,} events in {summary['seconds']:.2f} s ({format_rate(summary)})")
+
+    if summary["interrupted"]:
+        print("\n[CANCELLED] Interrupted - run the same command again to resume")
+        sys.exit(130)
+    if summary["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
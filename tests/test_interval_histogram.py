@@ -0,0 +1,156 @@
+# tests/test_interval_histogram.py
+"""Tests for the log-bucketed click interval histogram"""
+
+import math
+import random
+import statistics
+import zlib
+
+import pytest
+
+from autoclicker.logic.interval_histogram import (
+    MAX_VALUE_US, SUB_BUCKET_BITS, IntervalHistogram, _highest_value, _index, merge_histograms, percentile_name,
+)
+
+RELATIVE_ERROR = 1 / 2 ** (SUB_BUCKET_BITS - 1)
+
+
+def exact_percentile(values, percentile):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(percentile / 100 * len(ordered))) - 1]
+
+
+def sample(count=20_000, seed=5):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(math.log(0.05), 0.6) for _ in range(count)]
+
+
+def test_slots_cover_values_in_order():
+    previous_index = _index(0)
+    values = set(range(0, 5000)) | {min(2 ** k + d, MAX_VALUE_US) for k in range(12, 33) for d in (-1, 0, 1)}
+    for value in sorted(values):
+        index = _index(value)
+        assert index >= previous_index
+        assert value <= _highest_value(index)
+        # Slot width stays within the relative error bound
+        assert _highest_value(index) - value <= max(1, value * RELATIVE_ERROR)
+        previous_index = index
+
+
+def test_empty_histogram():
+    histogram = IntervalHistogram()
+    assert histogram.percentiles() == {50.0: 0.0, 90.0: 0.0, 99.0: 0.0, 99.9: 0.0}
+    assert histogram.summary()["count"] == 0
+    assert histogram.cumulative([0.1, 1.0]) == ([0, 0], 0, 0.0)
+
+
+def test_percentiles_within_relative_error():
+    values = sample()
+    histogram = IntervalHistogram()
+    histogram.record_many(values)
+
+    for p, estimate in histogram.percentiles((1.0, 50.0, 90.0, 99.0, 99.9, 100.0)).items():
+        exact = exact_percentile(values, p)
+        assert exact <= estimate + 1e-6
+        assert estimate <= exact * (1 + RELATIVE_ERROR) + 1e-6
+
+
+def test_summary_matches_exact_statistics():
+    values = sample(5000)
+    histogram = IntervalHistogram()
+    for value in values:
+        histogram.record(value)
+    summary = histogram.summary()
+
+    assert summary["count"] == len(values)
+    assert summary["min"] == pytest.approx(min(values), abs=1e-6)
+    assert summary["max"] == pytest.approx(max(values), abs=1e-6)
+    assert summary["mean"] == pytest.approx(statistics.fmean(values), abs=1e-5)
+    assert summary["jitter"] == pytest.approx(statistics.pstdev(values), rel=1e-3)
+    assert summary["percentiles"][99.9] <= summary["max"]
+
+
+def test_record_and_record_many_agree():
+    values = sample(1000)
+    one, many = IntervalHistogram(), IntervalHistogram()
+    for value in values:
+        one.record(value)
+    many.record_many(values)
+    assert one.to_dict() == many.to_dict()
+
+
+def test_out_of_range_values_are_clamped():
+    histogram = IntervalHistogram()
+    histogram.record_many([-1.0, 10_000.0])
+    assert histogram.min_us == 0
+    assert histogram.max_us == MAX_VALUE_US
+    assert histogram.percentiles((100.0,))[100.0] == MAX_VALUE_US / 1_000_000
+
+
+def test_merge_equals_recording_everything():
+    values = sample(3000)
+    parts = [values[:1000], values[1000:1001], values[1001:], []]
+    histograms = []
+    for part in parts:
+        histogram = IntervalHistogram()
+        histogram.record_many(part)
+        histograms.append(histogram)
+
+    combined = IntervalHistogram()
+    combined.record_many(values)
+    merged = merge_histograms(histograms)
+
+    assert merged.to_dict()["counts"] == combined.to_dict()["counts"]
+    assert (merged.count, merged.min_us, merged.max_us) == (combined.count, combined.min_us, combined.max_us)
+    assert merged.percentiles() == combined.percentiles()
+
+
+def test_copy_is_independent():
+    histogram = IntervalHistogram()
+    histogram.record(0.1)
+    duplicate = histogram.copy()
+    histogram.record(0.2)
+    assert duplicate.count == 1
+    assert duplicate.max_us == 100_000
+
+
+def test_cumulative_counts():
+    histogram = IntervalHistogram()
+    histogram.record_many([0.001] * 3 + [0.01] * 5 + [1.0] * 2)
+    counts, count, total = histogram.cumulative([0.005, 0.05, 0.5, 5.0])
+    assert counts == [3, 8, 8, 10]
+    assert count == 10
+    assert total == pytest.approx(2.053)
+
+
+@pytest.mark.parametrize("encode, decode", [
+    (IntervalHistogram.to_bytes, IntervalHistogram.from_bytes),
+    (IntervalHistogram.to_dict, IntervalHistogram.from_dict),
+])
+def test_serialization_round_trip(encode, decode):
+    histogram = IntervalHistogram()
+    histogram.record_many(sample(2000))
+    restored = decode(encode(histogram))
+    assert restored.to_dict() == histogram.to_dict()
+    assert restored.summary() == histogram.summary()
+
+
+def test_invalid_blobs_are_rejected():
+    histogram = IntervalHistogram()
+    histogram.record_many(sample(100))
+    data = zlib.decompress(histogram.to_bytes())
+
+    with pytest.raises(ValueError, match="Incompatible"):
+        IntervalHistogram.from_bytes(zlib.compress(bytes([1, SUB_BUCKET_BITS + 1]) + data[2:]))
+    with pytest.raises(ValueError, match="Truncated"):
+        IntervalHistogram.from_bytes(zlib.compress(data[:-8]))
+    with pytest.raises(ValueError, match="Incompatible"):
+        IntervalHistogram.from_dict({**histogram.to_dict(), "sub_bucket_bits": 4})
+    with pytest.raises(ValueError, match="Invalid histogram slot"):
+        IntervalHistogram.from_dict({**histogram.to_dict(), "counts": [[10 ** 9, 1]]})
+
+
+def test_percentile_name():
+    assert percentile_name(99.9) == "p99.9"
+    assert percentile_name(50.0) == "p50"
@@ -0,0 +1,146 @@
+# tests/test_macro_edit.py
+"""Tests for macro editing: event order, clamping and time arithmetic"""
+
+import random
+
+import pytest
+
+from autoclicker.logic import macro_io
+from autoclicker.logic.macro_edit import (
+    _shifted, _write, apply_edit, concat_macros, cut_macro, retime_macro, splice_macro, trim_macro,
+)
+from autoclicker.logic.macro_io import MacroFormatError, MacroReader, MacroWriter, check_events, detect_codec, read_macro_header
+
+
+def write_macro(path, stamps, **header):
+    events = [{"type": "mouse_move", "timestamp": ts, "x": i, "y": 0} for i, ts in enumerate(stamps)]
+    with MacroWriter(path, {"name": path.name.split(".")[0], **header}) as writer:
+        writer.write_many(events)
+    return path
+
+
+def stamps_of(path):
+    """Timestamps of a written macro, checked to be a valid (ordered) macro"""
+    return [event["timestamp"] for event in check_events(MacroReader(path))]
+
+
+def xs_of(path):
+    return [event["x"] for event in MacroReader(path)]
+
+
+@pytest.fixture(params=[None, 11], ids=["one-batch", "many-batches"])
+def chunked(request, monkeypatch):
+    """Run each test with large and with tiny read chunks (edits work batch-wise)"""
+    if request.param:
+        monkeypatch.setattr(macro_io, "CHUNK_SIZE", request.param)
+
+
+def test_trim(tmp_path, chunked):
+    source = write_macro(tmp_path / "a.json", [10.0 + i for i in range(10)])
+    trim_macro(source, tmp_path / "out.json", "out", start=2.0, end=5.0)
+    assert stamps_of(tmp_path / "out.json") == [12.0, 13.0, 14.0, 15.0]
+
+
+def test_cut_closes_the_gap(tmp_path, chunked):
+    source = write_macro(tmp_path / "a.json", [float(i) for i in range(10)])
+    cut_macro(source, tmp_path / "out.json", "out", start=3.0, end=6.0)
+    assert stamps_of(tmp_path / "out.json") == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert xs_of(tmp_path / "out.json") == [0, 1, 2, 6, 7, 8, 9]
+
+
+def test_concat_keeps_first_codec_and_gap(tmp_path, chunked):
+    first = write_macro(tmp_path / "a.json.gz", [5.0, 6.0, 7.0])
+    second = write_macro(tmp_path / "b.json", [100.0, 100.5])
+    concat_macros([first, second], tmp_path / "out.json.gz", "out", gap=2.0)
+
+    assert stamps_of(tmp_path / "out.json.gz") == [5.0, 6.0, 7.0, 9.0, 9.5]
+    assert detect_codec(tmp_path / "out.json.gz") == "gzip"
+    header = read_macro_header(tmp_path / "out.json.gz")
+    assert header["edited_from"] == ["a", "b"] and header["edit"] == "concat"
+
+
+def test_splice_moves_later_events_back(tmp_path, chunked):
+    base = write_macro(tmp_path / "base.json", [0.0, 1.0, 2.0, 3.0])
+    insert = write_macro(tmp_path / "insert.json", [50.0, 50.5, 51.0])
+    splice_macro(base, insert, tmp_path / "out.json", "out", at=2.0)
+
+    assert stamps_of(tmp_path / "out.json") == [0.0, 1.0, 2.0, 2.5, 3.0, 3.0, 4.0]
+    assert xs_of(tmp_path / "out.json") == [0, 1, 0, 1, 2, 2, 3]
+
+
+def test_retime_scales_and_shifts(tmp_path, chunked):
+    source = write_macro(tmp_path / "a.json", [10.0, 11.0, 12.0, 13.0])
+    retime_macro(source, tmp_path / "scaled.json", "scaled", scale=2.0)
+    assert stamps_of(tmp_path / "scaled.json") == [10.0, 12.0, 14.0, 16.0]
+    retime_macro(source, tmp_path / "shifted.json", "shifted", shift_at=2.0, shift=1.5)
+    assert stamps_of(tmp_path / "shifted.json") == [10.0, 11.0, 13.5, 14.5]
+
+
+def test_negative_shift_is_clamped_to_the_previous_event(tmp_path, chunked):
+    source = write_macro(tmp_path / "a.json", [0.0, 1.0, 2.0, 10.0, 11.0])
+    retime_macro(source, tmp_path / "out.json", "out", shift_at=10.0, shift=-20.0)
+    assert stamps_of(tmp_path / "out.json") == [0.0, 1.0, 2.0, 2.0, 2.0]
+
+
+def test_shifted_clamps_to_floor():
+    lines = ['{"timestamp":1.0}', '{"timestamp":2.0}', '{"timestamp":3.0}']
+    new_lines, stamps = _shifted(lines, [1.0, 2.0, 3.0], -1.5, floor=1.0)
+    assert stamps == [1.0, 1.0, 1.5]
+    assert new_lines == ['{"timestamp":1.0}', '{"timestamp":1.0}', '{"timestamp":1.5}']
+    # Nothing to do: returned unchanged
+    assert _shifted(lines, [1.0, 2.0, 3.0], 0.0, floor=0.5) == (lines, [1.0, 2.0, 3.0])
+
+
+def test_write_rejects_backwards_events_and_leaves_no_file(tmp_path):
+    source = write_macro(tmp_path / "a.json", [0.0])
+    batches = [(['{"timestamp":1.0}'], [1.0]), (['{"timestamp":0.5}'], [0.5])]
+    with pytest.raises(MacroFormatError, match="event 2 goes backwards"):
+        _write(tmp_path / "out.json", "out", [source], "test", batches)
+    assert not (tmp_path / "out.json").exists()
+    assert not (tmp_path / "out.json.tmp").exists()
+
+
+def test_random_edits_stay_in_order(tmp_path):
+    """Float timestamps: shifting by differences must never reorder events"""
+    rng = random.Random(3)
+    for round_ in range(60):
+        def random_macro(name):
+            t = rng.uniform(0, 1000)
+            stamps = []
+            for _ in range(rng.randint(1, 40)):
+                t += rng.choice((0.0, rng.uniform(0, 0.3), rng.uniform(0, 5)))
+                stamps.append(t)
+            return write_macro(tmp_path / f"{name}.json", stamps), stamps
+
+        base, base_stamps = random_macro("base")
+        insert, _ = random_macro("insert")
+        length = base_stamps[-1] - base_stamps[0]
+        at, until = sorted(rng.uniform(0, length) for _ in range(2))
+        edits = [
+            ("cut", [base], {"start": at, "end": until}),
+            ("trim", [base], {"start": at, "end": until}),
+            ("concat", [base, insert], {"gap": rng.choice((0.0, 0.1))}),
+            ("splice", [base, insert], {"at": at}),
+            ("retime", [base], {"scale": rng.uniform(0.1, 3), "shift_at": at, "shift": rng.uniform(-10, 10)}),
+        ]
+        for operation, sources, params in edits:
+            target = tmp_path / f"{operation}.json"
+            apply_edit(operation, sources, target, operation, **params)
+            stamps_of(target)
+
+
+def test_different_screens_cannot_be_combined(tmp_path):
+    first = write_macro(tmp_path / "a.json", [0.0], coordinates="pixels", screen={"width": 1920, "height": 1080})
+    second = write_macro(tmp_path / "b.json", [0.0], coordinates="pixels", screen={"width": 1280, "height": 720})
+    with pytest.raises(MacroFormatError, match="different screen"):
+        concat_macros([first, second], tmp_path / "out.json", "out")
+
+
+def test_apply_edit_checks_operation_and_sources(tmp_path):
+    source = write_macro(tmp_path / "a.json", [0.0])
+    with pytest.raises(ValueError, match="Unknown"):
+        apply_edit("reverse", [source], tmp_path / "out.json", "out")
+    with pytest.raises(ValueError, match="needs 2"):
+        apply_edit("splice", [source], tmp_path / "out.json", "out", at=0.0)
+    with pytest.raises(ValueError):
+        retime_macro(source, tmp_path / "out.json", "out", scale=0)
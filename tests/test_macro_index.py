@@ -0,0 +1,145 @@
+# tests/test_macro_index.py
+"""Tests for the macro library index and its invalidation"""
+
+import json
+import os
+
+import pytest
+
+from autoclicker.logic import macro_index
+from autoclicker.logic.macro_index import INDEX_FILENAME, INDEX_VERSION, MacroIndex
+from autoclicker.logic.macro_io import MacroWriter
+
+
+def write_macro(directory, name, count, step=0.5, suffix=".json"):
+    path = directory / f"{name}{suffix}"
+    events = [{"type": "mouse_move", "timestamp": i * step, "x": i, "y": i} for i in range(count)]
+    with MacroWriter(path, {"name": name, "created": "2026-01-01T00:00:00"}) as writer:
+        writer.write_many(events)
+    return path
+
+
+def bump_mtime(path):
+    """Move the file's mtime forward so a same-size rewrite is still noticed"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Names of macros scanned (i.e. whose body was read)"""
+    scanned = []
+    original = macro_index.scan_macro_file
+
+    def counting_scan(path, validate=False):
+        scanned.append(path.name)
+        return original(path, validate)
+
+    monkeypatch.setattr(macro_index, "scan_macro_file", counting_scan)
+    return scanned
+
+
+def test_refresh_indexes_new_macros(tmp_path, scans):
+    write_macro(tmp_path, "a", 5)
+    write_macro(tmp_path, "b", 3, suffix=".json.gz")
+    (tmp_path / "notes.txt").write_text("not a macro")
+
+    entries = MacroIndex(tmp_path).refresh()
+
+    assert sorted(entries) == ["a", "b"]
+    assert entries["a"]["event_count"] == 5
+    assert entries["a"]["duration"] == 2.0
+    assert entries["a"]["created"] == "2026-01-01T00:00:00"
+    assert entries["b"]["codec"] == "gzip"
+    assert sorted(scans) == ["a.json", "b.json.gz"]
+
+
+def test_unchanged_macros_are_not_rescanned(tmp_path, scans):
+    write_macro(tmp_path, "a", 5)
+    index = MacroIndex(tmp_path)
+    index.refresh()
+    scans.clear()
+
+    index.refresh()
+    # A new instance reads the persisted index instead of the macro files
+    MacroIndex(tmp_path).list()
+
+    assert scans == []
+
+
+def test_changed_macro_is_rescanned(tmp_path, scans):
+    path = write_macro(tmp_path, "a", 5)
+    index = MacroIndex(tmp_path)
+    index.refresh()
+    scans.clear()
+
+    write_macro(tmp_path, "a", 8)
+    bump_mtime(path)
+    entries = index.refresh()
+
+    assert scans == ["a.json"]
+    assert entries["a"]["event_count"] == 8
+
+
+def test_same_size_rewrite_is_noticed_by_mtime(tmp_path):
+    path = write_macro(tmp_path, "a", 5, step=0.25)
+    index = MacroIndex(tmp_path)
+    old = index.refresh()["a"]
+
+    write_macro(tmp_path, "a", 5, step=0.75)
+    bump_mtime(path)
+    new = index.refresh()["a"]
+
+    assert new["size"] == old["size"]
+    assert new["hash"] != old["hash"]
+    assert new["duration"] == 3.0
+
+
+def test_deleted_macro_is_dropped(tmp_path):
+    path = write_macro(tmp_path, "a", 5)
+    write_macro(tmp_path, "b", 5)
+    index = MacroIndex(tmp_path)
+    index.refresh()
+
+    path.unlink()
+
+    assert [entry["name"] for entry in index.list()] == ["b"]
+    assert index.get("a") is None
+    assert "a" not in json.loads((tmp_path / INDEX_FILENAME).read_text())["macros"]
+
+
+def test_get_uses_cache_until_the_file_changes(tmp_path, scans):
+    path = write_macro(tmp_path, "a", 5)
+    index = MacroIndex(tmp_path)
+    assert index.get("a")["event_count"] == 5
+    scans.clear()
+
+    assert index.get("a")["event_count"] == 5
+    assert scans == []
+
+    write_macro(tmp_path, "a", 9)
+    bump_mtime(path)
+    assert index.get("a")["event_count"] == 9
+    assert scans == ["a.json"]
+
+
+@pytest.mark.parametrize("content", [
+    json.dumps({"version": INDEX_VERSION - 1, "macros": {"a": {"name": "a"}}}),
+    "{not json",
+])
+def test_stale_or_corrupt_index_is_rebuilt(tmp_path, scans, content):
+    write_macro(tmp_path, "a", 4)
+    (tmp_path / INDEX_FILENAME).write_text(content)
+
+    entries = MacroIndex(tmp_path).refresh()
+
+    assert scans == ["a.json"]
+    assert entries["a"]["event_count"] == 4
+    assert json.loads((tmp_path / INDEX_FILENAME).read_text())["version"] == INDEX_VERSION
+
+
+def test_unreadable_macro_is_skipped(tmp_path):
+    write_macro(tmp_path, "good", 3)
+    (tmp_path / "bad.json").write_text('{"events": [{"timestamp": 0}')
+
+    assert sorted(MacroIndex(tmp_path).refresh()) == ["good"]
@@ -0,0 +1,156 @@
+# tests/test_macro_io.py
+"""Tests for streaming macro file I/O and compressed storage codecs"""
+
+import json
+import random
+
+import pytest
+
+from autoclicker.logic import macro_io
+from autoclicker.logic.macro_io import (
+    MACRO_CODECS, ZSTD_AVAILABLE, MacroFormatError, MacroReader, MacroWriter, RawMacroReader,
+    check_events, codec_for_filename, detect_codec, find_macro_file, read_macro_header, split_macro_filename,
+)
+
+CODECS = [
+    pytest.param(codec, marks=pytest.mark.skipif(codec == "zstd" and not ZSTD_AVAILABLE, reason="zstandard not installed"))
+    for codec in MACRO_CODECS
+]
+
+
+def sample_events(count=500, seed=1):
+    """Mixed events with increasing timestamps (floats, unicode keys)"""
+    rng = random.Random(seed)
+    events, t = [], 0.0
+    for i in range(count):
+        t += rng.uniform(0.0, 0.05)
+        kind = rng.choice(("move", "move", "move", "click", "wheel", "key"))
+        if kind == "move":
+            events.append({"type": "mouse_move", "timestamp": t, "x": rng.randint(0, 1919), "y": rng.randint(0, 1079)})
+        elif kind == "click":
+            events.append({"type": "mouse_click", "timestamp": t, "button": "left", "action": rng.choice(("down", "up"))})
+        elif kind == "wheel":
+            events.append({"type": "mouse_wheel", "timestamp": t, "delta": rng.choice((-1, 1))})
+        else:
+            events.append({"type": "key_event", "timestamp": t, "key": rng.choice(("a", "shift", "ß", "é")), "action": "down"})
+    return events
+
+
+def write(path, events, codec=None, **header):
+    with MacroWriter(path, {"name": "sample", **header}, codec=codec) as writer:
+        writer.write_many(events)
+    return path
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_round_trip(tmp_path, codec):
+    events = sample_events()
+    path = write(tmp_path / f"sample{MACRO_CODECS[codec]}", events, created="2026-01-01")
+
+    reader = MacroReader(path)
+    assert list(reader) == events
+    assert reader.header["name"] == "sample"
+    assert reader.header["event_count"] == len(events)
+    assert detect_codec(path) == codec
+    assert codec_for_filename(path.name) == codec
+    assert read_macro_header(path) == {"name": "sample", "created": "2026-01-01"}
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_raw_round_trip(tmp_path, codec):
+    events = sample_events(3000)
+    source = write(tmp_path / f"source{MACRO_CODECS[codec]}", events)
+
+    raw = RawMacroReader(source)
+    with MacroWriter(tmp_path / "copy.json", {"name": "copy"}) as writer:
+        for batch in raw.batches():
+            writer.write_encoded(batch)
+
+    assert raw.header == {"name": "sample"}
+    assert list(MacroReader(tmp_path / "copy.json")) == events
+
+
+def test_codec_is_detected_from_content_not_suffix(tmp_path):
+    events = sample_events(20)
+    path = write(tmp_path / "mislabelled.json", events, codec="xz")
+
+    assert detect_codec(path) == "xz"
+    assert list(MacroReader(path)) == events
+
+
+def test_reader_accepts_any_json_layout(tmp_path):
+    events = sample_events(50)
+    path = tmp_path / "pretty.json"
+    # Fields on both sides of the event array, indented (not MacroWriter's layout)
+    path.write_text(json.dumps({"name": "pretty", "events": events, "event_count": 50}, indent=4, ensure_ascii=False), encoding="utf-8")
+
+    reader = MacroReader(path)
+    assert list(reader) == events
+    assert reader.header == {"name": "pretty", "event_count": 50}
+    raw = RawMacroReader(path)
+    assert [json.loads(e) for e in raw] == events
+
+
+def test_small_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(macro_io, "CHUNK_SIZE", 7)
+    events = sample_events(200)
+    path = write(tmp_path / "sample.json.gz", events)
+
+    assert list(MacroReader(path)) == events
+    assert [json.loads(e) for e in RawMacroReader(path)] == events
+
+
+def test_empty_macro(tmp_path):
+    path = write(tmp_path / "empty.json", [])
+    assert list(MacroReader(path)) == []
+    assert list(RawMacroReader(path)) == []
+
+
+@pytest.mark.parametrize("content", [
+    '{"events": [{"timestamp": 0}',
+    '{"events": [1, 2]}',
+    '{"events": [{"timestamp": 0},]}',
+    '[]',
+])
+def test_malformed_files_raise(tmp_path, content):
+    path = tmp_path / "bad.json"
+    path.write_text(content)
+    with pytest.raises(MacroFormatError):
+        list(MacroReader(path))
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    path = tmp_path / "broken.json"
+    with pytest.raises(RuntimeError):
+        with MacroWriter(path, {"name": "broken"}) as writer:
+            writer.write({"type": "mouse_move", "timestamp": 0.0, "x": 0, "y": 0})
+            raise RuntimeError("boom")
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(ZSTD_AVAILABLE, reason="zstandard installed")
+def test_zstd_without_package_is_a_format_error(tmp_path):
+    with pytest.raises(MacroFormatError):
+        MacroWriter(tmp_path / "sample.json.zst", {"name": "sample"}).open()
+
+
+def test_filenames(tmp_path):
+    assert split_macro_filename("walk.json.gz") == "walk"
+    assert split_macro_filename("walk.txt") is None
+    assert codec_for_filename("walk.json.zst") == "zstd"
+
+    write(tmp_path / "walk.json.xz", [])
+    assert find_macro_file(tmp_path, "walk") == tmp_path / "walk.json.xz"
+    assert find_macro_file(tmp_path, "run") is None
+
+
+@pytest.mark.parametrize("event, message", [
+    ({"type": "mouse_move", "x": 1, "y": 1}, "invalid timestamp"),
+    ({"type": "mouse_move", "timestamp": 0.5, "x": 1}, "without 'y'"),
+    ({"type": "teleport", "timestamp": 0.5}, "unknown type"),
+    ({"type": "mouse_move", "timestamp": 0.1, "x": 1, "y": 1}, "goes backwards"),
+])
+def test_check_events(event, message):
+    events = [{"type": "mouse_move", "timestamp": 0.2, "x": 0, "y": 0}, event]
+    with pytest.raises(MacroFormatError, match=message):
+        list(check_events(events))
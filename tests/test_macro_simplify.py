@@ -0,0 +1,124 @@
+# tests/test_macro_simplify.py
+"""Tests for time-aware RDP simplification of mouse paths"""
+
+import math
+import random
+
+from autoclicker.logic import macro_simplify
+from autoclicker.logic.macro_io import MacroReader, MacroWriter, read_macro_header
+from autoclicker.logic.macro_simplify import simplify_macro_file, simplify_run
+
+
+def move(t, x, y):
+    return {"type": "mouse_move", "timestamp": t, "x": x, "y": y}
+
+
+def sed(event, first, last):
+    """Distance of event from the position interpolated at its timestamp"""
+    dt = last["timestamp"] - first["timestamp"]
+    ratio = (event["timestamp"] - first["timestamp"]) / dt if dt > 0 else 0.0
+    x = first["x"] + (last["x"] - first["x"]) * ratio
+    y = first["y"] + (last["y"] - first["y"]) * ratio
+    return math.hypot(event["x"] - x, event["y"] - y)
+
+
+def assert_within_tolerance(run, kept, tolerance):
+    """Every dropped point lies within tolerance of the kept segment around it"""
+    times = [e["timestamp"] for e in kept]
+    for event in run:
+        if event in kept:
+            continue
+        i = next(i for i, t in enumerate(times) if t > event["timestamp"])
+        assert sed(event, kept[i - 1], kept[i]) <= tolerance + 1e-9
+
+
+def test_short_runs_are_unchanged():
+    run = [move(0.0, 0, 0), move(0.1, 50, 50)]
+    assert simplify_run(run, 2.0) == run
+    assert simplify_run(run[:1], 2.0) == run[:1]
+
+
+def test_constant_speed_line_keeps_only_endpoints():
+    run = [move(i * 0.01, i * 3, i * 2) for i in range(100)]
+    assert simplify_run(run, 1.0) == [run[0], run[-1]]
+
+
+def test_corner_is_kept():
+    run = [move(i * 0.01, i, 0) for i in range(50)] + [move(0.5 + i * 0.01, 49, i) for i in range(1, 50)]
+    kept = simplify_run(run, 1.0)
+    assert kept[0] is run[0] and kept[-1] is run[-1]
+    assert run[49] in kept
+
+
+def test_speed_change_on_a_straight_line_is_kept():
+    # Same geometric line, but the cursor stops halfway: plain RDP would drop everything
+    run = [move(i * 0.01, i, 0) for i in range(50)] + [move(1.0 + i * 0.01, 49 + i, 0) for i in range(50)]
+    kept = simplify_run(run, 1.0)
+    assert len(kept) > 2
+    assert_within_tolerance(run, kept, 1.0)
+
+
+def test_random_paths_stay_within_tolerance():
+    rng = random.Random(7)
+    for _ in range(20):
+        x = y = 500.0
+        run = []
+        for i in range(300):
+            x += rng.uniform(-5, 5)
+            y += rng.uniform(-5, 5)
+            run.append(move(i * rng.uniform(0.005, 0.02) + (run[-1]["timestamp"] if run else 0.0), x, y))
+        tolerance = rng.choice((0.5, 2.0, 8.0))
+        kept = simplify_run(run, tolerance)
+        assert kept[0] is run[0] and kept[-1] is run[-1]
+        assert [e["timestamp"] for e in kept] == sorted(e["timestamp"] for e in kept)
+        assert_within_tolerance(run, kept, tolerance)
+
+
+def write_macro(path, events, **header):
+    with MacroWriter(path, {"name": path.name.split(".")[0], **header}) as writer:
+        writer.write_many(events)
+
+
+def test_file_keeps_other_events_in_order(tmp_path):
+    events = [move(i * 0.01, i, 0) for i in range(100)]
+    events.insert(50, {"type": "mouse_click", "timestamp": 0.495, "button": "left", "action": "down"})
+    events.append({"type": "key_event", "timestamp": 2.0, "key": "a", "action": "down"})
+    write_macro(tmp_path / "source.json", events)
+
+    report = simplify_macro_file(tmp_path / "source.json", tmp_path / "simple.json", "simple", tolerance=1.0)
+    result = list(MacroReader(tmp_path / "simple.json"))
+
+    assert [e["type"] for e in result if e["type"] != "mouse_move"] == ["mouse_click", "key_event"]
+    assert [e["timestamp"] for e in result] == sorted(e["timestamp"] for e in result)
+    assert report["events_before"] == 101 + 1
+    assert report["moves_before"] == 100
+    assert report["events_after"] == len(result)
+    # Each of the two straight runs keeps its endpoints only
+    assert report["moves_after"] == 4
+    assert read_macro_header(tmp_path / "simple.json")["simplified_from"] == "source"
+
+
+def test_runs_longer_than_the_buffer_are_split(tmp_path, monkeypatch):
+    monkeypatch.setattr(macro_simplify, "MAX_RUN_LENGTH", 16)
+    events = [move(i * 0.01, i, (i % 7) * 10) for i in range(200)]
+    write_macro(tmp_path / "source.json", events)
+
+    simplify_macro_file(tmp_path / "source.json", tmp_path / "simple.json", "simple", tolerance=2.0)
+    kept = list(MacroReader(tmp_path / "simple.json"))
+
+    assert kept[0] == events[0] and kept[-1] == events[-1]
+    assert len({e["timestamp"] for e in kept}) == len(kept)
+    assert_within_tolerance(events, kept, 2.0)
+
+
+def test_normalized_macros_use_a_pixel_tolerance(tmp_path):
+    screen = {"width": 1000, "height": 500}
+    for wiggle_px, moves_after in ((0.5, 2), (2.0, 100)):
+        # Zig-zag of wiggle_px pixels on a 1000 px wide screen, stored normalized
+        events = [move(i * 0.01, i / 1000, (wiggle_px / 1000 if i % 2 else 0.0)) for i in range(100)]
+        write_macro(tmp_path / "source.json", events, coordinates="normalized", screen=screen)
+
+        report = simplify_macro_file(tmp_path / "source.json", tmp_path / "simple.json", "simple", tolerance=1.0)
+
+        assert report["moves_after"] == moves_after
+    assert read_macro_header(tmp_path / "simple.json")["tolerance_px"] == 1.0
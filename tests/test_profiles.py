@@ -0,0 +1,141 @@
+# tests/test_profiles.py
+"""Tests for profile validation, import and storage"""
+
+import json
+import random
+
+import pytest
+
+from autoclicker.logic import profiles as profiles_module
+from autoclicker.logic.profiles import Profiles
+
+
+@pytest.fixture
+def profiles(tmp_path, monkeypatch):
+    """Profiles stored in a temporary directory"""
+    monkeypatch.setattr(Profiles, "PROFILES_FILE", tmp_path / "profiles.json")
+    monkeypatch.setattr(Profiles, "LAST_PROFILE_FILE", tmp_path / "last_profile.json")
+    instance = Profiles()
+    yield instance
+    instance.flush()
+
+
+def test_default_profile_is_valid(profiles):
+    assert profiles.profile_errors(profiles.get_default_profile()) == []
+
+
+@pytest.mark.parametrize("field, value, message", [
+    ("delay", "fast", "'fast' is not of type 'number'"),
+    ("delay", True, "True is not of type 'number'"),
+    ("delay", -1, "-1 is less than the minimum of 0"),
+    ("delay", 61, "61 is greater than the maximum of 60"),
+    ("duration", 1.5, "1.5 is not of type 'integer'"),
+    ("click_type", "side", "'side' is not one of ['left', 'right', 'middle', 'double']"),
+    ("random_delay", 1, "1 is not of type 'boolean'"),
+    ("hotkeys", [], "[] is not of type 'object'"),
+])
+def test_field_errors(profiles, field, value, message):
+    assert profiles.profile_errors({field: value}) == [f"{field}: {message}"]
+
+
+def test_every_problem_is_reported(profiles):
+    errors = profiles.profile_errors({"pattern": 5, "repeat": 0, "pattern_size": 5000, "theme": "dark"})
+    assert errors == [
+        "pattern: 5 is not of type 'string'",
+        "pattern: 5 is not one of ['none', 'circle', 'square', 'spiral', 'zigzag', 'star', 'eight', 'random', 'line']",
+        "pattern_size: 5000 is greater than the maximum of 1000",
+        "repeat: 0 is less than the minimum of 1",
+    ]
+
+
+def test_whole_numbers_pass_as_integers(profiles):
+    assert profiles.profile_errors({"duration": 3.0, "repeat": 2, "unknown_field": object()}) == []
+
+
+def test_non_object_is_rejected(profiles):
+    assert profiles.profile_errors(["delay", 1]) == ["(profile): ['delay', 1] is not of type 'object'"]
+
+
+def random_value(rng):
+    return rng.choice([
+        rng.randint(-5, 2000), rng.uniform(-5, 100), float(rng.randint(0, 50)), rng.choice((True, False)),
+        rng.choice(("left", "none", "circle", "x", "")), None, [], {}, "1",
+    ])
+
+
+def test_built_in_checks_match_jsonschema(profiles):
+    """The fast path must report exactly what jsonschema would"""
+    pytest.importorskip("jsonschema")
+    validator = Profiles._schema_validator()
+    rng = random.Random(11)
+    fields = list(Profiles.PROFILE_SCHEMA["properties"])
+    for _ in range(3000):
+        data = {field: random_value(rng) for field in rng.sample(fields, rng.randint(1, 5))}
+        expected = sorted(f"{'/'.join(map(str, e.absolute_path))}: {e.message}" for e in validator.iter_errors(data))
+        assert sorted(profiles.profile_errors(data)) == expected, data
+
+
+def test_unsupported_schema_falls_back_to_jsonschema(monkeypatch):
+    pytest.importorskip("jsonschema")
+
+    class PatternProfiles(Profiles):
+        PROFILE_SCHEMA = {"type": "object", "properties": {"theme": {"type": "string", "pattern": "^[a-z]+$"}}}
+
+    checker = PatternProfiles.__new__(PatternProfiles)
+    assert PatternProfiles._schema_checks() is None
+    assert checker.profile_errors({"theme": "Dark1"}) == ["theme: 'Dark1' does not match '^[a-z]+$'"]
+    assert Profiles._schema_checks() is not None
+
+
+def test_import_reports_all_errors_and_rejects(profiles, tmp_path, capsys):
+    source = tmp_path / "import.json"
+    source.write_text(json.dumps({
+        "Good": {"delay": 0.5},
+        "../evil": {},
+        "Bad": {"delay": -1, "repeat": 500},
+    }))
+
+    assert profiles.import_profiles(str(source)) is False
+    output = capsys.readouterr().out
+    assert "Invalid profile name in import: '../evil'" in output
+    assert "'Bad': delay: -1 is less than the minimum of 0" in output
+    assert "'Bad': repeat: 500 is greater than the maximum of 100" in output
+    assert "Good" not in profiles.get_all_profiles()
+
+
+def test_import_and_storage(profiles, tmp_path):
+    source = tmp_path / "import.json"
+    source.write_text(json.dumps({"Fast": {"delay": 0.001, "click_type": "right"}}))
+
+    assert profiles.import_profiles(str(source)) is True
+    assert profiles.create_profile("Slow", {"delay": 2.0}) is True
+    profiles.save_last_profile("Slow")
+    profiles.flush()
+
+    stored = json.loads(Profiles.PROFILES_FILE.read_text())
+    assert stored["Fast"] == {"delay": 0.001, "click_type": "right"}
+    assert stored["Slow"]["delay"] == 2.0 and stored["Slow"]["repeat"] == 1
+    assert Profiles().load_last_profile() == "Slow"
+
+
+def test_invalid_stored_profile_loads_defaults(profiles):
+    profiles.profiles["Broken"] = {"delay": "soon"}
+    assert profiles.load_profile("Broken") == profiles.get_default_profile()
+    assert profiles.load_profile("../Broken") is None
+
+
+def test_default_profile_cannot_be_deleted(profiles):
+    profiles.create_profile("Temp", {})
+    assert profiles.delete_profile("Default") is False
+    assert profiles.delete_profile("Temp") is True
+    assert profiles.get_profile("Temp") is None
+
+
+def test_without_jsonschema_only_the_shape_is_checked(monkeypatch):
+    class PatternProfiles(Profiles):
+        PROFILE_SCHEMA = {"type": "object", "properties": {"theme": {"type": "string", "pattern": "^[a-z]+$"}}}
+
+    monkeypatch.setattr(profiles_module, "JSONSCHEMA_AVAILABLE", False)
+    checker = PatternProfiles.__new__(PatternProfiles)
+    assert checker.profile_errors({"theme": "Dark1"}) == []
+    assert checker.profile_errors("theme") == ["(profile): 'theme' is not of type 'object'"]
@@ -0,0 +1,161 @@
+# tests/test_session_history.py
+"""Tests for the SQLite session history: batched writes, keyset pagination, totals"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from autoclicker.logic import session_history
+from autoclicker.logic.interval_histogram import IntervalHistogram
+from autoclicker.logic.session_history import SESSION_COLUMNS, SessionHistory, config_hash, session_record
+
+DAY = datetime(2026, 3, 1, 12, 0).timestamp()
+
+
+def make_session(profile="default", started=DAY, seconds=10.0, clicks=100, intervals=None):
+    histogram = IntervalHistogram()
+    histogram.record_many(intervals if intervals is not None else [seconds / clicks] * clicks)
+    return session_record(
+        profile=profile,
+        started=started,
+        ended=started + seconds,
+        clicks=clicks,
+        peak_rate=clicks / seconds,
+        intervals=histogram.summary(),
+        config={"delay": seconds / clicks, "click_type": "left"},
+        histogram=histogram.to_bytes(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def short_linger(monkeypatch):
+    """The writer waits this long for more sessions before each transaction"""
+    monkeypatch.setattr(session_history, "WRITE_LINGER", 0.01)
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = SessionHistory(tmp_path / "history.db")
+    yield history
+    history.close()
+
+
+def store(history, sessions):
+    for session in sessions:
+        history.record(session)
+    history.close()  # Flushes the writer; reads reopen the database
+
+
+def test_missing_database_reads_empty(tmp_path):
+    history = SessionHistory(tmp_path / "none.db")
+    assert history.page() == ([], None)
+    assert history.count() == 0
+    assert not (tmp_path / "none.db").exists()
+
+
+def test_record_and_read_back(history):
+    store(history, [make_session(clicks=50, seconds=5.0)])
+    rows, cursor = history.page()
+
+    assert cursor is None
+    assert len(rows) == 1
+    row = rows[0]
+    assert {column: row[column] for column in ("profile", "clicks", "day")} == {"profile": "default", "clicks": 50, "day": "2026-03-01"}
+    assert row["rate"] == pytest.approx(10.0)
+    assert row["p50"] == pytest.approx(0.1, rel=0.01)
+    assert set(SESSION_COLUMNS) <= set(row)
+
+
+def test_keyset_pages_cover_every_session_once(history):
+    # Ties on `started` must be broken by id, not skipped or repeated
+    sessions = [make_session(profile=("a", "b")[i % 2], started=DAY + i // 3) for i in range(130)]
+    store(history, sessions)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        rows, cursor = history.page(after=cursor, limit=20)
+        assert len(rows) <= 20
+        seen.extend(rows)
+        pages += 1
+        if cursor is None:
+            break
+
+    assert pages == 7
+    assert len(seen) == 130
+    assert len({row["id"] for row in seen}) == 130
+    keys = [(row["started"], row["id"]) for row in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_pages_filtered_by_profile(history):
+    store(history, [make_session(profile=("a", "b", "b")[i % 3], started=DAY + i) for i in range(30)])
+
+    rows, cursor = history.page(profile="b", limit=15)
+    rest, end = history.page(after=cursor, profile="b", limit=15)
+
+    assert {row["profile"] for row in rows + rest} == {"b"}
+    assert len(rows) == 15 and len(rest) == 5 and end is None
+    assert history.count("b") == 20
+    assert history.count() == 30
+
+
+def test_exact_page_size_has_no_next_cursor(history):
+    store(history, [make_session(started=DAY + i) for i in range(10)])
+    rows, cursor = history.page(limit=10)
+    assert len(rows) == 10 and cursor is None
+
+
+def test_profile_totals_accumulate_across_batches(tmp_path):
+    path = tmp_path / "history.db"
+    store(SessionHistory(path), [make_session(profile="a", clicks=100, seconds=10.0), make_session(profile="b", clicks=10)])
+    # A later writer (e.g. next program start) adds to the stored totals
+    history = SessionHistory(path)
+    store(history, [make_session(profile="a", started=DAY + 60, clicks=300, seconds=10.0, intervals=[0.5] * 300)])
+
+    totals = history.profile_totals("a")
+    assert totals["sessions"] == 2
+    assert totals["clicks"] == 400
+    assert totals["seconds"] == pytest.approx(20.0)
+    assert totals["first_started"] == DAY
+    assert totals["last_ended"] == DAY + 70
+    assert totals["intervals"]["count"] == 400
+    assert totals["intervals"]["percentiles"][99.0] == pytest.approx(0.5, rel=0.01)
+    assert history.profile_totals("missing") is None
+
+    by_profile = {row["label"]: row for row in history.per_profile()}
+    assert by_profile["a"]["rate"] == pytest.approx(20.0)
+    assert by_profile["b"]["sessions"] == 1
+
+
+def test_per_day(history):
+    store(history, [make_session(started=DAY + day * 86400 + i) for day in range(3) for i in range(day + 1)])
+    days = history.per_day(days=2)
+    assert [(row["label"], row["sessions"]) for row in days] == [("2026-03-03", 3), ("2026-03-02", 2)]
+
+
+def test_schema_1_database_gets_totals(tmp_path):
+    path = tmp_path / "old.db"
+    connection = sqlite3.connect(path)
+    columns = ", ".join(f"{column} {'TEXT' if column in ('profile', 'day', 'config_hash', 'config') else 'REAL'}" for column in SESSION_COLUMNS)
+    connection.execute(f"CREATE TABLE sessions (id INTEGER PRIMARY KEY, {columns})")
+    session = make_session(profile="old", clicks=40, seconds=4.0)
+    connection.execute(
+        f"INSERT INTO sessions ({', '.join(SESSION_COLUMNS)}) VALUES ({', '.join('?' * len(SESSION_COLUMNS))})",
+        tuple(session[column] for column in SESSION_COLUMNS),
+    )
+    connection.execute("PRAGMA user_version=1")
+    connection.commit()
+    connection.close()
+
+    history = SessionHistory(path)
+    totals = history.profile_totals("old")
+    history.close()
+
+    assert totals["sessions"] == 1 and totals["clicks"] == 40
+    assert totals["intervals"]["count"] == 0  # No histograms before schema 2
+
+
+def test_config_hash_ignores_key_order():
+    assert config_hash({"a": 1, "b": [1, 2]}) == config_hash({"b": [1, 2], "a": 1})
+    assert config_hash({"a": 1}) != config_hash({"a": 2})